@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_archive import CADArchive
+from cad_export import export_formats
+from cad_store import ItemStore
+from scenes import synthetic_items
+from test_teknikal import TextToCADConverter
+
+
+# File terpisah per format vs satu arsip zip di beberapa kompresi/level. Kolom peak =
+# puncak alokasi Python (tracemalloc, putaran terpisah) di luar adegan itu sendiri: jika
+# arsip menampung file utuh, puncaknya akan jauh di atas file terpisah.
+
+FORMATS = ("dxf", "svg", "obj")
+
+
+def write_files(converter, directory):
+    results = export_formats(converter, os.path.join(directory, "out"), FORMATS, mode="serial")
+    return [r.path for r in results.values() if r.ok]
+
+
+def write_archive(converter, directory, compression, level):
+    path = os.path.join(directory, "out.zip")
+    with CADArchive(path, compression, level) as archive:
+        archive.add(converter, "out", FORMATS)
+    return [path]
+
+
+def measure(run, converter, peak: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        converter._geometry = None
+        start = time.perf_counter()
+        paths = run(converter, tmp)
+        seconds = time.perf_counter() - start
+        size = sum(os.path.getsize(p) for p in paths)
+    peak_mb = None
+    if peak:
+        with tempfile.TemporaryDirectory() as tmp:
+            converter._geometry = None
+            tracemalloc.start()
+            run(converter, tmp)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+    return seconds, size / 1e6, len(paths), peak_mb
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="output per file vs satu arsip zip terkompresi")
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--modes", default="stored:0,deflate:1,deflate:6,deflate:9,bzip2:9,lzma:0",
+                        help="daftar kompresi:level")
+    parser.add_argument("--no-peak", action="store_true", help="lewati putaran tracemalloc")
+    args = parser.parse_args(argv)
+
+    runs = [("file", write_files)]
+    for mode in args.modes.split(","):
+        compression, level = mode.split(":")
+        runs.append((mode, lambda c, d, compression=compression, level=int(level):
+                     write_archive(c, d, compression, level)))
+
+    print(f"{'item':>8}{'output':>12}{'file':>6}{'detik':>8}{'MB':>8}{'rasio':>7}{'peak MB':>9}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        converter = TextToCADConverter()
+        converter.items = ItemStore(synthetic_items(n))
+        base = None
+        for label, run in runs:
+            seconds, mb, files, peak_mb = measure(run, converter, not args.no_peak)
+            base = base or mb
+            peak = f"{peak_mb:>9.1f}" if peak_mb is not None else f"{'-':>9}"
+            print(f"{n:>8}{label:>12}{files:>6}{seconds:>8.2f}{mb:>8.2f}{mb / base:>7.2f}{peak}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
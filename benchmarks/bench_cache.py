@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_cache import RenderCache, convert_cached
+from cad_export import export_bytes
+from test_teknikal import TextToCADConverter
+
+
+BASE = [
+    "Kursi dengan 4 kaki, dudukan persegi {a}x{a} cm, tinggi {h} cm",
+    "Ruangan ukuran {m}x{n} meter, dengan 1 pintu di sisi barat dan 2 jendela di sisi utara",
+    "Kotak {a}x{b}",
+    "Lingkaran diameter {a}",
+]
+
+
+def workload(n: int, distinct: int, seed: int = 1):
+    # n deskripsi dari `distinct` bentuk dasar; tiap kemunculan diberi variasi huruf besar/kecil,
+    # spasi di tepi dan × vs x, seperti lalu lintas nyata
+    rng = random.Random(seed)
+    shapes = []
+    for i in range(distinct):
+        template = BASE[i % len(BASE)]
+        shapes.append(template.format(a=30 + i % 70, b=20 + i % 50, h=40 + i % 20, m=3 + i % 5, n=4 + i % 7))
+    out = []
+    for _ in range(n):
+        text = rng.choice(shapes)
+        variant = rng.randrange(4)
+        if variant == 1:
+            text = text.upper()
+        elif variant == 2:
+            text = text.replace("x", "×")
+        elif variant == 3:
+            text = f"  {text.capitalize()} "
+        out.append(text)
+    return out
+
+
+def run_plain(descriptions, fmt):
+    for text in descriptions:
+        converter = TextToCADConverter()
+        converter.parse(text)
+        export_bytes(converter, fmt)
+
+
+def run_cached(cache, descriptions, fmt):
+    for text in descriptions:
+        convert_cached(cache, text, fmt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="konversi berulang tanpa cache vs cache memori/disk")
+    parser.add_argument("-n", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=100)
+    parser.add_argument("--format", default="dxf")
+    args = parser.parse_args(argv)
+
+    descriptions = workload(args.n, args.distinct)
+    print(f"{args.n} deskripsi, {args.distinct} bentuk berbeda, format {args.format}")
+    print(f"{'mode':<22}{'s':>8}{'ms/req':>9}  hit tingkat 1 / 2")
+
+    start = time.perf_counter()
+    run_plain(descriptions, args.format)
+    plain = time.perf_counter() - start
+    print(f"{'tanpa cache':<22}{plain:>8.2f}{plain / args.n * 1000:>9.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = (
+            ("memori", lambda: RenderCache()),
+            ("memori + disk (dingin)", lambda: RenderCache(tmp)),
+            ("disk saja (hangat)", lambda: RenderCache(tmp, memory_bytes=0)),
+        )
+        for label, make in cases:
+            cache = make()
+            start = time.perf_counter()
+            run_cached(cache, descriptions, args.format)
+            seconds = time.perf_counter() - start
+            st = cache.stats
+            items_hits = st["items_memory_hits"] + st["items_disk_hits"]
+            artifact_hits = st["artifact_memory_hits"] + st["artifact_disk_hits"]
+            print(f"{label:<22}{seconds:>8.2f}{seconds / args.n * 1000:>9.2f}  "
+                  f"{items_hits / args.n:6.1%} / {artifact_hits / args.n:6.1%}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+import random
+import string
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_shapes import match_shapes, register_shape, shapes
+from test_teknikal import normalize_description
+
+
+DESCRIPTIONS = [
+    "Kursi dengan 4 kaki, dudukan persegi 40x40 cm, tinggi 45 cm",
+    "Ruangan ukuran 4x5 meter, dengan 1 pintu di sisi barat dan 2 jendela di sisi utara",
+    "Meja 120x80 tinggi 75 dengan 4 kaki",
+    "Kotak 100x50",
+]
+
+# Kata kunci harus utuh: awalan kata lain tidak boleh memilih bentuk ("desk" di
+# "deskripsi", "rak" di "raksasa"/"rakit"). Diperiksa sebelum pengukuran.
+DISPATCH_CASES = [
+    ("deskripsi: kotak 100x50", ["box"]),
+    ("kotak raksasa 100x50", ["box"]),
+    ("lingkaran 30 untuk rakit", ["circle"]),
+]
+
+
+def check_dispatch():
+    failed = 0
+    for text, expected in DISPATCH_CASES:
+        got = [shape.name for shape in match_shapes(normalize_description(text))]
+        if got != expected:
+            print(f"DISPATCH SALAH: {text!r} -> {got}, seharusnya {expected}", file=sys.stderr)
+            failed += 1
+    return failed
+
+
+def synthetic_keywords(n: int, seed: int = 1):
+    # kata acak 5-9 huruf, dua per bentuk (Indonesia + Inggris)
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < 2 * n:
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 9))))
+    words = sorted(words)
+    return [tuple(words[2 * i:2 * i + 2]) for i in range(n)]
+
+
+def naive_match(keywords, text: str):
+    # rantai if/elif lama: satu pemindaian `kw in text` per kata kunci
+    return [name for name, kws in keywords if any(kw in text for kw in kws)]
+
+
+def bench(fn, texts, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="biaya dispatch bentuk vs jumlah bentuk terdaftar")
+    parser.add_argument("--counts", default="0,10,100,1000")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+    if check_dispatch():
+        return 1
+
+    texts = [normalize_description(d) for d in DESCRIPTIONS]
+    registered = 0
+    extra = synthetic_keywords(max(int(c) for c in args.counts.split(",")))
+    print(f"{'bentuk':>8}{'kata kunci':>12}{'regex trie us':>16}{'naif us':>10}")
+    for count in (int(c) for c in args.counts.split(",")):
+        while registered < count:
+            register_shape(f"bentuk{registered}", extra[registered], lambda converter, tokens: None, priority=100)
+            registered += 1
+        keywords = [(s.name, s.keywords) for s in shapes()]
+        match_shapes(texts[0])   # kompilasi regex di luar pengukuran
+        trie = bench(match_shapes, texts, args.repeat)
+        naive = bench(lambda t: naive_match(keywords, t), texts, max(args.repeat // 10, 1))
+        print(f"{len(keywords):>8}{sum(len(k) for _, k in keywords):>12}{trie * 1e6:>16.2f}{naive * 1e6:>10.2f}",
+              flush=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scenes import synthetic_columns
+from test_teknikal import TextToCADConverter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="render_dxf vs render_dxf_blocks vs render_dxf_stream")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    args = parser.parse_args(argv)
+
+    modes = (("entitas", "render_dxf"), ("block", "render_dxf_blocks"), ("stream R12", "render_dxf_stream"))
+    print(f"{'items':>8}" + "".join(f"{label + ' s':>16}{'KB':>10}" for label, _ in modes))
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(s) for s in args.sizes.split(",")):
+            converter = TextToCADConverter()
+            converter.items = synthetic_columns(n)
+            converter.geometry()
+            row = f"{n:>8}"
+            for label, method in modes:
+                path = os.path.join(tmp, f"{method}.dxf")
+                start = time.perf_counter()
+                getattr(converter, method)(path)
+                row += f"{time.perf_counter() - start:>16.2f}{os.path.getsize(path) / 1024:>10.0f}"
+                os.remove(path)
+            print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
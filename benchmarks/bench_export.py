@@ -0,0 +1,35 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_export import export_formats
+from cad_store import ItemStore
+from scenes import synthetic_items
+from test_teknikal import TextToCADConverter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan ekspor DXF/SVG/OBJ berurutan vs bersamaan")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--modes", default="serial,thread,process,auto")
+    args = parser.parse_args(argv)
+
+    converter = TextToCADConverter()
+    converter.items = ItemStore(synthetic_items(args.items))
+    converter.geometry()
+    print(f"{args.items} item, {os.cpu_count()} CPU")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes.split(","):
+            start = time.perf_counter()
+            results = export_formats(converter, os.path.join(tmp, mode), mode=mode)
+            total = time.perf_counter() - start
+            per_format = "  ".join(f"{fmt} {r.seconds:.2f}s" + ("" if r.ok else " GAGAL") for fmt, r in results.items())
+            print(f"{mode:<8} total {total:6.2f}s   {per_format}")
+
+
+if __name__ == "__main__":
+    main()
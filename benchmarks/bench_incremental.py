@@ -0,0 +1,52 @@
+import io
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_incremental import EditSession
+from test_teknikal import TextToCADConverter
+
+
+SCENE = "ruangan 300x300 m dengan {chairs} kursi dan 10 meja{extra}"
+EDIT = ", 1 jendela di sisi utara"   # satu item baru + ruangan induknya
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="render ulang penuh vs inkremental setelah satu edit kecil")
+    parser.add_argument("--chairs", default="100,1000,5000,20000")
+    args = parser.parse_args(argv)
+
+    print(f"{'item':>8}{'render penuh s':>16}{'tambal ms':>11}{'tulis s':>9}{'inkremental s':>15}{'diff':>12}")
+    for chairs in (int(c) for c in args.chairs.split(",")):
+        before, after = SCENE.format(chairs=chairs, extra=""), SCENE.format(chairs=chairs, extra=EDIT)
+
+        session = EditSession()
+        session.update(before)
+        session.render_dxf(io.StringIO())
+        session.render_svg(io.StringIO())
+
+        def full():
+            converter = TextToCADConverter()
+            converter.parse(after)
+            converter.render_dxf(io.StringIO())
+            converter.render_svg(io.StringIO())
+
+        full_s = timed(full)
+        patch_s = timed(lambda: session.update(after))
+        write_s = timed(lambda: (session.render_dxf(io.StringIO()), session.render_svg(io.StringIO())))
+        diff = session.diff
+        print(f"{len(session.items):>8}{full_s:>16.2f}{patch_s * 1000:>11.1f}{write_s:>9.2f}{patch_s + write_s:>15.2f}"
+              f"{f'+{len(diff.added)} -{len(diff.removed)} ~{len(diff.changed)}':>12}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_layout import GAP, SpatialHash, place
+from test_teknikal import TextToCADConverter
+
+
+class PairwiseIndex:
+    # pembanding: setiap query memeriksa semua kotak yang sudah ditempatkan (O(n^2) total)
+
+    def __init__(self):
+        self.boxes = []
+
+    def insert(self, box):
+        self.boxes.append(box)
+        return len(self.boxes) - 1
+
+    def query(self, box):
+        x0, y0, x1, y1 = box
+        for i, b in enumerate(self.boxes):
+            if b[0] < x1 and x0 < b[2] and b[1] < y1 and y0 < b[3]:
+                yield i
+
+
+def layout(index, count: int, size=(40.0, 40.0)):
+    # ruangan persegi yang cukup untuk `count` benda, dengan rintangan di tengahnya
+    side = ((count * 1.3) ** 0.5 + 1) * (size[0] + GAP)
+    index.insert((side * 0.4, side * 0.4, side * 0.6, side * 0.6))
+    start = time.perf_counter()
+    positions, _ = place(index, (0.0, 0.0, side, side), size, count)
+    return time.perf_counter() - start, len(positions)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="penempatan benda: spatial hash vs cek semua pasangan")
+    parser.add_argument("--counts", default="100,1000,5000,20000")
+    parser.add_argument("--pairwise-max", type=int, default=5000, help="lewati pembanding O(n^2) di atas jumlah ini")
+    args = parser.parse_args(argv)
+
+    print(f"{'benda':>8}{'hash ms':>10}{'us/benda':>10}{'pasangan ms':>13}{'parse adegan ms':>17}")
+    for count in (int(c) for c in args.counts.split(",")):
+        hashed, placed = layout(SpatialHash(40.0 + GAP), count)
+        pairwise = layout(PairwiseIndex(), count)[0] if count <= args.pairwise_max else None
+        converter = TextToCADConverter()
+        start = time.perf_counter()
+        converter.parse(f"ruangan 300x300 m dengan {count} kursi dan {max(count // 20, 1)} meja, 1 pintu di sisi barat")
+        scene = time.perf_counter() - start
+        assert placed == count
+        pair = f"{pairwise * 1000:.1f}" if pairwise is not None else "-"
+        print(f"{count:>8}{hashed * 1000:>10.1f}{hashed / count * 1e6:>10.2f}{pair:>13}{scene * 1000:>17.1f}",
+              flush=True)
+
+
+if __name__ == "__main__":
+    main()
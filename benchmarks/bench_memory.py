@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _peak_rss_mb():
+    # ru_maxrss dalam KB di Linux, byte di macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_one(mode: str, n: int, render: str):
+    from cad_store import ItemStore
+    from scenes import synthetic_columns, synthetic_items
+    from test_teknikal import TextToCADConverter
+
+    base_rss = _peak_rss_mb()
+    start = time.perf_counter()
+    items = ItemStore(synthetic_items(n)) if mode == "store" else synthetic_columns(n)
+    build = time.perf_counter() - start
+    result = {"mode": mode, "items": n, "build_s": build, "rss_mb": _peak_rss_mb() - base_rss}
+
+    start = time.perf_counter()
+    items.bounds()
+    result["bounds_s"] = time.perf_counter() - start
+
+    if render:
+        converter = TextToCADConverter()
+        converter.items = items
+        writers = {"dxf": "render_dxf", "svg": "render_svg", "obj": "export_obj_extrude"}
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            getattr(converter, writers[render])(os.path.join(tmp, f"bench.{render}"))
+            result[f"{render}_s"] = time.perf_counter() - start
+        result["peak_rss_mb"] = _peak_rss_mb() - base_rss
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan memori ItemStore (CADItem) vs ItemColumns (NumPy)")
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--render", choices=("", "dxf", "svg", "obj"), default="",
+                        help="ikut ukur waktu render satu format")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_one(args.child[0], int(args.child[1]), args.render)))
+        return
+
+    # setiap pengukuran di proses baru supaya peak RSS tidak saling memengaruhi
+    for n in (int(s) for s in args.sizes.split(",")):
+        for mode in ("store", "columns"):
+            out = subprocess.run([sys.executable, __file__, "--child", mode, str(n), "--render", args.render],
+                                 check=True, capture_output=True, text=True).stdout
+            r = json.loads(out)
+            line = (f"{mode:<8}{n:>9} item  build {r['build_s']:7.2f}s  rss +{r['rss_mb']:8.1f} MB"
+                    f"  bounds {r['bounds_s'] * 1e3:8.1f} ms")
+            if args.render:
+                line += f"  {args.render} {r[args.render + '_s']:7.2f}s  peak +{r['peak_rss_mb']:8.1f} MB"
+            print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
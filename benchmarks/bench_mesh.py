@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trimesh
+
+from cad_geometry import Box, build_geometry
+from cad_mesh import build_mesh, solid_arrays, write_obj
+from scenes import synthetic_columns
+
+
+def legacy_mesh(geo):
+    # cara lama: satu objek trimesh per primitif lalu util.concatenate
+    meshes = []
+    for prim in geo.solids:
+        if type(prim) is Box:
+            mesh = trimesh.creation.box(extents=(prim.w, prim.d, prim.h))
+            mesh.apply_translation((prim.x + prim.w / 2, prim.y + prim.d / 2, prim.z + prim.h / 2))
+        else:
+            mesh = trimesh.creation.cylinder(radius=prim.r, height=prim.h, sections=32)
+            mesh.apply_translation((prim.cx, prim.cy, prim.z + prim.h / 2))
+        meshes.append(mesh)
+    return trimesh.util.concatenate(meshes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="mesh per primitif (trimesh) vs mesh templat tervektorisasi")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--legacy-max", type=int, default=10000,
+                        help="lewati cara lama di atas jumlah item ini (terlalu lambat)")
+    args = parser.parse_args(argv)
+
+    print(f"{'items':>8}{'solid':>8}{'lama s':>10}{'solid s':>10}{'mesh s':>10}{'tulis s':>10}{'faces':>10}{'KB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mesh.obj")
+        for n in (int(s) for s in args.sizes.split(",")):
+            items = synthetic_columns(n)
+            legacy = "-"
+            if n <= args.legacy_max:
+                geo = build_geometry(items)
+                start = time.perf_counter()
+                legacy_mesh(geo)
+                legacy = f"{time.perf_counter() - start:.2f}"
+
+            start = time.perf_counter()
+            boxes, cylinders = solid_arrays(items)
+            t_solids = time.perf_counter()
+            vertices, faces = build_mesh(boxes, cylinders)
+            t_mesh = time.perf_counter()
+            write_obj(vertices, faces, path)
+            t_write = time.perf_counter()
+            print(f"{n:>8}{len(boxes) + len(cylinders):>8}{legacy:>10}{t_solids - start:>10.2f}"
+                  f"{t_mesh - t_solids:>10.2f}{t_write - t_mesh:>10.2f}{len(faces):>10}"
+                  f"{os.path.getsize(path) / 1024:>10.0f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
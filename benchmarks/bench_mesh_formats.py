@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_mesh import build_mesh, solid_arrays, weld, write_glb, write_glb_instances, write_obj, write_stl
+from scenes import synthetic_columns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ukuran dan waktu tulis OBJ teks vs STL/GLB biner")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    args = parser.parse_args(argv)
+
+    print(f"{'items':>8}{'format':>16}{'s':>8}{'KB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(s) for s in args.sizes.split(",")):
+            boxes, cylinders = solid_arrays(synthetic_columns(n))
+            raw = build_mesh(boxes, cylinders)
+
+            start = time.perf_counter()
+            welded = weld(*raw)
+            t_weld = time.perf_counter() - start
+            start = time.perf_counter()
+            welded32 = weld(*raw, quantize=True)
+            t_weld32 = time.perf_counter() - start
+            print(f"{n:>8}{'weld':>16}{t_weld:>8.2f}{'':>10}  vertices {len(raw[0])} -> {len(welded[0])}")
+            print(f"{n:>8}{'weld float32':>16}{t_weld32:>8.2f}")
+
+            cases = (
+                ("obj", "obj", lambda path: write_obj(*welded, path)),
+                ("stl", "stl", lambda path: write_stl(*welded32, path)),
+                ("glb", "glb", lambda path: write_glb(*welded32, path)),
+                ("glb instances", "glb", lambda path: write_glb_instances(boxes, cylinders, path)),
+            )
+            for label, ext, write in cases:
+                path = os.path.join(tmp, f"mesh.{ext}")
+                start = time.perf_counter()
+                write(path)
+                seconds = time.perf_counter() - start
+                print(f"{n:>8}{label:>16}{seconds:>8.2f}{os.path.getsize(path) / 1024:>10.0f}", flush=True)
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
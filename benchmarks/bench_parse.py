@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_teknikal import TextToCADConverter
+
+
+SHORT = {
+    "chair": "Kursi dengan 4 kaki, dudukan persegi 40x40 cm, tinggi 45 cm",
+    "room": "Ruangan ukuran 4x5 meter, dengan 1 pintu di sisi barat dan 1 jendela di sisi utara",
+    "shape": "Kotak 100x50",
+}
+
+
+def long_description(kind: str, size: int):
+    # deskripsi panjang: kalimat utama diikuti teks pengisi sampai ~size byte
+    filler = " dengan catatan tambahan untuk pengrajin, warna coklat tua, bahan kayu jati"
+    if kind == "room":
+        filler = " dan 1 jendela di sisi timur, 1 pintu di sisi selatan"
+    text = SHORT[kind]
+    while len(text) < size:
+        text += filler
+    return text
+
+
+def repeated_description(kind: str, size: int):
+    # kata kunci berulang tanpa pola yang dicari (mis. "dudukan" tanpa AxB): kasus terburuk
+    # untuk pola `kata.*?angka` yang memindai ulang sisa teks di setiap kemunculan
+    head, unit = {
+        "chair": ("kursi ", "dudukan 40 cm "),
+        "room": ("ruangan ", "1 pintu di sisi barat "),
+        "shape": ("kotak ", "40 cm "),
+    }[kind]
+    return head + unit * (size // len(unit))
+
+
+def bench(description: str, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        TextToCADConverter().parse(description)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark throughput TextToCADConverter.parse")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--long-size", type=int, default=8192, help="ukuran deskripsi panjang (byte)")
+    args = parser.parse_args(argv)
+
+    print(f"{'deskripsi':<18}{'bytes':>8}{'parse/s':>12}{'MB/s':>10}")
+    for kind in SHORT:
+        cases = (
+            ("pendek", SHORT[kind], args.repeat),
+            ("panjang", long_description(kind, args.long_size), max(args.repeat // 20, 1)),
+            ("berulang", repeated_description(kind, args.long_size), max(args.repeat // 100, 1)),
+        )
+        for label, text, repeat in cases:
+            elapsed = bench(text, repeat)
+            rate = repeat / elapsed
+            print(f"{kind + '/' + label:<18}{len(text):>8}{rate:>12.0f}{rate * len(text) / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
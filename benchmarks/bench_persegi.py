@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from test_teknikal_persegi_panjang import Rectangle, batch, rectangle_points
+
+
+def legacy(rect, directory: str):
+    # alur skrip lama per persegi: dokumen ezdxf baru + figure pyplot baru
+    import ezdxf
+    import matplotlib.pyplot as plt
+
+    doc = ezdxf.new(dxfversion="R2010")
+    points = rectangle_points(rect.length, rect.width)
+    doc.modelspace().add_lwpolyline(points, close=True)
+    base = os.path.join(directory, rect.name)
+    doc.saveas(base + ".dxf")
+    x_coords = [p[0] for p in points]
+    y_coords = [p[1] for p in points]
+    plt.figure(figsize=(6, 6))
+    plt.plot(x_coords, y_coords, 'b-', linewidth=2)
+    plt.fill(x_coords, y_coords, alpha=0.2, color='skyblue')
+    plt.title(f"Preview Persegi Panjang ({rect.length} x {rect.width})")
+    plt.axis('equal')
+    plt.grid(True)
+    plt.savefig(base + ".png", dpi=150)
+    plt.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="throughput persegi panjang: skrip lama vs batch")
+    parser.add_argument("-n", type=int, default=64, help="jumlah persegi")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    rects = [Rectangle(rng.randint(50, 1000), rng.randint(50, 1000), f"p{i:04d}") for i in range(args.n)]
+    runs = [
+        ("skrip lama (figure baru)", lambda d: [legacy(r, d) for r in rects]),
+        ("batch DXF + PNG", lambda d: batch(rects, d)),
+        (f"batch DXF + PNG -j {args.jobs}", lambda d: batch(rects, d, jobs=args.jobs, chunk_size=8)),
+        ("batch DXF saja", lambda d: batch(rects, d, preview=False)),
+        ("batch satu DXF", lambda d: batch(rects, d, single_dxf="semua.dxf", preview=False)),
+    ]
+    print(f"{'mode':<28}{'total s':>9}{'ms/persegi':>12}{'persegi/s':>11}{'vs lama':>9}")
+    base = None
+    for name, run in runs:
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            run(tmp)
+            seconds = time.perf_counter() - start
+        base = base or seconds
+        print(f"{name:<28}{seconds:>9.2f}{seconds / args.n * 1000:>12.1f}{args.n / seconds:>11.1f}"
+              f"{base / seconds:>8.1f}x", flush=True)
+
+
+if __name__ == "__main__":
+    main()
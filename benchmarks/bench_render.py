@@ -0,0 +1,37 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_store import ItemStore
+from scenes import synthetic_items
+from test_teknikal import TextToCADConverter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark render_dxf / render_svg / export_obj_extrude per ukuran adegan")
+    parser.add_argument("--sizes", default="10,1000,100000")
+    parser.add_argument("--formats", default="dxf,svg,obj")
+    args = parser.parse_args(argv)
+
+    writers = {"dxf": "render_dxf", "svg": "render_svg", "obj": "export_obj_extrude"}
+    formats = [f for f in args.formats.split(",") if f]
+    print(f"{'items':>8}" + "".join(f"{fmt + ' s':>12}{'us/item':>10}" for fmt in formats))
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(s) for s in args.sizes.split(",")):
+            converter = TextToCADConverter()
+            converter.items = ItemStore(synthetic_items(n))
+            row = f"{n:>8}"
+            for fmt in formats:
+                start = time.perf_counter()
+                getattr(converter, writers[fmt])(os.path.join(tmp, f"bench.{fmt}"))
+                elapsed = time.perf_counter() - start
+                row += f"{elapsed:>12.3f}{elapsed / n * 1e6:>10.1f}"
+            print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+import pickle
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_scenefile import load_scene, save_scene
+from cad_store import ItemStore
+from scenes import synthetic_columns, synthetic_items
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="berkas adegan memmap vs pickle ItemStore")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--pickle-max", type=int, default=100000, help="lewati pickle di atas jumlah item ini")
+    args = parser.parse_args(argv)
+
+    print(f"{'item':>9}{'simpan s':>10}{'MB':>8}{'buka ms':>9}{'bounds ms':>11}{'ke item s':>11}"
+          f"{'pickle MB':>11}{'unpickle s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scene.cadscene")
+        for n in (int(s) for s in args.sizes.split(",")):
+            cols = synthetic_columns(n)
+            _, save_s = timed(lambda: save_scene(cols, path))
+            size_mb = os.path.getsize(path) / 1e6
+            loaded, open_s = timed(lambda: load_scene(path))
+            _, bounds_s = timed(loaded.bounds)
+            items, to_items_s = timed(loaded.to_items) if n <= args.pickle_max else (None, None)
+            pickled = unpickle_s = None
+            if n <= args.pickle_max:
+                blob = pickle.dumps(ItemStore(synthetic_items(n)), protocol=pickle.HIGHEST_PROTOCOL)
+                pickled = len(blob) / 1e6
+                _, unpickle_s = timed(lambda: pickle.loads(blob))
+            del loaded, items
+
+            def fmt(value, width, digits=2):
+                return f"{value:>{width}.{digits}f}" if value is not None else f"{'-':>{width}}"
+
+            print(f"{n:>9}{save_s:>10.3f}{size_mb:>8.1f}{open_s * 1000:>9.2f}{bounds_s * 1000:>11.1f}"
+                  f"{fmt(to_items_s, 11)}{fmt(pickled, 11, 1)}{fmt(unpickle_s, 12)}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import pickle
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cad_export import export_formats
+from cad_shm import SharedScene
+from cad_store import ItemStore
+from scenes import synthetic_columns, synthetic_items
+from test_teknikal import TextToCADConverter
+
+
+# Serah terima adegan ke proses worker: pickle (ItemStore / ItemColumns) vs nama blok
+# shared memory. Waktu = dari submit sampai worker selesai membaca semua kolom (bounds)
+# dan hasilnya kembali; pool sudah dipanaskan sehingga start proses tidak ikut terukur.
+
+
+def _touch(items):
+    return len(items), items.bounds()
+
+
+def _touch_shared(name):
+    scene = SharedScene.attach(name)
+    try:
+        return _touch(scene.items)
+    finally:
+        scene.close()
+
+
+def handoff(pool, fn, arg):
+    start = time.perf_counter()
+    pool.submit(fn, arg).result()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="serah terima adegan ke worker: pickle vs shared memory")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--store-max", type=int, default=1000000, help="lewati pickle ItemStore di atas jumlah ini")
+    parser.add_argument("--export-sizes", default="10000",
+                        help="ukuran untuk export_formats dxf,svg,obj mode process (kosong = lewati)")
+    args = parser.parse_args(argv)
+
+    with ProcessPoolExecutor(1) as pool:
+        pool.submit(len, ()).result()
+        print(f"{'item':>9}{'store MB':>10}{'store s':>9}{'kolom MB':>10}{'kolom s':>9}"
+              f"{'shm MB':>8}{'buat s':>8}{'attach s':>10}")
+        for n in (int(s) for s in args.sizes.split(",")):
+            cols = synthetic_columns(n)
+            store_mb = store_s = None
+            if n <= args.store_max:
+                store = ItemStore(synthetic_items(n))
+                store_mb = len(pickle.dumps(store, protocol=pickle.HIGHEST_PROTOCOL)) / 1e6
+                store_s = handoff(pool, _touch, store)
+                del store
+            cols_mb = len(pickle.dumps(cols, protocol=pickle.HIGHEST_PROTOCOL)) / 1e6
+            cols_s = handoff(pool, _touch, cols)
+            start = time.perf_counter()
+            with SharedScene.create(cols) as scene:
+                create_s = time.perf_counter() - start
+                attach_s = handoff(pool, _touch_shared, scene.name)
+                shm_mb = scene.nbytes / 1e6
+
+            def fmt(value, width, digits=3):
+                return f"{value:>{width}.{digits}f}" if value is not None else f"{'-':>{width}}"
+
+            print(f"{n:>9}{fmt(store_mb, 10, 1)}{fmt(store_s, 9)}{cols_mb:>10.1f}{cols_s:>9.3f}"
+                  f"{shm_mb:>8.1f}{create_s:>8.3f}{attach_s:>10.4f}", flush=True)
+
+    if args.export_sizes:
+        print(f"\n{'item':>9}{'transport':>11}{'total s':>9}   per format (s)")
+        for n in (int(s) for s in args.export_sizes.split(",")):
+            for transport in ("pickle", "shm"):
+                converter = TextToCADConverter()
+                converter.items = ItemStore(synthetic_items(n))
+                with tempfile.TemporaryDirectory() as tmp:
+                    start = time.perf_counter()
+                    results = export_formats(converter, os.path.join(tmp, "out"), ("dxf", "svg", "obj"),
+                                             mode="process", transport=transport)
+                    total = time.perf_counter() - start
+                per = "  ".join(f"{fmt} {r.seconds:.2f}" if r.ok else f"{fmt} gagal" for fmt, r in results.items())
+                print(f"{n:>9}{transport:>11}{total:>9.2f}   {per}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
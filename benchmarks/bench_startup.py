@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DESCRIPTION = "Kursi dengan 4 kaki, dudukan persegi 40x40 cm, tinggi 45 cm"
+
+# skenario proses pendek: masing-masing dijalankan sebagai interpreter baru
+SCENARIOS = {
+    "import": "import test_teknikal",
+    "parse": f"import test_teknikal as t; t.TextToCADConverter().parse({DESCRIPTION!r})",
+    "svg stream": (f"import io, test_teknikal as t; c = t.TextToCADConverter(); c.parse({DESCRIPTION!r}); "
+                   "c.render_svg_stream(io.StringIO())"),
+    "svg": (f"import os, tempfile, test_teknikal as t; c = t.TextToCADConverter(); c.parse({DESCRIPTION!r}); "
+            "c.render_svg(os.path.join(tempfile.mkdtemp(), 'a.svg'))"),
+}
+
+
+def run(code: str, root: str):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def import_time(code: str, root: str, top: int):
+    # -X importtime: modul tingkat atas dan import langsungnya, urut waktu kumulatif
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=root, check=True,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth <= 1:
+            rows.append((int(cumulative), "  " * depth + name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="waktu start proses pendek (import, parse, SVG)")
+    parser.add_argument("--root", default=ROOT, help="direktori sumber yang diuji (mis. checkout versi lama)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    baseline = statistics.median(run("pass", args.root) for _ in range(args.repeat))
+    print(f"{'skenario':<12}{'median ms':>12}{'min ms':>10}{'- python ms':>14}")
+    print(f"{'python':<12}{baseline * 1000:>12.1f}")
+    for name, code in SCENARIOS.items():
+        times = [run(code, args.root) for _ in range(args.repeat)]
+        print(f"{name:<12}{statistics.median(times) * 1000:>12.1f}{min(times) * 1000:>10.1f}"
+              f"{(statistics.median(times) - baseline) * 1000:>14.1f}", flush=True)
+
+    print("\nimport terbesar untuk skenario parse:")
+    for cumulative, name in import_time(SCENARIOS["parse"], args.root, args.top):
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
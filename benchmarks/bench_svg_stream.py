@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scenes import synthetic_columns
+from test_teknikal import TextToCADConverter
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="render_svg (DOM svgwrite) vs render_svg_stream")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--skip-dom-above", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    print(f"{'items':>8}{'dom s':>9}{'dom MB':>9}{'stream s':>10}{'stream MB':>11}{'bytes dom':>12}{'bytes stream':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(s) for s in args.sizes.split(",")):
+            converter = TextToCADConverter()
+            converter.items = synthetic_columns(n)
+            dom_path = os.path.join(tmp, "dom.svg")
+            stream_path = os.path.join(tmp, "stream.svg")
+            row = f"{n:>8}"
+            if n <= args.skip_dom_above:
+                t, mb = measure(lambda: converter.render_svg(dom_path))
+                row += f"{t:>9.2f}{mb:>9.1f}"
+            else:
+                row += f"{'-':>9}{'-':>9}"
+            t2, mb2 = measure(lambda: converter.render_svg_stream(stream_path))
+            row += f"{t2:>10.2f}{mb2:>11.1f}"
+            row += f"{os.path.getsize(dom_path) if os.path.exists(dom_path) else 0:>12}{os.path.getsize(stream_path):>14}"
+            print(row, flush=True)
+            if os.path.exists(dom_path):
+                os.remove(dom_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scenes import synthetic_columns
+from test_teknikal import TextToCADConverter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SVG tunggal vs tile SVG bertingkat detail")
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--tile-size", type=float, default=2000.0)
+    args = parser.parse_args(argv)
+
+    print(f"{'item':>8}{'svg s':>8}{'svg MB':>8}{'tile s':>8}{'level':>7}{'tile':>7}"
+          f"{'maks elemen':>13}{'maks KB':>9}{'total MB':>10}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        converter = TextToCADConverter()
+        converter.items = synthetic_columns(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "semua.svg")
+            start = time.perf_counter()
+            converter.render_svg_stream(path)
+            svg_s = time.perf_counter() - start
+            svg_mb = os.path.getsize(path) / 1e6
+
+            directory = os.path.join(tmp, "tiles")
+            start = time.perf_counter()
+            manifest = converter.render_svg_tiles(directory, tile_size=args.tile_size)
+            tile_s = time.perf_counter() - start
+            with open(manifest, encoding="utf-8") as f:
+                levels = json.load(f)["levels"]
+            head = f"{n:>8}{svg_s:>8.2f}{svg_mb:>8.1f}{tile_s:>8.2f}"
+            for level in levels:
+                sizes = [os.path.getsize(os.path.join(directory, t[2])) for t in level["tiles"]]
+                print(f"{head:<32}{level['level']:>7}{len(level['tiles']):>7}"
+                      f"{max(t[3] for t in level['tiles']):>13}{max(sizes) / 1e3:>9.1f}{sum(sizes) / 1e6:>10.2f}",
+                      flush=True)
+                head = ""
+
+
+if __name__ == "__main__":
+    main()
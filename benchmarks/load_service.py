@@ -0,0 +1,166 @@
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import statistics
+import subprocess
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DESCRIPTIONS = [
+    "Kursi dengan 4 kaki, dudukan persegi 40x40 cm, tinggi 45 cm",
+    "Ruangan ukuran 4x5 meter, dengan 1 pintu di sisi barat dan 2 jendela di sisi utara",
+    "Kotak 100x50",
+    "Lingkaran diameter 80",
+]
+
+
+async def _open(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def _request(reader, writer, path: str, body: bytes = b"", method: str = "POST"):
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: text/plain; charset=utf-8\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:] if line)}
+    payload = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers, payload
+
+
+async def _client(args, next_index, latencies, statuses):
+    reader, writer = await _open(args)
+    try:
+        while True:
+            i = next(next_index, None)
+            if i is None:
+                break
+            body = DESCRIPTIONS[i % len(DESCRIPTIONS)].encode("utf-8")
+            start = time.perf_counter()
+            status, headers, _ = await _request(reader, writer, f"/convert?format={args.format}", body)
+            statuses[status] += 1
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            if headers.get("connection") == "close":
+                writer.close()
+                reader, writer = await _open(args)
+    finally:
+        writer.close()
+
+
+async def _load(args):
+    latencies, statuses = [], Counter()
+    next_index = iter(range(args.requests))
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(args, next_index, latencies, statuses) for _ in range(args.concurrency)))
+    return latencies, statuses, time.perf_counter() - start
+
+
+async def _wait_ready(args, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await _open(args)
+            status, _, payload = await _request(reader, writer, "/health", method="GET")
+            writer.close()
+            if status == 200:
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+        await asyncio.sleep(0.1)
+
+
+async def _stats(args):
+    reader, writer = await _open(args)
+    _, _, payload = await _request(reader, writer, "/stats", method="GET")
+    writer.close()
+    return json.loads(payload)
+
+
+def percentile(values, p: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def cold_latency(fmt: str, runs: int):
+    # pembanding: satu proses python baru per konversi, seperti menjalankan skrip langsung
+    code = ("import sys, test_teknikal as t; from cad_export import export_bytes; "
+            "c = t.TextToCADConverter(); c.parse(sys.argv[1]); export_bytes(c, sys.argv[2])")
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, DESCRIPTIONS[i % len(DESCRIPTIONS)], fmt], cwd=ROOT,
+                       check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="uji beban cad_service: latensi p50/p99 dan throughput")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix")
+    parser.add_argument("--spawn", action="store_true", help="jalankan cad_service sendiri untuk pengujian ini")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker untuk --spawn")
+    parser.add_argument("--executor", default="process", help="executor untuk --spawn")
+    parser.add_argument("--max-pending", type=int, default=0, help="antrean untuk --spawn")
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("-n", "--requests", type=int, default=400)
+    parser.add_argument("--format", default="svg")
+    parser.add_argument("--cold", type=int, default=0, help="juga ukur N konversi dengan proses baru")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.spawn:
+        if not args.unix:
+            args.port = _free_port()
+        cmd = [sys.executable, os.path.join(ROOT, "cad_service.py"), "--port", str(args.port),
+               "-j", str(args.workers), "--executor", args.executor]
+        if args.unix:
+            cmd += ["--unix", args.unix]
+        if args.max_pending:
+            cmd += ["--max-pending", str(args.max_pending)]
+        server = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(_wait_ready(args))
+        asyncio.run(_load(argparse.Namespace(**dict(vars(args), requests=args.concurrency))))   # pemanasan
+        latencies, statuses, elapsed = asyncio.run(_load(args))
+        stats = asyncio.run(_stats(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    # latensi hanya dari respons 200; penolakan 503 (antrean penuh) dihitung terpisah
+    ms = [t * 1000 for t in latencies] or [0.0]
+    print(f"{args.requests} request, konkurensi {args.concurrency}, format {args.format}, "
+          f"{stats['workers']} worker {stats['executor']}")
+    print(f"  throughput  {len(latencies) / elapsed:8.1f} req/s berhasil")
+    print(f"  p50         {percentile(ms, 50):8.1f} ms")
+    print(f"  p90         {percentile(ms, 90):8.1f} ms")
+    print(f"  p99         {percentile(ms, 99):8.1f} ms")
+    print(f"  maks        {max(ms):8.1f} ms")
+    print(f"  status      {dict(sorted(statuses.items()))}")
+    if args.cold:
+        cold = [t * 1000 for t in cold_latency(args.format, args.cold)]
+        print(f"  proses baru {statistics.median(cold):8.1f} ms median ({args.cold} kali)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_teknikal import CADItem
+
+
+def synthetic_items(n: int, spacing: float = 600.0):
+    # Adegan sintetis dengan campuran semua jenis item: kursi + 4 kaki, kotak, lingkaran,
+    # ruangan + pintu + jendela. Setiap grup diletakkan di sel grid sendiri.
+    items = []
+    cols = max(int((n / 10) ** 0.5), 1)
+    group = 0
+    while len(items) < n:
+        x = (group % cols) * spacing
+        y = (group // cols) * spacing
+        kind = group % 4
+        if kind == 0:
+            items.append(CADItem("seat", x=x, y=y, width=40.0, depth=40.0, height=45.0))
+            for fx, fy in ((0.1, 0.1), (0.9, 0.1), (0.1, 0.9), (0.9, 0.9)):
+                items.append(CADItem("leg", cx=x + fx * 40.0, cy=y + fy * 40.0, radius=2.0, height=45.0))
+        elif kind == 1:
+            items.append(CADItem("rect", x=x, y=y, width=100.0, depth=50.0, height=30.0))
+        elif kind == 2:
+            items.append(CADItem("circle", cx=x + 40.0, cy=y + 40.0, radius=40.0, height=30.0))
+        else:
+            items.append(CADItem("room", x=x, y=y, width=400.0, depth=500.0, height=300.0))
+            items.append(CADItem("door", side="west", width=90.0, height=210.0))
+            items.append(CADItem("window", side="north", width=120.0, height=120.0))
+        group += 1
+    return items[:n]
+
+
+def synthetic_columns(n: int, spacing: float = 600.0):
+    # Adegan yang sama dengan synthetic_items, langsung dibangun sebagai ItemColumns
+    # tanpa membuat objek CADItem satu per satu.
+    import numpy as np
+
+    from cad_columns import ItemColumns, SIDES
+
+    # pola per 10 item = 4 grup: (offset grup, jenis, sudut kaki / peran)
+    pattern = [(0, "seat", -1), (0, "leg", 0), (0, "leg", 1), (0, "leg", 2), (0, "leg", 3),
+               (1, "rect", -1), (2, "circle", -1), (3, "room", -1), (3, "door", -1), (3, "window", -1)]
+    cols = ItemColumns(n)
+    i = np.arange(n)
+    offset = i % 10
+    group = (i // 10) * 4 + np.array([p[0] for p in pattern])[offset]
+    ncols = max(int((n / 10) ** 0.5), 1)
+    gx = (group % ncols) * spacing
+    gy = (group // ncols) * spacing
+    cols.kind[:] = np.array([cols.kind_code(p[1]) for p in pattern])[offset]
+
+    def put(kind_offsets, **values):
+        m = np.isin(offset, kind_offsets)
+        for name, value in values.items():
+            cols.columns[name][m] = value[m] if isinstance(value, np.ndarray) else value
+        return m
+
+    put([0, 5, 7], x=gx, y=gy)
+    put([0], width=40.0, depth=40.0, height=45.0)
+    put([5], width=100.0, depth=50.0, height=30.0)
+    put([7], width=400.0, depth=500.0, height=300.0)
+    corner = np.array([p[2] for p in pattern])[offset]
+    fx = np.where(corner % 2 == 0, 0.1, 0.9)
+    fy = np.where(corner < 2, 0.1, 0.9)
+    put([1, 2, 3, 4], cx=gx + fx * 40.0, cy=gy + fy * 40.0, radius=2.0, height=45.0)
+    put([6], cx=gx + 40.0, cy=gy + 40.0, radius=40.0, height=30.0)
+    put([8], width=90.0, height=210.0)
+    put([9], width=120.0, height=120.0)
+    cols.side[offset == 8] = SIDES.index("west")
+    cols.side[offset == 9] = SIDES.index("north")
+    parent = i - offset + np.where(offset < 5, 0, 7)
+    child = np.isin(offset, [1, 2, 3, 4, 8, 9])
+    cols.parent[child] = parent[child]
+    return cols
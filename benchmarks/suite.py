@@ -0,0 +1,290 @@
+import os
+import io
+import sys
+import json
+import time
+import runpy
+import argparse
+import platform
+import resource
+import tempfile
+import contextlib
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+# Suite benchmark yang bisa diulang: setiap (kasus, ukuran) dijalankan di proses baru,
+# hasilnya (waktu, peak memori, byte output) disimpan sebagai JSON dan bisa dibandingkan
+# dengan baseline tersimpan. Regresi di luar toleransi membuat proses keluar dengan kode 1.
+#
+#   python benchmarks/suite.py -o benchmarks/baseline.json          # simpan baseline
+#   python benchmarks/suite.py --baseline benchmarks/baseline.json  # jalankan + bandingkan
+#   python benchmarks/suite.py --compare lama.json baru.json        # bandingkan dua hasil
+
+PARSE_FAMILIES = {"parse_chair": "chair", "parse_room": "room", "parse_basic": "shape"}
+RENDERERS = {"render_dxf": ("render_dxf", "dxf"), "render_svg": ("render_svg", "svg"),
+             "export_obj_extrude": ("export_obj_extrude", "obj")}
+CASES = list(PARSE_FAMILIES) + list(RENDERERS) + ["persegi_panjang"]
+
+# ukuran bawaan: panjang deskripsi (byte) untuk parse, jumlah item adegan untuk render
+PARSE_SIZES = "1,8192,65536"
+SCENE_SIZES = "1,100,10000,100000"
+QUICK_SCENE_SIZES = "1,100,1000"
+
+
+def _peak_rss_mb():
+    # ru_maxrss dalam KB di Linux, byte di macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _timed(run, min_time: float, min_repeat: int, max_repeat: int):
+    # putaran pertama = pemanasan (import tertunda, cache font, dll.) sekaligus pengukuran
+    # peak memori; lalu minimal min_repeat putaran sampai min_time, waktu = putaran tercepat.
+    # Kasus yang jauh lebih lama dari min_time cukup diukur dari putaran pertama.
+    base = _peak_rss_mb()
+    start = time.perf_counter()
+    out = run()
+    first = time.perf_counter() - start
+    peak = _peak_rss_mb() - base
+    if first > min_time * 10:
+        return out, first, peak, 1
+    best, total, repeat = float("inf"), 0.0, 0
+    while repeat < max_repeat and (repeat < min_repeat or total < min_time):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeat += 1
+    return out, best, peak, repeat
+
+
+def run_case(case: str, size: int, min_time: float, min_repeat: int, max_repeat: int):
+    from test_teknikal import TextToCADConverter
+
+    result = {"case": case, "size": size}
+    with tempfile.TemporaryDirectory() as tmp:
+        if case in PARSE_FAMILIES:
+            from bench_parse import long_description
+
+            text = long_description(PARSE_FAMILIES[case], size)
+
+            def run():
+                converter = TextToCADConverter()
+                converter.parse(text)
+                return converter
+
+            converter, seconds, peak, repeat = _timed(run, min_time, min_repeat, max_repeat)
+            result.update(items=len(converter.items), bytes=len(text.encode("utf-8")))
+
+        elif case in RENDERERS:
+            from cad_store import ItemStore
+            from scenes import synthetic_items
+
+            method, ext = RENDERERS[case]
+            converter = TextToCADConverter()
+            converter.items = ItemStore(synthetic_items(size))
+            path = os.path.join(tmp, f"bench.{ext}")
+            render = getattr(converter, method)
+            _, seconds, peak, repeat = _timed(lambda: render(path), min_time, min_repeat, max_repeat)
+            result.update(items=len(converter.items), bytes=os.path.getsize(path) if os.path.exists(path) else 0)
+
+        elif case == "persegi_panjang":
+            # skrip interaktif: jawab input() lewat stdin, output ditulis ke direktori kerja
+            import ezdxf  # noqa: F401
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot  # noqa: F401
+
+            script = os.path.join(ROOT, "test_teknikal_persegi_panjang.py")
+            cwd = os.getcwd()
+
+            def run():
+                stdin, argv = sys.stdin, sys.argv
+                sys.stdin = io.StringIO(f"{size}\n{max(size // 2, 1)}\n")
+                sys.argv = [script]
+                os.chdir(tmp)
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        runpy.run_path(script, run_name="__main__")
+                finally:
+                    os.chdir(cwd)
+                    sys.stdin, sys.argv = stdin, argv
+
+            _, seconds, peak, repeat = _timed(run, min_time, min_repeat, max_repeat)
+            result.update(items=1, bytes=sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp)))
+
+        else:
+            raise ValueError(f"kasus tidak dikenal: {case}")
+
+    result.update(seconds=seconds, repeat=repeat, peak_mb=peak, rss_mb=_peak_rss_mb())
+    return result
+
+
+def _sizes(case: str, args):
+    if case in PARSE_FAMILIES:
+        text = args.parse_sizes
+    elif case == "persegi_panjang":
+        text = args.persegi_sizes
+    else:
+        text = args.sizes or (QUICK_SCENE_SIZES if args.quick else SCENE_SIZES)
+    return [int(s) for s in text.split(",") if s]
+
+
+def calibrate(repeat: int = 5):
+    # beban Python murni yang tetap: rasio kalibrasi dua run dipakai untuk menormalkan waktu
+    # saat mesin (atau bebannya) berbeda
+    def work():
+        total = 0
+        for i in range(200000):
+            total += i * i % 7
+        return sorted(str(i) for i in range(20000))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        work()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _meta():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                             text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        rev = None
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+            "cpus": os.cpu_count(), "git": rev, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def run_suite(args):
+    results = {}
+    before = calibrate()
+    print(f"{'kasus':<20}{'ukuran':>8}{'item':>8}{'ms':>12}{'ulang':>7}{'peak MB':>10}{'bytes':>13}")
+    for case in args.cases:
+        for size in _sizes(case, args):
+            cmd = [sys.executable, __file__, "--child", case, str(size), "--min-time", str(args.min_time),
+                   "--min-repeat", str(args.min_repeat), "--max-repeat", str(args.max_repeat)]
+            proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, timeout=args.case_timeout)
+            if proc.returncode:
+                sys.stderr.write(proc.stderr)
+                raise SystemExit(f"kasus {case}/{size} gagal (kode {proc.returncode})")
+            r = json.loads(proc.stdout.splitlines()[-1])
+            results[f"{case}/{size}"] = r
+            print(f"{case:<20}{size:>8}{r['items']:>8}{r['seconds'] * 1000:>12.2f}{r['repeat']:>7}"
+                  f"{r['peak_mb']:>10.1f}{r['bytes']:>13}", flush=True)
+    meta = dict(_meta(), calibration_s=min(before, calibrate()))
+    return {"meta": meta, "results": results}
+
+
+def _order(key: str):
+    case, size = key.rsplit("/", 1)
+    return CASES.index(case) if case in CASES else len(CASES), case, int(size)
+
+
+def compare(baseline, current, time_tolerance: float = 0.25, memory_tolerance: float = 0.25,
+            bytes_tolerance: float = 0.0, min_seconds: float = 0.005, min_mb: float = 8.0, min_bytes: int = 64,
+            calibrate: bool = True):
+    # daftar (kunci, metrik, lama, baru) yang melewati toleransi relatif DAN ambang absolut
+    # (supaya kasus mikro tidak gagal karena noise). Output yang berubah ukuran juga dihitung
+    # regresi kecuali bytes_tolerance dinaikkan, karena berarti renderer menghasilkan hal lain;
+    # min_bytes menampung stempel waktu/GUID di header DXF dan metadata PNG.
+    regressions = []
+    old, new = baseline["results"], current["results"]
+    scale = 1.0
+    if calibrate and baseline["meta"].get("calibration_s") and current["meta"].get("calibration_s"):
+        scale = current["meta"]["calibration_s"] / baseline["meta"]["calibration_s"]
+        print(f"kalibrasi: mesin sekarang {scale:.2f}x waktu baseline; waktu baru dibagi {scale:.2f}")
+    print(f"\n{'kasus':<28}{'ms lama':>11}{'ms baru':>11}{'rasio':>8}{'MB lama':>9}{'MB baru':>9}  status")
+    for key in sorted(new, key=_order):
+        if key not in old:
+            print(f"{key:<28}{'':>11}{new[key]['seconds'] * 1000:>11.2f}  (baru)")
+            continue
+        a, b = old[key], new[key]
+        seconds = b["seconds"] / scale
+        ratio = seconds / a["seconds"] if a["seconds"] else float("inf")
+        status = []
+        if seconds > a["seconds"] * (1 + time_tolerance) and seconds - a["seconds"] > min_seconds:
+            status.append("WAKTU")
+            regressions.append((key, "seconds", a["seconds"], seconds))
+        if b["peak_mb"] > a["peak_mb"] * (1 + memory_tolerance) and b["peak_mb"] - a["peak_mb"] > min_mb:
+            status.append("MEMORI")
+            regressions.append((key, "peak_mb", a["peak_mb"], b["peak_mb"]))
+        if abs(b["bytes"] - a["bytes"]) > max(a["bytes"] * bytes_tolerance, min_bytes):
+            status.append("BYTES")
+            regressions.append((key, "bytes", a["bytes"], b["bytes"]))
+        print(f"{key:<28}{a['seconds'] * 1000:>11.2f}{seconds * 1000:>11.2f}{ratio:>8.2f}"
+              f"{a['peak_mb']:>9.1f}{b['peak_mb']:>9.1f}  {' '.join(status) or 'ok'}")
+    for key in sorted(set(old) - set(new), key=_order):
+        print(f"{key:<28}  (tidak dijalankan)")
+    return regressions
+
+
+def report(regressions):
+    if not regressions:
+        print("\ntidak ada regresi")
+        return 0
+    print(f"\nREGRESI: {len(regressions)} metrik melewati toleransi", file=sys.stderr)
+    for key, metric, a, b in regressions:
+        print(f"  {key}: {metric} {a:.6g} -> {b:.6g}", file=sys.stderr)
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="suite benchmark parse/render dengan baseline JSON")
+    parser.add_argument("--cases", default=",".join(CASES), help=f"daftar kasus, koma ({', '.join(CASES)})")
+    parser.add_argument("--sizes", help=f"jumlah item adegan untuk render (default {SCENE_SIZES})")
+    parser.add_argument("--quick", action="store_true", help=f"ukuran adegan kecil ({QUICK_SCENE_SIZES})")
+    parser.add_argument("--parse-sizes", default=PARSE_SIZES, help="panjang deskripsi (byte) untuk parse")
+    parser.add_argument("--persegi-sizes", default="400", help="panjang persegi panjang untuk skrip input")
+    parser.add_argument("--min-time", type=float, default=0.5, help="ulangi kasus cepat sampai detik ini")
+    parser.add_argument("--min-repeat", type=int, default=3)
+    parser.add_argument("--max-repeat", type=int, default=1000)
+    parser.add_argument("--case-timeout", type=float, default=1800)
+    parser.add_argument("-o", "--output", help="simpan hasil sebagai JSON (mis. baseline baru)")
+    parser.add_argument("--baseline", help="bandingkan dengan JSON ini; keluar 1 jika ada regresi")
+    parser.add_argument("--compare", nargs=2, metavar=("LAMA", "BARU"), help="bandingkan dua JSON tanpa menjalankan")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="kenaikan waktu relatif yang diizinkan")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--bytes-tolerance", type=float, default=0.0)
+    parser.add_argument("--no-calibrate", action="store_true", help="bandingkan waktu mentah tanpa normalisasi")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_case(args.child[0], int(args.child[1]), args.min_time, args.min_repeat,
+                                  args.max_repeat)))
+        return 0
+
+    tolerances = dict(time_tolerance=args.time_tolerance, memory_tolerance=args.memory_tolerance,
+                      bytes_tolerance=args.bytes_tolerance, calibrate=not args.no_calibrate)
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            current = json.load(f)
+        return report(compare(baseline, current, **tolerances))
+
+    args.cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"kasus tidak dikenal: {', '.join(sorted(unknown))}")
+    current = run_suite(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=1, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        return report(compare(baseline, current, **tolerances))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
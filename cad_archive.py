@@ -0,0 +1,220 @@
+import io
+import os
+import json
+import time
+import zipfile
+import tempfile
+
+from cad_export import BINARY_FORMATS, WRITERS, ExportResult, publish
+
+
+# Semua format satu konversi (atau satu batch) dalam satu arsip zip terkompresi, untuk
+# penyimpanan yang lambat karena jumlah file dan volume byte (mis. network share).
+#
+# Renderer menulis langsung ke anggota zip lewat stream: data dikompresi per blok saat
+# ditulis, jadi file DXF/SVG/OBJ utuh tidak pernah ada di memori atau di disk. Anggota baru
+# dibuka saat byte pertama ditulis, sehingga renderer yang tidak menghasilkan apa pun
+# (mis. tidak ada solid untuk OBJ) tidak meninggalkan anggota kosong. Target boleh stream
+# yang tidak bisa di-seek (stdout, socket): zipfile memakai data descriptor. Semua anggota
+# bertanggal 1980-01-01 (bawaan zipfile untuk anggota stream), jadi isi yang sama
+# menghasilkan arsip yang sama.
+#
+# manifest.json ditulis paling akhir: kompresi, level, lalu per konversi nama, info
+# tambahan (deskripsi, id), jumlah item per jenis, bounds dan per format nama anggota,
+# byte asli, byte terkompresi dan waktu render; format yang gagal dicatat di "errors".
+#
+# Hanya zip: tar (termasuk tar.gz/tar.zst) mencatat ukuran anggota di header sebelum
+# datanya, sehingga setiap file harus ditampung dulu sebelum ditulis.
+
+MANIFEST = "manifest.json"
+COMPRESSION = {"stored": zipfile.ZIP_STORED, "deflate": zipfile.ZIP_DEFLATED,
+               "bzip2": zipfile.ZIP_BZIP2, "lzma": zipfile.ZIP_LZMA}
+# level yang diterima kompresor; stored dan lzma mengabaikan level
+LEVELS = {"deflate": (0, 9), "bzip2": (1, 9)}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):   # Python 3.14+
+    from compression.zstd import CompressionParameter
+
+    COMPRESSION["zstd"] = zipfile.ZIP_ZSTANDARD
+    LEVELS["zstd"] = CompressionParameter.compression_level.bounds()
+DEFAULT_LEVEL = 6
+
+
+def check_level(compression: str, level: int):
+    # dicek sebelum arsip dibuka: kompresor yang gagal dibuat di tengah penulisan
+    # meninggalkan zipfile dalam keadaan "masih menulis" untuk semua anggota berikutnya
+    if compression not in COMPRESSION:
+        raise ValueError(f"kompresi tidak dikenal: {compression} (pilihan: {', '.join(COMPRESSION)})")
+    low, high = LEVELS.get(compression, (None, None))
+    if low is not None and not low <= level <= high:
+        raise ValueError(f"level kompresi {compression} harus {low} sampai {high}, bukan {level}")
+
+
+class _Member(io.RawIOBase):
+    # stream biner yang baru membuka anggota zip saat byte pertama ditulis
+    def __init__(self, archive, name: str):
+        self._zip = archive
+        self.name = name
+        self._out = None
+        self._error = None
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self._out is None:
+            if self._error is not None:
+                # flush setelah gagal membuka anggota: laporkan error aslinya lagi
+                raise self._error
+            try:
+                self._out = self._zip.open(self.name, "w", force_zip64=True)
+            except Exception as e:
+                self._error = e
+                raise
+        return self._out.write(data)
+
+    @property
+    def written(self):
+        return self._out is not None
+
+    def close(self):
+        if self._out is not None and not self.closed:
+            self._out.close()
+        super().close()
+
+
+def item_summary(items):
+    bounds = items.bounds()
+    return {"items": len(items), "kinds": items.kinds(), "bounds": list(bounds) if bounds else None}
+
+
+class CADArchive:
+    def __init__(self, target, compression: str = "deflate", level: int = DEFAULT_LEVEL):
+        # target: path .zip (ditulis ke file sementara, diganti saat close) atau stream biner
+        check_level(compression, level)
+        self.target = target
+        self._tmp = None
+        if not hasattr(target, "write"):
+            fd, self._tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)), prefix=".tmp-")
+            os.close(fd)
+        self._zip = zipfile.ZipFile(self._tmp or target, "w", compression=COMPRESSION[compression],
+                                    compresslevel=level, allowZip64=True)
+        self.manifest = {"version": 1, "compression": compression, "level": level, "entries": []}
+
+    def entry(self, name: str, scene=None, **info):
+        # entri manifest baru untuk satu konversi; scene: daftar item untuk ringkasan
+        entry = {"name": name, **info}
+        if scene is not None:
+            entry.update(item_summary(scene))
+        entry["files"], entry["errors"] = {}, {}
+        self.manifest["entries"].append(entry)
+        return entry
+
+    def add(self, converter, name: str, formats=("dxf", "svg", "obj"), **info):
+        # Render setiap format ke anggota `name.fmt`. Hasil per format seperti
+        # export_formats (path = nama anggota di dalam arsip).
+        unknown = [fmt for fmt in formats if fmt not in WRITERS]
+        if unknown:
+            raise ValueError(f"format tidak dikenal: {', '.join(unknown)}")
+        entry = self.entry(name, converter.items, **info)
+        return {fmt: self.render(entry, converter, fmt) for fmt in formats}
+
+    def render(self, entry, converter, fmt: str):
+        member = _Member(self._zip, f"{entry['name']}.{fmt}")
+        start = time.perf_counter()
+        error = None
+        try:
+            if fmt in BINARY_FORMATS:
+                stream = io.BufferedWriter(member, 1 << 16)
+            else:
+                stream = io.TextIOWrapper(io.BufferedWriter(member, 1 << 16), encoding="utf-8", newline="")
+            with stream:
+                if not getattr(converter, WRITERS[fmt])(stream):
+                    error = "tidak ada output"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            member.close()
+        return self._record(entry, fmt, member, error, time.perf_counter() - start)
+
+    def add_bytes(self, entry, fmt: str, data: bytes):
+        # artefak yang sudah jadi (mis. dari cad_cache) sebagai anggota `name.fmt`; data
+        # kosong dicatat seperti render tanpa output (tanpa anggota, tanda di errors)
+        member = _Member(self._zip, f"{entry['name']}.{fmt}")
+        start = time.perf_counter()
+        with member:
+            if data:
+                member.write(data)
+        return self._record(entry, fmt, member, None if data else "tidak ada output",
+                            time.perf_counter() - start)
+
+    def _record(self, entry, fmt, member, error, seconds):
+        if member.written:
+            info = self._zip.getinfo(member.name)
+            entry["files"][fmt] = {"member": member.name, "bytes": info.file_size,
+                                   "compressed": info.compress_size, "seconds": round(seconds, 4)}
+        if error:
+            # anggota yang sudah sebagian ditulis tetap ada; tandanya ada di errors
+            entry["errors"][fmt] = error
+            entry["files"].pop(fmt, None)
+            return ExportResult(fmt, None, False, error, seconds)
+        return ExportResult(fmt, member.name, True, None, seconds)
+
+    def close(self):
+        if self._zip is None:
+            return self.target
+        self._zip.writestr(zipfile.ZipInfo(MANIFEST), json.dumps(self.manifest, ensure_ascii=False, indent=1),
+                           compress_type=self._zip.compression, compresslevel=self._zip.compresslevel)
+        self._zip.close()
+        self._zip = None
+        if self._tmp:
+            publish(self._tmp, self.target)
+            self._tmp = None
+        return self.target
+
+    def discard(self):
+        # arsip setengah jadi dibuang (target path tidak disentuh)
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tmp:
+            try:
+                os.unlink(self._tmp)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from test_teknikal import TextToCADConverter
+
+    parser = argparse.ArgumentParser(description="semua format satu deskripsi ke satu arsip zip + manifest.json")
+    parser.add_argument("source", help="deskripsi teks atau berkas .cadscene")
+    parser.add_argument("-o", "--output", default="output.zip")
+    parser.add_argument("--formats", default="dxf,svg,obj")
+    parser.add_argument("--compression", choices=tuple(COMPRESSION), default="deflate")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL)
+    args = parser.parse_args()
+    try:
+        check_level(args.compression, args.level)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.source.endswith(".cadscene") and os.path.exists(args.source):
+        converter = TextToCADConverter.from_scene(args.source)
+    else:
+        converter = TextToCADConverter()
+        converter.parse(args.source)
+    with CADArchive(args.output, args.compression, args.level) as archive:
+        name = os.path.splitext(os.path.basename(args.output))[0]
+        for fmt, result in archive.add(converter, name, args.formats.split(","), description=args.source).items():
+            print(f"{fmt}: {result.path if result.ok else result.error}")
+    print(f"{len(converter.items)} item -> {args.output}")
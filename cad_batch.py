@@ -0,0 +1,227 @@
+import os
+import re
+import sys
+import json
+import argparse
+import multiprocessing
+from collections import Counter, deque
+
+from cad_archive import COMPRESSION, DEFAULT_LEVEL, CADArchive, check_level
+from cad_cache import parse_cached, render_cached, shared_cache
+from cad_export import MESH_FORMATS, WRITERS, export_formats
+from test_teknikal import TextToCADConverter, has_mesh_support, make_output_basename
+
+
+DEFAULT_FORMATS = ("dxf", "svg", "obj")
+
+
+def iter_records(fp, input_format: str = "auto"):
+    # Satu deskripsi per baris. Baris JSONL boleh berisi {"id": ..., "description": ...}
+    # (atau "text"); baris kosong dilewati.
+    for index, line in enumerate(fp):
+        line = line.strip()
+        if not line:
+            continue
+        if input_format == "jsonl" or (input_format == "auto" and line.startswith("{")):
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                yield {"index": index, "id": index, "description": None, "error": f"JSON tidak valid: {e}"}
+                continue
+            if not isinstance(data, dict):
+                yield {"index": index, "id": index, "description": None,
+                       "error": f"baris JSONL harus berupa objek, bukan {type(data).__name__}"}
+                continue
+            description = data.get("description", data.get("text"))
+            yield {"index": index, "id": data.get("id", index), "description": description}
+        else:
+            yield {"index": index, "id": index, "description": line}
+
+
+def archive_name(record):
+    # nama anggota di arsip: nomor baris, ditambah id jika id-nya bukan nomor baris
+    name = f"{record['index']:06d}"
+    if record["id"] != record["index"]:
+        name += "_" + re.sub(r"[^\w.-]+", "_", str(record["id"]))[:64]
+    return name
+
+
+def convert_record(record, output_dir: str = ".", formats=DEFAULT_FORMATS, cache=None, archive=None):
+    # cache: argumen cad_cache.shared_cache (direktori, byte memori, byte disk) atau None.
+    # archive: cad_archive.CADArchive; output ditulis sebagai anggota arsip, bukan file.
+    result = {"index": record["index"], "id": record["id"], "outputs": {}, "errors": {}}
+    if record.get("error") or not isinstance(record.get("description"), str):
+        result["errors"]["input"] = record.get("error") or "deskripsi kosong"
+        result["ok"] = False
+        return result
+
+    if cache is not None:
+        return _convert_record_cached(record, output_dir, formats, shared_cache(*cache), result, archive)
+
+    converter = TextToCADConverter()
+    try:
+        converter.parse(record["description"])
+    except Exception as e:
+        result["errors"]["parse"] = f"{type(e).__name__}: {e}"
+        result["ok"] = False
+        return result
+
+    result["items"] = len(converter.items)
+    result["kinds"] = dict(Counter(it.kind for it in converter.items))
+
+    if set(formats) & MESH_FORMATS and not has_mesh_support():
+        for fmt in set(formats) & MESH_FORMATS:
+            result["errors"][fmt] = "numpy tidak tersedia"
+        formats = tuple(fmt for fmt in formats if fmt not in MESH_FORMATS)
+    if archive is not None:
+        exports = archive.add(converter, archive_name(record), formats, id=record["id"],
+                              description=record["description"])
+    else:
+        # record sudah berjalan paralel di pool, jadi format ditulis berurutan di sini
+        exports = export_formats(converter, make_output_basename(directory=output_dir), formats, mode="serial")
+    for fmt, export in exports.items():
+        if export.ok:
+            result["outputs"][fmt] = export.path
+        else:
+            result["errors"][fmt] = export.error
+
+    result["ok"] = not result["errors"]
+    return result
+
+
+def _convert_record_cached(record, output_dir, formats, cache, result, archive=None):
+    # Seperti convert_record, tetapi item dan artefak diambil dari cache dua tingkat;
+    # artefak yang sudah ada hanya disalin ke file output (atau ke arsip).
+    try:
+        data, converter = parse_cached(cache, record["description"])
+    except Exception as e:
+        result["errors"]["parse"] = f"{type(e).__name__}: {e}"
+        result["ok"] = False
+        return result
+    kinds = [row[0] for row in json.loads(data)]
+    result["items"] = len(kinds)
+    result["kinds"] = dict(Counter(kinds))
+
+    if archive is not None:
+        entry = archive.entry(archive_name(record), id=record["id"], description=record["description"],
+                              items=result["items"], kinds=result["kinds"])
+    else:
+        basename = make_output_basename(directory=output_dir)
+    result["cached"] = []
+    for fmt in formats:
+        if fmt in MESH_FORMATS and not has_mesh_support():
+            result["errors"][fmt] = "numpy tidak tersedia"
+            continue
+        try:
+            artifact, hit = render_cached(cache, data, fmt, converter)
+        except Exception as e:
+            result["errors"][fmt] = f"{type(e).__name__}: {e}"
+            continue
+        if archive is not None:
+            exported = archive.add_bytes(entry, fmt, artifact or b"")
+            if not exported.ok:
+                result["errors"][fmt] = exported.error
+                continue
+            path = exported.path
+        elif artifact is None:
+            result["errors"][fmt] = "tidak ada output"
+            continue
+        else:
+            path = f"{basename}.{fmt}"
+            with open(path, "wb") as f:
+                f.write(artifact)
+        result["outputs"][fmt] = path
+        if hit:
+            result["cached"].append(fmt)
+
+    result["ok"] = not result["errors"]
+    return result
+
+
+def _convert_task(args):
+    return convert_record(*args)
+
+
+def run_batch(records, output_dir: str = ".", formats=DEFAULT_FORMATS, workers: int = 0,
+              max_pending: int = 0, maxtasksperchild: int = 0, cache=None, archive=None):
+    # Generator hasil per record, urut sesuai input. Paling banyak `max_pending` record
+    # berada di dalam pool sekaligus, sehingga input besar tidak dibaca seluruhnya ke memori.
+    # Dengan archive semua record dikonversi di proses ini: arsip zip hanya punya satu
+    # penulis, dan output worker harus ditampung utuh dulu untuk dikirim ke sini.
+    formats = tuple(formats)
+    if archive is not None:
+        for record in records:
+            yield convert_record(record, output_dir, formats, cache, archive)
+        return
+    os.makedirs(output_dir, exist_ok=True)
+    if workers <= 1:
+        for record in records:
+            yield convert_record(record, output_dir, formats, cache)
+        return
+
+    max_pending = max_pending or workers * 4
+    pending = deque()
+    with multiprocessing.Pool(workers, maxtasksperchild=maxtasksperchild or None) as pool:
+        for record in records:
+            if len(pending) >= max_pending:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(_convert_task, ((record, output_dir, formats, cache),)))
+        while pending:
+            yield pending.popleft().get()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi banyak deskripsi sketsa ke DXF/SVG/OBJ sekaligus.")
+    parser.add_argument("input", nargs="?", default="-", help="file deskripsi (teks per baris atau JSONL), '-' untuk stdin")
+    parser.add_argument("-o", "--output-dir", default="output_batch")
+    parser.add_argument("-r", "--results", default="-", help="file hasil JSONL, '-' untuk stdout")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS))
+    parser.add_argument("--input-format", choices=("auto", "text", "jsonl"), default="auto")
+    parser.add_argument("--max-pending", type=int, default=0, help="batas record yang sedang diproses (default 4x workers)")
+    parser.add_argument("--maxtasksperchild", type=int, default=0)
+    parser.add_argument("--cache-dir", help="cache hasil parse/render di direktori ini (dipakai bersama semua worker)")
+    parser.add_argument("--cache-mb", type=int, default=64, help="cache memori per worker (MB) jika --cache-dir dipakai")
+    parser.add_argument("--cache-disk-mb", type=int, default=1024)
+    parser.add_argument("--archive", help="tulis semua output ke satu arsip zip ini (+ manifest.json), "
+                                          "bukan file per format; dikonversi di proses utama")
+    parser.add_argument("--compression", choices=tuple(COMPRESSION), default="deflate", help="kompresi --archive")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL, help="level kompresi --archive")
+    args = parser.parse_args(argv)
+
+    if args.archive:
+        try:
+            check_level(args.compression, args.level)
+        except ValueError as e:
+            parser.error(str(e))
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    unknown = set(formats) - set(WRITERS)
+    if unknown:
+        parser.error(f"format tidak dikenal: {', '.join(sorted(unknown))}")
+
+    fin = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    fout = sys.stdout if args.results == "-" else open(args.results, "w", encoding="utf-8")
+    failed = 0
+    archive = CADArchive(args.archive, args.compression, args.level) if args.archive else None
+    try:
+        records = iter_records(fin, args.input_format)
+        cache = (args.cache_dir, args.cache_mb << 20, args.cache_disk_mb << 20) if args.cache_dir else None
+        for result in run_batch(records, args.output_dir, formats, args.workers,
+                                args.max_pending, args.maxtasksperchild, cache, archive):
+            failed += not result["ok"]
+            fout.write(json.dumps(result, ensure_ascii=False) + "\n")
+            fout.flush()
+        if archive is not None:
+            archive.close()
+    finally:
+        if archive is not None:
+            archive.discard()
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
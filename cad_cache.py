@@ -0,0 +1,319 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+# Cache dua tingkat untuk konversi teks -> file:
+#
+#   1. deskripsi yang dinormalisasi -> daftar item hasil parse
+#   2. hash kanonik daftar item      -> artefak per format (bytes DXF/SVG/OBJ/...)
+#
+# Deskripsi berbeda yang menghasilkan item sama ("4x5 meter" vs "400x500") berbagi
+# artefak di tingkat 2. Setiap tingkat punya tier memori (LRU per proses) dan tier
+# disk opsional yang bisa dipakai bersama oleh banyak proses worker.
+
+# naikkan jika parser atau renderer berubah sehingga artefak lama tidak valid lagi
+CACHE_VERSION = 5
+
+
+def _digest(data: bytes):
+    return hashlib.sha256(b"%d:" % CACHE_VERSION + data).hexdigest()
+
+
+def dump_items(items):
+    # daftar item -> JSON kanonik: [kind, props terurut, indeks induk atau null]
+    index = {id(item): i for i, item in enumerate(items)}
+    rows = []
+    for item in items:
+        parent = items.parent_of(item)
+        rows.append([item.kind, item.props, index[id(parent)] if parent is not None else None])
+    return json.dumps(rows, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def load_items(data: bytes):
+    from cad_store import ItemStore
+    from test_teknikal import CADItem
+
+    store = ItemStore()
+    for kind, props, parent in json.loads(data):
+        store.append(CADItem(kind, **props), parent=store[parent] if parent is not None else None)
+    return store
+
+
+def items_key(data: bytes):
+    # hash kanonik daftar item: kunci tingkat 2
+    return _digest(data)
+
+
+class MemoryTier:
+    # LRU per proses dengan batas jumlah entri dan total byte; aman dipakai antar thread
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old)
+            self._data[key] = value
+            self.nbytes += len(value)
+            while len(self._data) > self.max_entries or self.nbytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.nbytes -= len(evicted)
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+
+class DiskTier:
+    # Satu file per entri di bawah `directory`, dengan batas total byte.
+    #
+    # Aman untuk banyak proses tanpa server: file ditulis ke file sementara lalu
+    # os.replace (atomik), pembaca yang kalah balapan dengan penghapusan cukup
+    # menganggapnya miss, dan eviksi (hapus yang paling lama tidak dipakai menurut
+    # mtime, yang diperbarui saat hit) dijaga lock file jika fcntl tersedia.
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30, low_water: float = 0.9,
+                 rescan_fraction: float = 0.05):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        # proses lain juga menulis: ukuran sebenarnya dihitung ulang setiap proses ini
+        # menulis rescan_fraction * max_bytes, atau saat perkiraannya melewati batas
+        self.rescan_bytes = max_bytes * rescan_fraction
+        self.evictions = 0
+        self._estimate = None
+        self._since_scan = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str):
+        # kunci = awalan tingkat ("i"/"a") + hash; subdirektori dari dua karakter hash
+        return os.path.join(self.directory, key[1:3], key)
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)   # tandai baru dipakai untuk LRU
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._since_scan += len(value)
+        if self._estimate is None:
+            self._estimate = self.size()
+            self._since_scan = 0
+        else:
+            self._estimate += len(value)
+        if self._estimate > self.max_bytes or self._since_scan > self.rescan_bytes:
+            self.evict()
+
+    def _entries(self):
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield st.st_mtime, st.st_size, entry.path
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        # hitung ulang ukuran; jika melewati batas, hapus entri tertua sampai
+        # total <= low_water * max_bytes
+        with _DirectoryLock(os.path.join(self.directory, ".lock")):
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            self._since_scan = 0
+            target = self.max_bytes * self.low_water if total > self.max_bytes else total
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                    self.evictions += 1
+                except OSError:
+                    pass   # sudah dihapus proses lain
+                total -= size
+            self._estimate = total
+
+    def clear(self):
+        for _, _, path in list(self._entries()):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._estimate = 0
+
+
+class _DirectoryLock:
+    def __init__(self, path: str):
+        self.path = path
+        self.fd = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+        except ImportError:   # Windows: eviksi tanpa lock, balapan hanya membuat miss
+            return self
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self.fd is not None:
+            import fcntl
+
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+
+
+class RenderCache:
+    def __init__(self, directory: str = None, memory_entries: int = 4096, memory_bytes: int = 64 << 20,
+                 disk_bytes: int = 1 << 30):
+        self.memory = MemoryTier(memory_entries, memory_bytes)
+        self.disk = DiskTier(directory, disk_bytes) if directory else None
+        self.stats = {name: 0 for name in (
+            "items_memory_hits", "items_disk_hits", "items_misses",
+            "artifact_memory_hits", "artifact_disk_hits", "artifact_misses",
+        )}
+
+    def _get(self, level: str, key: str):
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats[f"{level}_memory_hits"] += 1
+            return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.stats[f"{level}_disk_hits"] += 1
+                self.memory.put(key, value)
+                return value
+        self.stats[f"{level}_misses"] += 1
+        return None
+
+    def _put(self, key: str, value: bytes):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    # tingkat 1: deskripsi ternormalisasi -> JSON item (dump_items)
+    def get_items(self, normalized: str):
+        return self._get("items", "i" + _digest(normalized.encode("utf-8")))
+
+    def put_items(self, normalized: str, data: bytes):
+        self._put("i" + _digest(normalized.encode("utf-8")), data)
+
+    # tingkat 2: items_key + format -> artefak; b"" berarti renderer tidak menghasilkan apa pun
+    def get_artifact(self, key: str, fmt: str):
+        return self._get("artifact", f"a{key}.{fmt}")
+
+    def put_artifact(self, key: str, fmt: str, data: bytes):
+        self._put(f"a{key}.{fmt}", data)
+
+    def snapshot(self):
+        stats = dict(self.stats, memory_entries=len(self.memory), memory_bytes=self.memory.nbytes)
+        if self.disk is not None:
+            stats["disk_evictions"] = self.disk.evictions
+        return stats
+
+
+def parse_cached(cache, description: str):
+    # (JSON item, converter atau None). Parse hanya dijalankan saat tingkat 1 miss;
+    # converter hasil parse itu dikembalikan supaya render berikutnya tidak perlu memuat ulang.
+    from test_teknikal import TextToCADConverter, normalize_description
+
+    normalized = normalize_description(description)
+    data = cache.get_items(normalized)
+    if data is not None:
+        return data, None
+    converter = TextToCADConverter()
+    converter.parse(normalized)
+    data = dump_items(converter.items)
+    cache.put_items(normalized, data)
+    return data, converter
+
+
+def render_cached(cache, data: bytes, fmt: str, converter=None):
+    # (bytes atau None, hit tingkat 2?). Render hanya saat tingkat 2 miss.
+    from cad_export import export_bytes
+    from test_teknikal import TextToCADConverter
+
+    key = items_key(data)
+    artifact = cache.get_artifact(key, fmt)
+    if artifact is not None:
+        return artifact or None, True
+    if converter is None:
+        converter = TextToCADConverter()
+        converter.items = load_items(data)
+    artifact = export_bytes(converter, fmt)
+    cache.put_artifact(key, fmt, artifact or b"")
+    return artifact, False
+
+
+def convert_cached(cache, description: str, fmt: str):
+    # (bytes atau None, jumlah item, hit tingkat 2?) untuk satu deskripsi
+    data, converter = parse_cached(cache, description)
+    artifact, hit = render_cached(cache, data, fmt, converter)
+    return artifact, len(converter.items) if converter is not None else len(json.loads(data)), hit
+
+
+_shared = {}
+
+
+def shared_cache(directory: str = None, memory_bytes: int = 64 << 20, disk_bytes: int = 1 << 30):
+    # satu RenderCache per proses untuk konfigurasi yang sama (dipakai worker pool)
+    key = (directory, memory_bytes, disk_bytes)
+    cache = _shared.get(key)
+    if cache is None:
+        cache = _shared[key] = RenderCache(directory, memory_bytes=memory_bytes, disk_bytes=disk_bytes)
+    return cache
@@ -0,0 +1,291 @@
+import numpy as np
+
+from cad_store import BOX_KINDS, CIRCLE_KINDS, POINT_KINDS, ItemStore
+
+
+# Kolom numerik; NaN berarti properti tersebut tidak ada pada item.
+FIELDS = ("x", "y", "width", "depth", "height", "cx", "cy", "radius")
+KINDS = ("seat", "leg", "room", "door", "window", "rect", "circle")
+SIDES = ("", "north", "south", "east", "west")
+
+# Urutan properti per jenis, supaya `props` hasil konversi sama dengan yang dibuat parser.
+KIND_FIELDS = {
+    "seat": ("x", "y", "width", "depth", "height"),
+    "room": ("x", "y", "width", "depth", "height"),
+    "rect": ("x", "y", "width", "depth", "height"),
+    "leg": ("cx", "cy", "radius", "height"),
+    "circle": ("cx", "cy", "radius", "height"),
+    "door": ("side", "width", "height"),
+    "window": ("side", "width", "height"),
+}
+
+_OTHER_FIELDS = {kind: tuple(f for f in FIELDS if f not in names) for kind, names in KIND_FIELDS.items()}
+
+
+class ItemView:
+    # Tampilan satu baris ItemColumns dengan antarmuka CADItem (`kind`, `props`).
+    __slots__ = ("_columns", "index", "kind", "_props")
+
+    def __init__(self, columns, index: int, kind: str = None):
+        self._columns = columns
+        self.index = index
+        self.kind = kind if kind is not None else columns.kind_name(index)
+        self._props = None
+
+    @property
+    def props(self):
+        if self._props is None:
+            self._props = self._columns.props_of(self.index)
+        return self._props
+
+    def __eq__(self, other):
+        return isinstance(other, ItemView) and other._columns is self._columns and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self._columns), self.index))
+
+    def __repr__(self):
+        return f"ItemView({self.kind!r}, {self.props!r})"
+
+
+class ItemColumns:
+    # Penyimpanan item berbentuk struktur-of-arrays (satu array NumPy per properti).
+    # Memori per item tetap kecil untuk adegan berjuta-juta item, dan perhitungan
+    # bounding box / transformasi berjalan tervektorisasi. Antarmukanya sama dengan
+    # ItemStore sehingga renderer bisa memakai keduanya.
+
+    def __init__(self, size: int = 0, dtype=np.float64, kinds=KINDS):
+        self.kinds_table = list(kinds)
+        self.kind = np.zeros(size, dtype=np.uint8)
+        self.side = np.zeros(size, dtype=np.uint8)
+        self.parent = np.full(size, -1, dtype=np.int64)
+        self.columns = {name: np.full(size, np.nan, dtype=dtype) for name in FIELDS}
+        # properti di luar kolom standar, disimpan jarang: index -> dict
+        self.extra = {}
+        self._children = None
+        # naik pada translate/scale; tulis langsung ke kolom -> panggil touch()
+        self.version = 0
+
+    def __getattr__(self, name):
+        columns = self.__dict__.get("columns")
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    # --- konversi -----------------------------------------------------------
+
+    @classmethod
+    def from_items(cls, items, dtype=np.float64):
+        if not isinstance(items, ItemStore):
+            items = ItemStore(items)
+        cols = cls(len(items), dtype=dtype)
+        index = {}
+        kind_codes = {k: i for i, k in enumerate(cols.kinds_table)}
+        side_codes = {s: i for i, s in enumerate(SIDES)}
+        kind = cols.kind
+        side = cols.side
+        columns = cols.columns
+        for i, item in enumerate(items):
+            index[id(item)] = i
+            code = kind_codes.get(item.kind)
+            if code is None:
+                if len(cols.kinds_table) > 255:
+                    raise ValueError("ItemColumns mendukung paling banyak 256 jenis item")
+                code = kind_codes[item.kind] = len(cols.kinds_table)
+                cols.kinds_table.append(item.kind)
+            kind[i] = code
+            extra = None
+            for key, value in item.props.items():
+                column = columns.get(key)
+                if column is not None and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    column[i] = value
+                elif key == "side" and value in side_codes:
+                    side[i] = side_codes[value]
+                else:
+                    if extra is None:
+                        extra = cols.extra[i] = {}
+                    extra[key] = value
+        for i, item in enumerate(items):
+            parent = items.parent_of(item)
+            if parent is not None:
+                cols.parent[i] = index[id(parent)]
+        return cols
+
+    def to_items(self):
+        from test_teknikal import CADItem
+
+        store = ItemStore()
+        created = []
+        for i in range(len(self)):
+            parent = self.parent[i]
+            item = CADItem(self.kind_name(i), **self.props_of(i))
+            created.append(item)
+            store.append(item, parent=created[parent] if parent >= 0 else None)
+        return store
+
+    def props_of(self, i: int):
+        kind = self.kind_name(i)
+        names = KIND_FIELDS.get(kind, ("side",) + FIELDS)
+        props = {}
+        for name in names:
+            if name == "side":
+                code = self.side[i]
+                if code:
+                    props["side"] = SIDES[code]
+                continue
+            value = self.columns[name][i]
+            if value == value:
+                props[name] = float(value)
+        for name in FIELDS:
+            if name not in props:
+                value = self.columns[name][i]
+                if value == value:
+                    props[name] = float(value)
+        if "side" not in props and self.side[i]:
+            props["side"] = SIDES[self.side[i]]
+        extra = self.extra.get(i)
+        if extra:
+            props.update(extra)
+        return props
+
+    # --- antarmuka ItemStore ------------------------------------------------
+
+    def __len__(self):
+        return len(self.kind)
+
+    def __iter__(self, chunk: int = 4096):
+        # props dibangun per blok dari list Python (tolist), jauh lebih murah daripada
+        # mengindeks array NumPy satu per satu
+        table = self.kinds_table
+        default_names = ("side",) + FIELDS
+        for start in range(0, len(self), chunk):
+            stop = min(start + chunk, len(self))
+            kinds = self.kind[start:stop].tolist()
+            sides = self.side[start:stop].tolist()
+            cols = {name: col[start:stop].tolist() for name, col in self.columns.items()}
+            for j, code in enumerate(kinds):
+                i = start + j
+                kind = table[code]
+                view = ItemView(self, i, kind)
+                props = {}
+                for name in KIND_FIELDS.get(kind, default_names):
+                    if name == "side":
+                        if sides[j]:
+                            props["side"] = SIDES[sides[j]]
+                        continue
+                    value = cols[name][j]
+                    if value == value:
+                        props[name] = value
+                if (kind not in KIND_FIELDS or i in self.extra
+                        or any(cols[name][j] == cols[name][j] for name in _OTHER_FIELDS[kind])):
+                    props = self.props_of(i)
+                view._props = props
+                yield view
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ItemView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return ItemView(self, index)
+
+    def kind_name(self, i: int):
+        return self.kinds_table[self.kind[i]]
+
+    def kind_code(self, kind: str):
+        try:
+            return self.kinds_table.index(kind)
+        except ValueError:
+            return -1
+
+    def mask(self, *kinds):
+        codes = [self.kind_code(k) for k in kinds]
+        return np.isin(self.kind, [c for c in codes if c >= 0])
+
+    def of_kind(self, kind: str):
+        return [ItemView(self, int(i)) for i in np.flatnonzero(self.mask(kind))]
+
+    def first(self, kind: str):
+        idx = np.flatnonzero(self.mask(kind))
+        return ItemView(self, int(idx[0])) if len(idx) else None
+
+    def kinds(self):
+        counts = np.bincount(self.kind, minlength=len(self.kinds_table))
+        return {k: int(c) for k, c in zip(self.kinds_table, counts) if c}
+
+    def parent_of(self, item):
+        parent = self.parent[item.index]
+        return ItemView(self, int(parent)) if parent >= 0 else None
+
+    def children(self, item, kinds=None):
+        if self._children is None:
+            # indeks anak gaya CSR: anak dari induk p ada di order[start[p]:start[p + 1]]
+            order = np.argsort(self.parent, kind="stable")
+            start = np.searchsorted(self.parent[order], np.arange(len(self) + 1))
+            self._children = (order, start)
+        order, start = self._children
+        children = [ItemView(self, int(i)) for i in order[start[item.index]:start[item.index + 1]]]
+        if kinds is None:
+            return children
+        if isinstance(kinds, str):
+            kinds = (kinds,)
+        return [c for c in children if c.kind in kinds]
+
+    # --- geometri tervektorisasi ---------------------------------------------
+
+    def bounds(self, chunk: int = 1 << 16):
+        # sama dengan ItemStore.bounds: kotak memakai x..x+width, lingkaran cx±radius,
+        # kaki hanya titik pusatnya. Dihitung per blok agar array sementara tidak
+        # tumbuh dengan jumlah item.
+        result = None
+        for start in range(0, len(self), chunk):
+            part = self._bounds_slice(slice(start, start + chunk))
+            if part is None:
+                continue
+            if result is None:
+                result = part
+            else:
+                result = (min(result[0], part[0]), min(result[1], part[1]),
+                          max(result[2], part[2]), max(result[3], part[3]))
+        return result
+
+    def _bounds_slice(self, sl):
+        kind = self.kind[sl]
+        box = np.isin(kind, [self.kind_code(k) for k in BOX_KINDS])
+        circle = np.isin(kind, [self.kind_code(k) for k in CIRCLE_KINDS])
+        leg = np.isin(kind, [self.kind_code(k) for k in POINT_KINDS])
+        if not (box.any() or circle.any() or leg.any()):
+            return None
+
+        def _v(name, m):
+            return np.nan_to_num(self.columns[name][sl][m], nan=0.0)
+
+        bx, by = _v("x", box), _v("y", box)
+        bw, bd = _v("width", box), _v("depth", box)
+        cx, cy, r = _v("cx", circle), _v("cy", circle), _v("radius", circle)
+        lx, ly = _v("cx", leg), _v("cy", leg)
+        xs = np.concatenate((bx, bx + bw, cx - r, cx + r, lx))
+        ys = np.concatenate((by, by + bd, cy - r, cy + r, ly))
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+    def translate(self, dx: float, dy: float):
+        for x, y in (("x", "y"), ("cx", "cy")):
+            self.columns[x] += dx
+            self.columns[y] += dy
+        self.version += 1
+        return self
+
+    def scale(self, factor: float):
+        for name in FIELDS:
+            self.columns[name] *= factor
+        self.version += 1
+        return self
+
+    def touch(self):
+        self.version += 1
+
+    def nbytes(self):
+        return (self.kind.nbytes + self.side.nbytes + self.parent.nbytes
+                + sum(col.nbytes for col in self.columns.values()))
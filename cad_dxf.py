@@ -0,0 +1,85 @@
+from collections import Counter
+
+from cad_geometry import Circle, iter_front, iter_top, rect_points
+
+
+FRONT_Y_OFFSET = 320
+
+
+def _block_key(prim):
+    if type(prim) is Circle:
+        return ("circle", prim.role, prim.r)
+    return ("rect", prim.role, prim.w, prim.h)
+
+
+def _block_name(key, index: int):
+    return f"{key[1].upper()}_{key[0].upper()}_{index}"
+
+
+def render_dxf_blocks(geo, target, min_instances: int = 2):
+    # Bagian yang berulang (kaki, pintu, jendela, dudukan berukuran sama, ...) didefinisikan
+    # sekali sebagai BLOCK lalu ditempatkan sebagai INSERT. Bentuk yang hanya muncul sekali
+    # tetap ditulis sebagai entitas biasa. target: path atau stream teks.
+    import ezdxf
+
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    msp.add_text("TAMPAK ATAS", dxfattribs={"height": 5, "insert": (0, -10)})
+    msp.add_text("TAMPAK DEPAN", dxfattribs={"height": 5, "insert": (0, 300)})
+
+    counts = Counter(_block_key(p) for p in geo.top)
+    counts.update(_block_key(p) for p in geo.front)
+    blocks = {}
+
+    def _block(key):
+        name = blocks.get(key)
+        if name is None:
+            name = blocks[key] = _block_name(key, len(blocks))
+            block = doc.blocks.new(name=name)
+            if key[0] == "circle":
+                block.add_circle((0, 0), key[2])
+            else:
+                block.add_lwpolyline(rect_points(0, 0, key[2], key[3]))
+        return name
+
+    def _add(prim, dy=0.0):
+        key = _block_key(prim)
+        if counts[key] >= min_instances:
+            if type(prim) is Circle:
+                msp.add_blockref(_block(key), (prim.cx, prim.cy + dy))
+            else:
+                msp.add_blockref(_block(key), (prim.x, prim.y + dy))
+        elif type(prim) is Circle:
+            msp.add_circle((prim.cx, prim.cy + dy), prim.r)
+        else:
+            msp.add_lwpolyline(rect_points(prim.x, prim.y + dy, prim.w, prim.h))
+
+    for prim in geo.top:
+        _add(prim)
+    for prim in geo.front:
+        _add(prim, FRONT_Y_OFFSET)
+
+    if hasattr(target, "write"):
+        doc.write(target)
+    else:
+        doc.saveas(target)
+    return target
+
+
+def write_dxf_stream(items, target):
+    # DXF R12 yang ditulis langsung entitas demi entitas dengan r12writer dari ezdxf.
+    # Tidak ada dokumen di memori, jadi cocok untuk adegan yang terlalu besar untuk
+    # dibangun utuh. target: path atau stream teks/biner.
+    from ezdxf.addons import r12writer
+
+    with r12writer(target) as dxf:
+        dxf.add_text("TAMPAK ATAS", insert=(0, -10), height=5)
+        dxf.add_text("TAMPAK DEPAN", insert=(0, 300), height=5)
+        for prim in iter_top(items):
+            if type(prim) is Circle:
+                dxf.add_circle((prim.cx, prim.cy), prim.r)
+            else:
+                dxf.add_polyline_2d(rect_points(prim.x, prim.y, prim.w, prim.h))
+        for prim in iter_front(items):
+            dxf.add_polyline_2d(rect_points(prim.x, prim.y + FRONT_Y_OFFSET, prim.w, prim.h))
+    return target
@@ -0,0 +1,176 @@
+import io
+import os
+import time
+from typing import NamedTuple
+
+from cad_metrics import EventList, emit, enabled, recording
+
+
+WRITERS = {
+    "dxf": "render_dxf", "svg": "render_svg", "obj": "export_obj_extrude",
+    "stl": "export_stl", "glb": "export_glb",
+}
+# format 3D yang membutuhkan numpy/trimesh
+MESH_FORMATS = {"obj", "stl", "glb"}
+
+# ezdxf dan svgwrite murni Python sehingga tertahan GIL -> proses terpisah;
+# format biner ditulis ke stream biner, sisanya ke stream teks (UTF-8)
+BINARY_FORMATS = {"stl", "glb"}
+MEDIA_TYPES = {
+    "dxf": "image/vnd.dxf", "svg": "image/svg+xml", "obj": "model/obj",
+    "stl": "model/stl", "glb": "model/gltf-binary",
+}
+
+# mesh 3D dibangun di NumPy -> cukup thread.
+DEFAULT_MODES = {"dxf": "process", "svg": "process", "obj": "thread", "stl": "thread", "glb": "thread"}
+
+
+# mkstemp membuat berkas 0600; berkas output yang dipindah ke tempatnya memakai mode biasa
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def publish(tmp: str, target: str):
+    # berkas sementara (mkstemp) -> target, dengan mode 0666 & ~umask seperti open()
+    os.chmod(tmp, 0o666 & ~_UMASK)
+    os.replace(tmp, target)
+
+
+class ExportResult(NamedTuple):
+    format: str
+    path: str
+    ok: bool
+    error: str
+    seconds: float
+
+
+def export_one(converter, fmt: str, path: str):
+    start = time.perf_counter()
+    try:
+        out = getattr(converter, WRITERS[fmt])(path)
+    except Exception as e:
+        return ExportResult(fmt, None, False, f"{type(e).__name__}: {e}", time.perf_counter() - start)
+    if not out:
+        return ExportResult(fmt, None, False, "tidak ada output", time.perf_counter() - start)
+    return ExportResult(fmt, out, True, None, time.perf_counter() - start)
+
+
+def _export_collected(converter, fmt: str, path: str):
+    # di proses worker: sink warisan dari induk (fork) dilepas, event dikumpulkan lalu
+    # dikirim balik bersama hasilnya supaya dicatat oleh sink proses induk
+    import cad_metrics
+
+    del cad_metrics._sinks[:]
+    with recording(EventList()) as events:
+        result = export_one(converter, fmt, path)
+    return result, list(events)
+
+
+def _export_shared(factory, name: str, fmt: str, path: str, collect: bool):
+    # di proses worker (transport "shm"): item dibaca langsung dari blok shared memory
+    # tanpa unpickle, geometri dibangun di sini dari kolomnya
+    from cad_shm import SharedScene
+
+    scene = SharedScene.attach(name)
+    converter = factory()
+    converter.items = scene.items
+    try:
+        return _export_collected(converter, fmt, path) if collect else export_one(converter, fmt, path)
+    finally:
+        converter = None
+        scene.close()
+
+
+def export_bytes(converter, fmt: str):
+    # Render satu format ke memori, tanpa file sementara. Hasil bytes, atau None jika
+    # renderer tidak menghasilkan apa pun (mis. tidak ada solid untuk format 3D).
+    if fmt not in WRITERS:
+        raise ValueError(f"format tidak dikenal: {fmt}")
+    buf = io.BytesIO() if fmt in BINARY_FORMATS else io.StringIO()
+    if not getattr(converter, WRITERS[fmt])(buf):
+        return None
+    data = buf.getvalue()
+    return data if fmt in BINARY_FORMATS else data.encode("utf-8")
+
+
+def export_formats(converter, basename: str, formats=tuple(WRITERS), mode: str = "auto", max_workers: int = None,
+                   transport: str = "pickle"):
+    # Tulis beberapa format sekaligus. mode: "auto" (DEFAULT_MODES, thread saja jika hanya
+    # ada satu CPU), "thread", "process" atau "serial". Kegagalan satu format tidak
+    # menghentikan format lain; hasil dikembalikan per format beserta waktunya.
+    # transport: cara item sampai ke proses worker. "pickle" mengirim converter beserta
+    # geometrinya; "shm" menaruh item sekali di shared memory (cad_shm) dan worker hanya
+    # menerima nama bloknya, lalu membangun geometri sendiri.
+    unknown = [fmt for fmt in formats if fmt not in WRITERS]
+    if unknown:
+        raise ValueError(f"format tidak dikenal: {', '.join(unknown)}")
+    if transport not in ("pickle", "shm"):
+        raise ValueError(f"transport tidak dikenal: {transport}")
+
+    paths = {fmt: f"{basename}.{fmt}" for fmt in formats}
+    if mode == "serial" or len(formats) <= 1:
+        converter.geometry()
+        return {fmt: export_one(converter, fmt, paths[fmt]) for fmt in formats}
+
+    if mode == "auto":
+        single_cpu = (os.cpu_count() or 1) <= 1
+        modes = {fmt: "thread" if single_cpu else DEFAULT_MODES.get(fmt, "thread") for fmt in formats}
+    elif mode in ("thread", "process"):
+        modes = {fmt: mode for fmt in formats}
+    else:
+        raise ValueError(f"mode tidak dikenal: {mode}")
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    by_mode = {}
+    for fmt in formats:
+        by_mode.setdefault(modes[fmt], []).append(fmt)
+
+    shared = transport == "shm" and "process" in by_mode
+    if not shared or "thread" in by_mode:
+        # geometri dihitung sekali di sini, lalu dibagi ke thread / ikut dikirim ke proses
+        converter.geometry()
+
+    futures = {}
+    executors = []
+    scene = None
+    try:
+        if shared:
+            from cad_shm import SharedScene
+
+            scene = SharedScene.create(converter.items)
+        for kind, fmts in by_mode.items():
+            workers = max_workers or len(fmts)
+            executor = ProcessPoolExecutor(workers) if kind == "process" else ThreadPoolExecutor(workers)
+            executors.append(executor)
+            collect = kind == "process" and enabled()
+            for fmt in fmts:
+                if kind == "process" and shared:
+                    futures[fmt] = executor.submit(_export_shared, type(converter), scene.name, fmt, paths[fmt],
+                                                   collect)
+                else:
+                    futures[fmt] = executor.submit(_export_collected if collect else export_one,
+                                                   converter, fmt, paths[fmt])
+
+        results = {}
+        for fmt in formats:
+            try:
+                result = futures[fmt].result()
+                if not isinstance(result, ExportResult):
+                    result, events = result
+                    for event in events:
+                        emit(event)
+                results[fmt] = result
+            except Exception as e:
+                # mis. proses worker mati atau converter gagal dipickle
+                results[fmt] = ExportResult(fmt, None, False, f"{type(e).__name__}: {e}", 0.0)
+        return results
+    finally:
+        for executor in executors:
+            executor.shutdown(wait=True)
+        if scene is not None:
+            # semua worker sudah selesai (shutdown menunggu), blok aman di-unlink
+            try:
+                scene.close()
+            finally:
+                scene.unlink()
@@ -0,0 +1,341 @@
+from typing import NamedTuple
+
+
+# Representasi geometri antara (IR) yang dihitung sekali per adegan lalu diserialisasi
+# oleh backend DXF, SVG dan OBJ. Koordinat dalam cm.
+#
+# - tampak atas: bidang x/y seperti pada item.
+# - tampak depan: x sama dengan tampak atas, y diukur dari garis atas tampak depan
+#   (dudukan 0..5, kaki di bawahnya). DXF menggeser y ini +320, SVG menerjemahkan grupnya.
+# - solid: ekstrusi 3D, z = 0 di lantai.
+
+SEAT_THICKNESS = 5.0
+SHELF_BOARD = 2.0
+OPENING_FRONT_Y = 50.0
+WALL_THICKNESS = 1.0
+WINDOW_SILL = 90.0
+DEFAULT_HEIGHT = {"door": 210.0, "window": 120.0}
+
+
+class Rect(NamedTuple):
+    x: float
+    y: float
+    w: float
+    h: float
+    role: str = "outline"   # "outline", "door", "window", "leg"
+
+
+class Circle(NamedTuple):
+    cx: float
+    cy: float
+    r: float
+    role: str = "outline"   # "outline" atau "leg" (diisi penuh)
+
+
+class Box(NamedTuple):
+    x: float
+    y: float
+    z: float
+    w: float
+    d: float
+    h: float
+    role: str = "solid"
+
+
+class Cylinder(NamedTuple):
+    cx: float
+    cy: float
+    z: float
+    r: float
+    h: float
+    role: str = "solid"
+
+
+class SceneGeometry(NamedTuple):
+    top: list
+    front: list
+    solids: list
+    bounds: tuple   # (minx, miny, maxx, maxy) tampak atas, atau None
+
+
+def rect_points(x: float, y: float, w: float, h: float):
+    return [(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]
+
+
+def _box_props(item, default_w=0.0, default_d=0.0):
+    p = item.props
+    return p.get("x", 0.0), p.get("y", 0.0), p.get("width", default_w), p.get("depth", default_d)
+
+
+def _room_props(room):
+    return _box_props(room, 400.0, 500.0)
+
+
+def _opening_room(items, item):
+    return items.parent_of(item) or items.first("room")
+
+
+def _opening_wall(items, item):
+    # posisi bukaan di dinding ruangan: (x, y, w, h) tampak atas, atau None tanpa ruangan
+    room = _opening_room(items, item)
+    if room is None:
+        return None
+    rx, ry, rw, rd = _room_props(room)
+    side = item.props.get("side", "south")
+    w = item.props.get("width", 90.0)
+    half = WALL_THICKNESS / 2
+    if side == "north":
+        return rx + (rw - w) / 2, ry - half, w, WALL_THICKNESS
+    if side == "south":
+        return rx + (rw - w) / 2, ry + rd - half, w, WALL_THICKNESS
+    if side == "west":
+        return rx - half, ry + (rd - w) / 2, WALL_THICKNESS, w
+    if side == "east":
+        return rx + rw - half, ry + (rd - w) / 2, WALL_THICKNESS, w
+    return None
+
+
+# --- tampak atas ---------------------------------------------------------------
+
+def _top_box(items, item):
+    x, y, w, d = _room_props(item) if item.kind == "room" else _box_props(item)
+    return [Rect(x, y, w, d)]
+
+
+def _top_circle(items, item):
+    p = item.props
+    return [Circle(p.get("cx", 0.0), p.get("cy", 0.0), p.get("radius", 1.0))]
+
+
+def _top_leg(items, item):
+    p = item.props
+    return [Circle(p.get("cx", 0.0), p.get("cy", 0.0), p.get("radius", 1.0), "leg")]
+
+
+def _top_opening(items, item):
+    wall = _opening_wall(items, item)
+    return [Rect(*wall, item.kind)] if wall else []
+
+
+# --- tampak depan ----------------------------------------------------------------
+
+def _front_seat(items, item):
+    x, _, w, _ = _box_props(item)
+    return [Rect(x, 0.0, w, SEAT_THICKNESS)]
+
+
+def _front_rect(items, item):
+    x, _, w, _ = _box_props(item)
+    return [Rect(x, 0.0, w, item.props.get("height", 30.0))]
+
+
+def _front_room(items, item):
+    x, _, w, _ = _room_props(item)
+    return [Rect(x, 0.0, w, item.props.get("height", 300.0))]
+
+
+def _front_shelf(items, item):
+    # rangka luar + papan di antara tiap tingkat
+    x, _, w, _ = _box_props(item)
+    h = item.props.get("height", 180.0)
+    levels = max(int(item.props.get("levels", 1)), 1)
+    out = [Rect(x, 0.0, w, h)]
+    for i in range(1, levels):
+        out.append(Rect(x, i * (h - SHELF_BOARD) / levels, w, SHELF_BOARD))
+    return out
+
+
+def _front_leg(items, item):
+    # kaki hanya tergambar di bawah dudukannya
+    seat = items.parent_of(item)
+    if seat is None:
+        return []
+    p = item.props
+    r = p.get("radius", 1.0)
+    lh = p.get("height", seat.props.get("height", 45.0))
+    return [Rect(p.get("cx", 0.0) - r, SEAT_THICKNESS, r * 2, lh, "leg")]
+
+
+def _front_opening(items, item):
+    room = items.parent_of(item)
+    if room is None:
+        return []
+    x, _, w, _ = _room_props(room)
+    ww = item.props.get("width", 90.0)
+    wh = item.props.get("height", DEFAULT_HEIGHT[item.kind])
+    return [Rect(x + w / 2 - ww / 2, OPENING_FRONT_Y, ww, wh, item.kind)]
+
+
+# --- solid 3D --------------------------------------------------------------------
+
+def _wall_pieces(length: float, height: float, openings):
+    # Potong dinding sepanjang `length` setinggi `height` di sekitar bukaan (u0, u1, z0, z1).
+    # Hasil: daftar (u0, u1, z0, z1) padat; potongan bersebelahan dengan profil z yang sama
+    # digabung kembali.
+    cuts = {0.0, length}
+    for u0, u1, _, _ in openings:
+        cuts.update((min(max(u0, 0.0), length), min(max(u1, 0.0), length)))
+    cuts = sorted(cuts)
+    merged = []
+    for a, b in zip(cuts, cuts[1:]):
+        holes = sorted((max(z0, 0.0), min(z1, height)) for u0, u1, z0, z1 in openings
+                       if u0 < b and u1 > a and z1 > z0)
+        solid = []
+        z = 0.0
+        for z0, z1 in holes:
+            if z0 > z:
+                solid.append((z, z0))
+            z = max(z, z1)
+        if z < height:
+            solid.append((z, height))
+        if merged and merged[-1][2] == solid:
+            merged[-1] = (merged[-1][0], b, solid)
+        else:
+            merged.append((a, b, solid))
+    return [(a, b, z0, z1) for a, b, solid in merged for z0, z1 in solid]
+
+
+def room_walls(x: float, y: float, w: float, d: float, h: float, openings=()):
+    # empat dinding ruangan; openings: (kind, side, width, height) menjadi lubang di dindingnya
+    t = WALL_THICKNESS
+    holes = {"north": [], "south": [], "west": [], "east": []}
+    for kind, side, ow, oh in openings:
+        if side not in holes:
+            continue
+        z0 = WINDOW_SILL if kind == "window" else 0.0
+        u0 = ((w if side in ("north", "south") else d) - ow) / 2
+        holes[side].append((u0, u0 + ow, z0, z0 + oh))
+
+    out = []
+    for side, (wx, wy, length, along_x) in (("north", (x, y, w, True)), ("south", (x, y + d, w, True)),
+                                            ("west", (x, y, d, False)), ("east", (x + w, y, d, False))):
+        for u0, u1, z0, z1 in _wall_pieces(length, h, holes[side]):
+            if along_x:
+                out.append(Box(wx + u0, wy - t / 2, z0, u1 - u0, t, z1 - z0, "wall"))
+            else:
+                out.append(Box(wx - t / 2, wy + u0, z0, t, u1 - u0, z1 - z0, "wall"))
+    return out
+
+
+def room_openings(items, room):
+    return [(child.kind, child.props.get("side", "south"), child.props.get("width", 90.0),
+             child.props.get("height", DEFAULT_HEIGHT[child.kind]))
+            for child in items.children(room, ("door", "window"))]
+
+
+def _solid_room(items, item):
+    x, y, w, d = _room_props(item)
+    return room_walls(x, y, w, d, item.props.get("height", 300.0), room_openings(items, item))
+
+
+def _solid_box(items, item):
+    x, y, w, d = _box_props(item)
+    h = item.props.get("height", 10.0)
+    if items.children(item, "leg"):
+        # dudukan / meja berkaki: papan setebal SEAT_THICKNESS di atas kaki
+        return [Box(x, y, h - SEAT_THICKNESS, w, d, SEAT_THICKNESS)]
+    return [Box(x, y, 0.0, w, d, h)]
+
+
+def _solid_shelf(items, item):
+    # dua sisi tegak + papan alas, papan antara tiap tingkat dan papan atas
+    x, y, w, d = _box_props(item)
+    h = item.props.get("height", 180.0)
+    levels = max(int(item.props.get("levels", 1)), 1)
+    t = SHELF_BOARD
+    out = [Box(x, y, 0.0, t, d, h), Box(x + w - t, y, 0.0, t, d, h)]
+    for i in range(levels + 1):
+        out.append(Box(x + t, y, i * (h - t) / levels, w - 2 * t, d, t))
+    return out
+
+
+def _solid_circle(items, item):
+    p = item.props
+    return [Cylinder(p.get("cx", 0.0), p.get("cy", 0.0), 0.0, p.get("radius", 1.0), p.get("height", 10.0))]
+
+
+def _solid_leg(items, item):
+    p = item.props
+    seat = items.parent_of(item)
+    h = p.get("height", 10.0) - (SEAT_THICKNESS if seat is not None else 0.0)
+    return [Cylinder(p.get("cx", 0.0), p.get("cy", 0.0), 0.0, p.get("radius", 1.0), h, "leg")]
+
+
+def _solid_opening(items, item):
+    # bukaan milik sebuah ruangan sudah menjadi lubang di dindingnya (_solid_room);
+    # hanya bukaan tanpa induk yang digambar sebagai panel
+    if items.parent_of(item) is not None:
+        return []
+    wall = _opening_wall(items, item)
+    if wall is None:
+        return []
+    x, y, w, d = wall
+    h = item.props.get("height", DEFAULT_HEIGHT[item.kind])
+    z = WINDOW_SILL if item.kind == "window" else 0.0
+    return [Box(x, y, z, w, d, h, item.kind)]
+
+
+TOP = {
+    "seat": _top_box, "rect": _top_box, "room": _top_box, "table": _top_box, "shelf": _top_box,
+    "circle": _top_circle, "leg": _top_leg,
+    "door": _top_opening, "window": _top_opening,
+}
+FRONT = {
+    "seat": _front_seat, "rect": _front_rect, "room": _front_room, "table": _front_seat, "shelf": _front_shelf,
+    "leg": _front_leg, "door": _front_opening, "window": _front_opening,
+}
+SOLIDS = {
+    "seat": _solid_box, "rect": _solid_box, "room": _solid_room, "table": _solid_box, "shelf": _solid_shelf,
+    "circle": _solid_circle, "leg": _solid_leg,
+    "door": _solid_opening, "window": _solid_opening,
+}
+
+
+def register_kind(kind: str, top=None, front=None, solid=None):
+    # Hook renderer untuk jenis item baru. Setiap hook: fn(items, item) -> daftar primitif
+    # (Rect/Circle untuk tampak atas dan depan, Box/Cylinder untuk solid 3D); DXF, SVG
+    # dan mesh semuanya membaca IR ini.
+    for table, fn in ((TOP, top), (FRONT, front), (SOLIDS, solid)):
+        if fn is not None:
+            table[kind] = fn
+
+
+def _primitives(table, items, item):
+    fn = table.get(item.kind)
+    return fn(items, item) if fn else []
+
+
+def top_view(items, item):
+    return _primitives(TOP, items, item)
+
+
+def front_view(items, item):
+    return _primitives(FRONT, items, item)
+
+
+def solids(items, item):
+    return _primitives(SOLIDS, items, item)
+
+
+def iter_top(items):
+    for item in items:
+        yield from top_view(items, item)
+
+
+def iter_front(items):
+    for item in items:
+        yield from front_view(items, item)
+
+
+def iter_solids(items):
+    for item in items:
+        yield from solids(items, item)
+
+
+def build_geometry(items):
+    top, front, solid = [], [], []
+    for item in items:
+        top.extend(top_view(items, item))
+        front.extend(front_view(items, item))
+        solid.extend(solids(items, item))
+    return SceneGeometry(top, front, solid, items.bounds())
@@ -0,0 +1,271 @@
+from typing import NamedTuple
+
+from cad_geometry import Circle, front_view, rect_points, top_view
+from cad_metrics import instrumented, span
+
+
+# Render ulang inkremental untuk deskripsi yang diedit berulang kali (mis. hanya tinggi
+# dudukan yang diubah, atau satu jendela ditambah). EditSession menyimpan item terakhir,
+# dokumen ezdxf dan pohon elemen svgwrite; setiap update() mem-parse deskripsi baru,
+# mencocokkan item lewat kunci stabil lalu hanya menambah, mengubah atau menghapus entitas
+# milik item yang berbeda. Membangun entitas sebanding dengan besar perubahan; yang tetap
+# sebanding dengan ukuran adegan hanya penulisan file dan penyaringan list saat menghapus.
+#
+#   session = EditSession()
+#   session.update("Kursi dengan 4 kaki, dudukan 40x40, tinggi 45")
+#   session.render_dxf("kursi.dxf"); session.render_svg("kursi.svg")
+#   session.update("Kursi dengan 4 kaki, dudukan 40x40, tinggi 50")   # hanya kaki & dudukan
+#   session.render_dxf("kursi.dxf"); session.render_svg("kursi.svg")
+
+
+def item_keys(items):
+    # Kunci stabil per item: "<kunci induk>/<jenis>#<urutan di antara saudara sejenis>",
+    # mis. "room#0/window#1" atau "seat#12/leg#3". Kunci tidak bergantung pada nilai props,
+    # jadi item yang hanya berubah ukurannya tetap dikenali sebagai item yang sama.
+    keys = {}
+    counters = {}
+    for item in items:
+        parent = items.parent_of(item)
+        prefix = keys[parent] + "/" if parent is not None else ""
+        n = counters.get((prefix, item.kind), 0)
+        counters[(prefix, item.kind)] = n + 1
+        keys[item] = f"{prefix}{item.kind}#{n}"
+    return keys
+
+
+def _fingerprint(item):
+    return item.kind, tuple(sorted(item.props.items()))
+
+
+class ItemDiff(NamedTuple):
+    added: list
+    removed: list
+    changed: list
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+class _View:
+    # Satu dokumen keluaran yang dipertahankan antar edit. parts: kunci -> [primitif atas,
+    # primitif depan, entitas atas, entitas depan]. Subkelas: add, modify, remove, frame, write.
+
+    def build(self, items, keys):
+        self.parts = {}
+        # urutan sama dengan render penuh: semua tampak atas dulu, lalu tampak depan
+        for key, item in keys.items():
+            prims = top_view(items, item)
+            self.parts[key] = [prims, None, [self.add(p, "top") for p in prims], None]
+        for key, item in keys.items():
+            prims = front_view(items, item)
+            part = self.parts[key]
+            part[1] = prims
+            part[3] = [self.add(p, "front") for p in prims]
+        self.frame(items.bounds())
+
+    def patch(self, items, keys, dirty, removed):
+        drop = []
+        for key in removed:
+            part = self.parts.pop(key, None)
+            if part is not None:
+                drop.extend(part[2])
+                drop.extend(part[3])
+        for key in dirty:
+            item = keys[key]
+            views = (top_view(items, item), front_view(items, item))
+            part = self.parts.get(key)
+            if part is None:
+                self.parts[key] = [views[0], views[1], [self.add(p, "top") for p in views[0]],
+                                   [self.add(p, "front") for p in views[1]]]
+                continue
+            for i, (prims, view) in enumerate(zip(views, ("top", "front"))):
+                old = part[i]
+                if prims == old:
+                    continue
+                if len(prims) == len(old) and all(type(a) is type(b) and a.role == b.role
+                                                  for a, b in zip(prims, old)):
+                    for entity, prim in zip(part[i + 2], prims):
+                        self.modify(entity, prim, view)
+                else:
+                    drop.extend(part[i + 2])
+                    part[i + 2] = [self.add(p, view) for p in prims]
+                part[i] = prims
+        if drop:
+            self.remove(drop)
+        self.frame(items.bounds())
+
+
+class _DxfView(_View):
+    FRONT_Y = 320
+
+    def __init__(self, items, keys):
+        import ezdxf
+
+        self.doc = ezdxf.new("R2010")
+        self.msp = self.doc.modelspace()
+        self.msp.add_text("TAMPAK ATAS", dxfattribs={"height": 5, "insert": (0, -10)})
+        self.msp.add_text("TAMPAK DEPAN", dxfattribs={"height": 5, "insert": (0, 300)})
+        self.build(items, keys)
+
+    def add(self, prim, view):
+        if view == "front":
+            return self.msp.add_lwpolyline(rect_points(prim.x, self.FRONT_Y + prim.y, prim.w, prim.h))
+        if type(prim) is Circle:
+            return self.msp.add_circle((prim.cx, prim.cy), prim.r)
+        return self.msp.add_lwpolyline(rect_points(prim.x, prim.y, prim.w, prim.h))
+
+    def modify(self, entity, prim, view):
+        if view == "front":
+            entity.set_points(rect_points(prim.x, self.FRONT_Y + prim.y, prim.w, prim.h))
+        elif type(prim) is Circle:
+            entity.dxf.center = (prim.cx, prim.cy)
+            entity.dxf.radius = prim.r
+        else:
+            entity.set_points(rect_points(prim.x, prim.y, prim.w, prim.h))
+
+    def remove(self, entities):
+        # hapus dari database satu per satu (O(1)), lalu satu kali purge entity space
+        db = self.doc.entitydb
+        for entity in entities:
+            db.delete_entity(entity)
+        self.msp.purge()
+
+    def frame(self, bounds):
+        pass
+
+    def write(self, target):
+        if hasattr(target, "write"):
+            self.doc.write(target)
+        else:
+            self.doc.saveas(target)
+
+
+class _SvgView(_View):
+
+    def __init__(self, items, keys):
+        import svgwrite
+
+        self.dwg = dwg = svgwrite.Drawing(None)
+        self.top = dwg.add(dwg.g(id="top_view"))
+        self.top.add(dwg.text("TAMPAK ATAS", insert=(0, -10), font_size="14px", font_weight="bold"))
+        self.front = dwg.add(dwg.g(id="front_view"))
+        self.front.add(dwg.text("TAMPAK DEPAN", insert=(0, -10), font_size="14px", font_weight="bold"))
+        self.build(items, keys)
+
+    def add(self, prim, view):
+        dwg = self.dwg
+        if view == "front":
+            return self.front.add(dwg.rect(insert=(prim.x, prim.y), size=(prim.w, prim.h), fill="none",
+                                           stroke="black", stroke_width=2))
+        if type(prim) is Circle:
+            if prim.role == "leg":
+                return self.top.add(dwg.circle(center=(prim.cx, prim.cy), r=prim.r, fill="black"))
+            return self.top.add(dwg.circle(center=(prim.cx, prim.cy), r=prim.r, fill="none", stroke="black",
+                                           stroke_width=2))
+        return self.top.add(dwg.rect(insert=(prim.x, prim.y), size=(prim.w, prim.h), fill="none",
+                                     stroke="black", stroke_width=2))
+
+    def modify(self, element, prim, view):
+        if type(prim) is Circle:
+            element.attribs.update(cx=prim.cx, cy=prim.cy, r=prim.r)
+        else:
+            element.attribs.update(x=prim.x, y=prim.y, width=prim.w, height=prim.h)
+
+    def remove(self, elements):
+        gone = {id(e) for e in elements}
+        for group in (self.top, self.front):
+            group.elements = [e for e in group.elements if id(e) not in gone]
+
+    def frame(self, bounds):
+        # ukuran kanvas dan translasi grup seperti render_svg
+        minx, miny, maxx, maxy = 0, 0, 800, 600
+        if bounds:
+            minx, maxx = bounds[0] - 20, bounds[2] + 20
+            miny, maxy = bounds[1] - 20, bounds[3] + 20
+        self.dwg.attribs["width"] = f"{int(max(800, maxx - minx + 200))}px"
+        self.dwg.attribs["height"] = f"{int(max(600, maxy - miny + 600))}px"
+        self.top.attribs["transform"] = f"translate({50 - minx}, {50 - miny})"
+        self.front.attribs["transform"] = f"translate({50 - minx}, {maxy - miny + 120})"
+
+    def write(self, target):
+        if hasattr(target, "write"):
+            self.dwg.write(target)
+        else:
+            self.dwg.saveas(target)
+
+
+_VIEWS = {"dxf": _DxfView, "svg": _SvgView}
+
+
+class EditSession:
+
+    def __init__(self):
+        self.converter = None
+        self.keys = {}          # kunci -> item adegan sekarang
+        self._prints = {}       # kunci -> sidik props untuk diff
+        self._views = {}        # "dxf"/"svg" -> _View yang sudah dibangun
+        self.diff = None
+
+    @property
+    def items(self):
+        return self.converter.items if self.converter is not None else []
+
+    def update(self, description: str):
+        from test_teknikal import TextToCADConverter
+
+        converter = TextToCADConverter()
+        converter.parse(description)
+        return self.apply(converter)
+
+    def apply(self, converter):
+        # ganti adegan dengan hasil parse baru dan tambal dokumen yang sudah dibangun
+        items = converter.items
+        by_item = item_keys(items)
+        keys = {key: item for item, key in by_item.items()}
+        prints = {key: _fingerprint(item) for key, item in keys.items()}
+        old = self._prints
+        added = [key for key in keys if key not in old]
+        removed = [key for key in old if key not in keys]
+        changed = [key for key, fp in prints.items() if key in old and old[key] != fp]
+        self.diff = diff = ItemDiff(added, removed, changed)
+
+        # primitif anak bergantung pada induknya (kaki <- dudukan, bukaan <- ruangan),
+        # dan induk perlu digambar ulang jika anaknya bertambah/berkurang
+        dirty = set(added) | set(changed)
+        for key in changed:
+            dirty.update(by_item[child] for child in items.children(keys[key]))
+        for key in added + removed:
+            if "/" in key:
+                dirty.add(key.rsplit("/", 1)[0])
+        dirty.intersection_update(keys)
+
+        with span("incremental.patch"):
+            for view in self._views.values():
+                view.patch(items, keys, [key for key in keys if key in dirty], removed)
+        self.converter, self.keys, self._prints = converter, keys, prints
+        return diff
+
+    def build(self, *formats):
+        # bangun dokumen sekarang tanpa menulis, agar edit pertama sudah berupa tambalan
+        for fmt in formats:
+            self._view(fmt, _VIEWS[fmt])
+
+    def _view(self, name, cls):
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = cls(self.items, self.keys)
+        return view
+
+    @instrumented("render_dxf_incremental", output=True)
+    def render_dxf(self, target):
+        view = self._view("dxf", _DxfView)
+        with span("dxf.write"):
+            view.write(target)
+        return target
+
+    @instrumented("render_svg_incremental", output=True)
+    def render_svg(self, target):
+        view = self._view("svg", _SvgView)
+        with span("svg.write"):
+            view.write(target)
+        return target
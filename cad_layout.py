@@ -0,0 +1,113 @@
+import re
+
+
+# Penempatan banyak benda di dalam ruangan ("ruangan 20x30 m dengan 200 kursi dan 10 meja").
+# Benda diletakkan baris demi baris dari sudut ruangan; setiap kandidat diperiksa terhadap
+# benda yang sudah ada dan area bebas di depan pintu lewat SpatialHash, jadi biaya per benda
+# tetap konstan dan seluruh penempatan ~O(n), bukan O(n^2) seperti memeriksa semua pasangan.
+# Koordinat dalam cm, kotak = (x0, y0, x1, y1) tampak atas.
+
+GAP = 60.0              # jarak minimal antar benda (jalan lewat)
+ROW_AISLE = 90.0        # jarak antar baris pada tata letak baris
+WALL_CLEARANCE = 50.0   # jarak benda ke dinding
+DOOR_CLEARANCE = 100.0  # area bebas di depan pintu, diukur ke dalam ruangan
+
+_ROWS = re.compile(r"(?<![a-z])(?:ber)?baris|(?<![a-z])rows?(?![a-z])")
+
+
+def wants_rows(text: str):
+    # "200 kursi berbaris" / "in rows": baris dengan lorong, bukan grid rapat
+    return _ROWS.search(text) is not None
+
+
+class SpatialHash:
+    # Hash grid seragam untuk kotak sejajar sumbu. Kotak didaftarkan ke semua sel yang
+    # disentuhnya; query hanya memeriksa kotak di sel yang sama, sehingga biayanya tidak
+    # bergantung pada jumlah kotak selama ukuran sel sebanding dengan ukuran benda.
+
+    def __init__(self, cell: float):
+        self.cell = float(cell)
+        self.boxes = []
+        self.cells = {}
+
+    def _cells(self, box):
+        c = self.cell
+        for gx in range(int(box[0] // c), int(box[2] // c) + 1):
+            for gy in range(int(box[1] // c), int(box[3] // c) + 1):
+                yield gx, gy
+
+    def insert(self, box):
+        i = len(self.boxes)
+        self.boxes.append(box)
+        for key in self._cells(box):
+            self.cells.setdefault(key, []).append(i)
+        return i
+
+    def query(self, box):
+        # indeks kotak yang beririsan dengan box (bersentuhan di tepi tidak dihitung)
+        seen = set()
+        x0, y0, x1, y1 = box
+        for key in self._cells(box):
+            for i in self.cells.get(key, ()):
+                if i in seen:
+                    continue
+                seen.add(i)
+                b = self.boxes[i]
+                if b[0] < x1 and x0 < b[2] and b[1] < y1 and y0 < b[3]:
+                    yield i
+
+    def __len__(self):
+        return len(self.boxes)
+
+
+def interior(room, clearance: float = WALL_CLEARANCE):
+    p = room.props
+    x, y = p.get("x", 0.0), p.get("y", 0.0)
+    return (x + clearance, y + clearance,
+            x + p.get("width", 0.0) - clearance, y + p.get("depth", 0.0) - clearance)
+
+
+def door_zones(items, room, depth: float = DOOR_CLEARANCE):
+    # area di dalam ruangan tepat di depan setiap pintu yang harus tetap kosong
+    p = room.props
+    rx, ry, rw, rd = p.get("x", 0.0), p.get("y", 0.0), p.get("width", 0.0), p.get("depth", 0.0)
+    zones = []
+    for door in items.children(room, "door"):
+        w = door.props.get("width", 90.0)
+        side = door.props.get("side", "south")
+        if side == "north":
+            zones.append((rx + (rw - w) / 2, ry, rx + (rw + w) / 2, ry + depth))
+        elif side == "south":
+            zones.append((rx + (rw - w) / 2, ry + rd - depth, rx + (rw + w) / 2, ry + rd))
+        elif side == "west":
+            zones.append((rx, ry + (rd - w) / 2, rx + depth, ry + (rd + w) / 2))
+        elif side == "east":
+            zones.append((rx + rw - depth, ry + (rd - w) / 2, rx + rw, ry + (rd + w) / 2))
+    return zones
+
+
+def place(index, region, size, count: int, gap: float = GAP, row_gap: float = None, start_y: float = None):
+    # Posisi (x, y) sudut kiri-atas untuk maksimal `count` benda berukuran size=(w, d) di dalam
+    # region, baris demi baris mulai dari start_y. Benda berjarak minimal `gap` dari semua kotak
+    # di index (benda lain, area pintu) dan langsung didaftarkan ke index. row_gap: jarak antar
+    # baris (default gap). Hasil: (daftar posisi, y baris terakhir) untuk jenis benda berikutnya.
+    x0, y0, x1, y1 = region
+    w, d = size
+    pitch = d + (gap if row_gap is None else row_gap)
+    out = []
+    y = y0 if start_y is None else start_y
+    last = y
+    while y + d <= y1 and len(out) < count:
+        x = x0
+        while x + w <= x1 and len(out) < count:
+            hits = list(index.query((x - gap, y - gap, x + w + gap, y + d + gap)))
+            if hits:
+                # lompat ke kanan penghalang terjauh: setiap lompatan melewati minimal satu kotak
+                x = max(index.boxes[i][2] for i in hits) + gap
+                continue
+            index.insert((x, y, x + w, y + d))
+            out.append((x, y))
+            last = y
+            x += w + gap
+        y += pitch
+    return out, last
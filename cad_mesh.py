@@ -0,0 +1,346 @@
+import numpy as np
+
+from cad_columns import SIDES
+from cad_geometry import DEFAULT_HEIGHT, SEAT_THICKNESS, Box, Cylinder, room_walls, solids
+
+
+# Kubus satuan [0, 1]^3; segitiga berurutan CCW dilihat dari luar (normal keluar).
+BOX_VERTICES = np.array([
+    (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+    (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1),
+], dtype=np.float64)
+BOX_FACES = np.array([
+    (0, 2, 1), (0, 3, 2),   # bawah
+    (4, 5, 6), (4, 6, 7),   # atas
+    (0, 1, 5), (0, 5, 4),   # depan (y = 0)
+    (3, 7, 6), (3, 6, 2),   # belakang (y = 1)
+    (0, 4, 7), (0, 7, 3),   # kiri (x = 0)
+    (1, 2, 6), (1, 6, 5),   # kanan (x = 1)
+], dtype=np.int64)
+
+_cylinder_templates = {}
+
+
+def cylinder_template(sections: int):
+    # Silinder satuan (jari-jari 1, z 0..1): cincin bawah, cincin atas, pusat bawah, pusat atas.
+    template = _cylinder_templates.get(sections)
+    if template is None:
+        s = sections
+        theta = np.arange(s) * (2 * np.pi / s)
+        ring = np.column_stack((np.cos(theta), np.sin(theta)))
+        vertices = np.zeros((2 * s + 2, 3))
+        vertices[:s, :2] = ring
+        vertices[s:2 * s, :2] = ring
+        vertices[s:2 * s, 2] = 1.0
+        vertices[2 * s + 1, 2] = 1.0
+        k = np.arange(s)
+        k1 = (k + 1) % s
+        faces = np.concatenate((
+            np.column_stack((k, k1, s + k1)),
+            np.column_stack((k, s + k1, s + k)),
+            np.column_stack((np.full(s, 2 * s), k1, k)),
+            np.column_stack((np.full(s, 2 * s + 1), s + k, s + k1)),
+        ))
+        template = _cylinder_templates[sections] = (vertices, faces)
+    return template
+
+
+def cylinder_sections(radius, max_segment: float = 2.0, min_sections: int = 8, max_sections: int = 64):
+    # jumlah sisi mengikuti keliling: tiap sisi paling panjang `max_segment` cm
+    sections = np.ceil(2 * np.pi * np.asarray(radius, dtype=np.float64) / max_segment)
+    return np.clip(sections, min_sections, max_sections).astype(np.int64)
+
+
+def _instances(template_vertices, template_faces, scale, offset):
+    # broadcast template ke N instance: (N, V, 3) -> (N*V, 3), indeks face digeser per instance
+    n = len(scale)
+    nv = len(template_vertices)
+    vertices = template_vertices[None, :, :] * scale[:, None, :] + offset[:, None, :]
+    faces = template_faces[None, :, :] + (np.arange(n, dtype=np.int64) * nv)[:, None, None]
+    return vertices.reshape(-1, 3), faces.reshape(-1, 3)
+
+
+def build_mesh(boxes, cylinders, max_segment: float = 2.0, min_sections: int = 8, max_sections: int = 64):
+    # boxes: (N, 6) = x, y, z, w, d, h; cylinders: (M, 5) = cx, cy, z, r, h.
+    # Hasil satu mesh gabungan: vertices (V, 3) float64, faces (F, 3) int64.
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+    cylinders = np.asarray(cylinders, dtype=np.float64).reshape(-1, 5)
+    parts = []
+    if len(boxes):
+        parts.append(_instances(BOX_VERTICES, BOX_FACES, boxes[:, 3:6], boxes[:, 0:3]))
+    if len(cylinders):
+        sections = cylinder_sections(cylinders[:, 3], max_segment, min_sections, max_sections)
+        for s in np.unique(sections):
+            group = cylinders[sections == s]
+            vertices, faces = cylinder_template(int(s))
+            scale = np.column_stack((group[:, 3], group[:, 3], group[:, 4]))
+            offset = group[:, 0:3]
+            parts.append(_instances(vertices, faces, scale, offset))
+
+    if not parts:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    vertices = []
+    faces = []
+    base = 0
+    for v, f in parts:
+        vertices.append(v)
+        faces.append(f + base)
+        base += len(v)
+    return np.concatenate(vertices), np.concatenate(faces)
+
+
+def solid_arrays(items, geometry=None):
+    # Kumpulkan kotak dan silinder sebagai array. ItemColumns diproses tervektorisasi
+    # langsung dari kolomnya; penyimpanan lain memakai solid dari IR geometri.
+    if hasattr(items, "columns"):
+        return _column_solids(items)
+    prims = geometry.solids if geometry is not None else [p for it in items for p in solids(items, it)]
+    boxes = [(p.x, p.y, p.z, p.w, p.d, p.h) for p in prims if type(p) is Box]
+    cylinders = [(p.cx, p.cy, p.z, p.r, p.h) for p in prims if type(p) is Cylinder]
+    return np.array(boxes, dtype=np.float64).reshape(-1, 6), np.array(cylinders, dtype=np.float64).reshape(-1, 5)
+
+
+def _column_solids(cols):
+    # Sama dengan fungsi _solid_* di cad_geometry, tetapi untuk seluruh kolom sekaligus.
+    c = cols.columns
+
+    def v(name, m, default):
+        return np.nan_to_num(c[name][m], nan=default)
+
+    kind = cols.kind
+    code = cols.kind_code
+    boxes = []
+    cylinders = []
+
+    rect = kind == code("rect")
+    boxes.append(np.column_stack((v("x", rect, 0.0), v("y", rect, 0.0), np.zeros(rect.sum()),
+                                  v("width", rect, 0.0), v("depth", rect, 0.0), v("height", rect, 10.0))))
+
+    seat = kind == code("seat")
+    leg = kind == code("leg")
+    leg_parents = cols.parent[leg & (cols.parent >= 0)]
+    has_legs = np.bincount(leg_parents, minlength=len(cols))[seat] > 0 if len(cols) else np.zeros(0, bool)
+    h = v("height", seat, 10.0)
+    z = np.where(has_legs, h - SEAT_THICKNESS, 0.0)
+    boxes.append(np.column_stack((v("x", seat, 0.0), v("y", seat, 0.0), z,
+                                  v("width", seat, 0.0), v("depth", seat, 0.0),
+                                  np.where(has_legs, SEAT_THICKNESS, h))))
+
+    circle = kind == code("circle")
+    cylinders.append(np.column_stack((v("cx", circle, 0.0), v("cy", circle, 0.0), np.zeros(circle.sum()),
+                                      v("radius", circle, 1.0), v("height", circle, 10.0))))
+    leg_h = v("height", leg, 10.0) - np.where(cols.parent[leg] >= 0, SEAT_THICKNESS, 0.0)
+    cylinders.append(np.column_stack((v("cx", leg, 0.0), v("cy", leg, 0.0), np.zeros(leg.sum()),
+                                      v("radius", leg, 1.0), leg_h)))
+
+    # ruangan: dinding dihitung sekali per bentuk (ukuran + bukaan) di titik asal lalu digeser
+    room = kind == code("room")
+    opening = cols.mask("door", "window") & (cols.parent >= 0)
+    opening &= room[np.maximum(cols.parent, 0)]
+    room_index = np.flatnonzero(room)
+    if len(room_index):
+        rx, ry = v("x", room, 0.0), v("y", room, 0.0)
+        rw, rd, rh = v("width", room, 400.0), v("depth", room, 500.0), v("height", room, 300.0)
+        row = np.full(len(cols), -1, dtype=np.int64)
+        row[room_index] = np.arange(len(room_index))
+        children = [[] for _ in room_index]
+        op = np.flatnonzero(opening)
+        op_kind = [cols.kinds_table[k] for k in cols.kind[op].tolist()]
+        op_side = [SIDES[k] or "south" for k in cols.side[op].tolist()]
+        op_w = np.nan_to_num(c["width"][op], nan=90.0).tolist()
+        op_h = c["height"][op].tolist()
+        for r, k, sd, ow, oh in zip(row[cols.parent[op]].tolist(), op_kind, op_side, op_w, op_h):
+            children[r].append((k, sd, ow, DEFAULT_HEIGHT[k] if oh != oh else oh))
+        templates = {}
+        for r, (w, d, h, ops) in enumerate(zip(rw.tolist(), rd.tolist(), rh.tolist(), children)):
+            key = (w, d, h, tuple(ops))
+            walls = templates.get(key)
+            if walls is None:
+                walls = templates[key] = np.array([p[:6] for p in room_walls(0.0, 0.0, w, d, h, ops)])
+            children[r] = walls
+        counts = np.array([len(walls) for walls in children])
+        walls = np.concatenate(children)
+        walls[:, 0] += np.repeat(rx, counts)
+        walls[:, 1] += np.repeat(ry, counts)
+        boxes.append(walls)
+
+    # jenis lain (bukaan tanpa ruangan, bentuk dari luar tabel ini) tetap lewat IR per item
+    rest = ~(rect | seat | circle | leg | room | opening)
+    for i in np.flatnonzero(rest):
+        for p in solids(cols, cols[int(i)]):
+            if type(p) is Box:
+                boxes.append(np.array([[p.x, p.y, p.z, p.w, p.d, p.h]]))
+            else:
+                cylinders.append(np.array([[p.cx, p.cy, p.z, p.r, p.h]]))
+    return np.concatenate(boxes), np.concatenate(cylinders)
+
+
+def write_obj(vertices, faces, target, precision: int = 4, chunk: int = 1 << 16):
+    # OBJ teks ditulis langsung dari array, per blok, tanpa objek mesh perantara.
+    # target: path atau stream teks.
+    if not hasattr(target, "write"):
+        with open(target, "w", encoding="utf-8", buffering=1 << 20) as out:
+            write_obj(vertices, faces, out, precision, chunk)
+        return target
+    vfmt = f"v %.{precision}f %.{precision}f %.{precision}f\n"
+    for start in range(0, len(vertices), chunk):
+        block = vertices[start:start + chunk]
+        target.write((vfmt * len(block)) % tuple(block.ravel().tolist()))
+    for start in range(0, len(faces), chunk):
+        block = faces[start:start + chunk] + 1
+        target.write(("f %d %d %d\n" * len(block)) % tuple(block.ravel().tolist()))
+    return target
+
+
+def weld(vertices, faces, quantize: bool = False):
+    # Gabungkan vertex yang posisinya sama persis (sudut dinding yang bersentuhan, dsb.)
+    # dan buang segitiga yang runtuh. quantize=True membulatkan ke float32 lebih dulu,
+    # sehingga vertex yang hanya berbeda di luar presisi float32 ikut tergabung.
+    vertices = np.asarray(vertices, dtype=np.float32 if quantize else np.float64) + 0.0   # -0.0 -> 0.0
+    if not len(vertices):
+        return vertices, np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    order = np.lexsort(vertices.T[::-1])
+    ordered = vertices[order]
+    first = np.empty(len(ordered), dtype=bool)
+    first[0] = True
+    np.any(ordered[1:] != ordered[:-1], axis=1, out=first[1:])
+    remap = np.empty(len(ordered), dtype=np.int64)
+    remap[order] = np.cumsum(first) - 1
+    faces = remap[faces]
+    keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    return ordered[first], faces[keep]
+
+
+def face_normals(vertices, faces):
+    tri = vertices[faces]
+    n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    length = np.linalg.norm(n, axis=1, keepdims=True)
+    return n / np.where(length > 0, length, 1.0)
+
+
+STL_RECORD = np.dtype([("normal", "<f4", 3), ("triangle", "<f4", (3, 3)), ("attr", "<u2")])
+
+
+def write_stl(vertices, faces, target, chunk: int = 1 << 16):
+    # STL biner: header 80 byte, jumlah segitiga, lalu 50 byte per segitiga (float32).
+    # target: path atau stream biner.
+    if not hasattr(target, "write"):
+        with open(target, "wb") as out:
+            write_stl(vertices, faces, out, chunk)
+        return target
+    target.write(b"TesTeknikal STL".ljust(80, b" "))
+    target.write(np.uint32(len(faces)).tobytes())
+    for start in range(0, len(faces), chunk):
+        block = faces[start:start + chunk]
+        records = np.zeros(len(block), dtype=STL_RECORD)
+        records["normal"] = face_normals(vertices, block)
+        records["triangle"] = vertices[block]
+        target.write(records.tobytes())
+    return target
+
+
+# glTF memakai y ke atas dan satuan meter; adegan ini z ke atas dalam cm.
+# Node akar memutar -90 derajat pada sumbu x dan menskalakan 0.01.
+_GLTF_ROOT = {"name": "scene", "rotation": [-0.7071068, 0.0, 0.0, 0.7071068], "scale": [0.01, 0.01, 0.01]}
+_GLB_MAGIC = 0x46546C67
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+
+class _GLBBuilder:
+    # Kumpulkan blok biner (bufferView + accessor) lalu tulis sebagai satu GLB.
+
+    def __init__(self):
+        self.blobs = []
+        self.offset = 0
+        self.buffer_views = []
+        self.accessors = []
+        self.meshes = []
+
+    def _add(self, array, target):
+        data = np.ascontiguousarray(array)
+        self.buffer_views.append({"buffer": 0, "byteOffset": self.offset, "byteLength": data.nbytes, "target": target})
+        self.blobs.append(data)
+        self.offset += data.nbytes
+        pad = -self.offset % 4
+        if pad:
+            self.blobs.append(np.zeros(pad, dtype=np.uint8))
+            self.offset += pad
+        return len(self.buffer_views) - 1
+
+    def add_mesh(self, vertices, faces, name: str):
+        vertices = np.asarray(vertices, dtype=np.float32)
+        index_type = np.uint16 if len(vertices) < 1 << 16 else np.uint32
+        position = len(self.accessors)
+        self.accessors.append({
+            "bufferView": self._add(vertices, _ARRAY_BUFFER), "componentType": 5126, "count": len(vertices),
+            "type": "VEC3", "min": vertices.min(axis=0).tolist(), "max": vertices.max(axis=0).tolist(),
+        })
+        self.accessors.append({
+            "bufferView": self._add(np.asarray(faces, dtype=index_type).ravel(), _ELEMENT_ARRAY_BUFFER),
+            "componentType": 5123 if index_type is np.uint16 else 5125, "count": int(np.size(faces)),
+            "type": "SCALAR",
+        })
+        self.meshes.append({"name": name, "primitives": [{"attributes": {"POSITION": position},
+                                                          "indices": position + 1, "mode": 4}]})
+        return len(self.meshes) - 1
+
+    def write(self, nodes, out):
+        import json
+
+        root = dict(_GLTF_ROOT, children=list(range(1, len(nodes) + 1)))
+        doc = {
+            "asset": {"version": "2.0", "generator": "TesTeknikal cad_mesh"},
+            "scene": 0, "scenes": [{"nodes": [0]}], "nodes": [root] + nodes, "meshes": self.meshes,
+            "accessors": self.accessors, "bufferViews": self.buffer_views,
+            "buffers": [{"byteLength": self.offset}],
+        }
+        text = json.dumps(doc, separators=(",", ":")).encode("utf-8")
+        text += b" " * (-len(text) % 4)
+        total = 12 + 8 + len(text) + 8 + self.offset
+        out.write(np.array([_GLB_MAGIC, 2, total, len(text), 0x4E4F534A], dtype="<u4").tobytes())
+        out.write(text)
+        out.write(np.array([self.offset, 0x004E4942], dtype="<u4").tobytes())
+        for blob in self.blobs:
+            out.write(blob.tobytes())
+
+
+def write_glb(vertices, faces, target):
+    # glTF 2.0 biner dengan satu mesh gabungan (posisi float32, indeks uint16/uint32).
+    if not hasattr(target, "write"):
+        with open(target, "wb") as out:
+            write_glb(vertices, faces, out)
+        return target
+    gltf = _GLBBuilder()
+    gltf.add_mesh(vertices, faces, "scene")
+    gltf.write([{"name": "mesh", "mesh": 0}], target)
+    return target
+
+
+def write_glb_instances(boxes, cylinders, target, max_segment: float = 2.0, min_sections: int = 8,
+                        max_sections: int = 64):
+    # Satu node per solid yang menunjuk mesh templat bersama (kotak satuan, silinder
+    # satuan per jumlah sisi) dengan translation/scale sendiri. Ukuran file tumbuh dengan
+    # jumlah node, bukan jumlah segitiga.
+    if not hasattr(target, "write"):
+        with open(target, "wb") as out:
+            write_glb_instances(boxes, cylinders, out, max_segment, min_sections, max_sections)
+        return target
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+    cylinders = np.asarray(cylinders, dtype=np.float64).reshape(-1, 5)
+    gltf = _GLBBuilder()
+    nodes = []
+    if len(boxes):
+        mesh = gltf.add_mesh(BOX_VERTICES, BOX_FACES, "box")
+        nodes.extend({"name": f"box_{i}", "mesh": mesh, "translation": row[0:3], "scale": row[3:6]}
+                     for i, row in enumerate(boxes.tolist()))
+    if len(cylinders):
+        sections = cylinder_sections(cylinders[:, 3], max_segment, min_sections, max_sections)
+        for s in np.unique(sections).tolist():
+            mesh = gltf.add_mesh(*cylinder_template(s), f"cylinder_{s}")
+            index = np.flatnonzero(sections == s)
+            nodes.extend({"name": f"cylinder_{i}", "mesh": mesh, "translation": row[0:3],
+                          "scale": [row[3], row[3], row[4]]}
+                         for i, row in zip(index.tolist(), cylinders[index].tolist()))
+    gltf.write(nodes, target)
+    return target
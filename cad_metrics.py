@@ -0,0 +1,319 @@
+import os
+import json
+import time
+import threading
+import functools
+import contextlib
+
+
+# Instrumentasi per tahap untuk parse/render/ekspor. Setiap tahap yang diberi
+# @instrumented atau `with span(...)` menghasilkan satu event:
+#
+#   {"stage": "render_dxf", "seconds": 0.012, "depth": 0, "parent": null,
+#    "items": {"seat": 1, "leg": 4}, "bytes": 15840, "pid": 123, "ts": 1700000000.0}
+#
+# Event dikirim ke sink yang terdaftar (add_sink / recording): JSONLinesSink,
+# MetricsRegistry atau ProfileCapture. Tanpa sink, pembungkus hanya memeriksa satu
+# list kosong lalu memanggil fungsi aslinya.
+#
+# CAD_METRICS_LOG=path.jsonl mengaktifkan log JSONL di setiap proses yang meng-import
+# modul ini (mis. worker cad_batch / cad_service).
+
+_sinks = []
+_local = threading.local()
+
+
+def enabled():
+    return bool(_sinks)
+
+
+def add_sink(sink):
+    _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink):
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+@contextlib.contextmanager
+def recording(*sinks):
+    for sink in sinks:
+        add_sink(sink)
+    try:
+        yield sinks[0] if len(sinks) == 1 else sinks
+    finally:
+        for sink in sinks:
+            remove_sink(sink)
+
+
+def emit(event):
+    for sink in list(_sinks):
+        sink.record(event)
+
+
+def item_counts(items):
+    # jumlah item per jenis; ItemStore dan ItemColumns punya kinds(), list biasa dihitung
+    kinds = getattr(items, "kinds", None)
+    if kinds is not None:
+        return kinds()
+    counts = {}
+    for item in items:
+        counts[item.kind] = counts.get(item.kind, 0) + 1
+    return counts
+
+
+def _position(target):
+    try:
+        return target.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def output_size(target, before=None):
+    # byte yang ditulis ke path, atau selisih posisi stream (karakter untuk stream teks)
+    if hasattr(target, "write"):
+        after = _position(target)
+        return after - before if after is not None and before is not None else None
+    try:
+        return os.path.getsize(target)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+class Span:
+    __slots__ = ("stage", "items", "bytes", "start", "ts", "depth", "parent")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.items = None
+        self.bytes = None
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.depth = len(stack)
+        self.parent = stack[-1] if stack else None
+        stack.append(self.stage)
+        self.ts = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        _local.stack.pop()
+        event = {"stage": self.stage, "seconds": seconds, "depth": self.depth, "parent": self.parent,
+                 "pid": os.getpid(), "ts": self.ts}
+        if self.items is not None:
+            event["items"] = self.items
+        if self.bytes is not None:
+            event["bytes"] = self.bytes
+        if exc_type is not None:
+            event["error"] = exc_type.__name__
+        emit(event)
+        return False
+
+
+_NULL = contextlib.nullcontext()
+
+
+def span(stage: str):
+    # sub-tahap di dalam fungsi (mis. "dxf.write", "mesh.weld"); tanpa sink -> nullcontext
+    return Span(stage) if _sinks else _NULL
+
+
+def instrumented(stage: str = None, output: bool = False):
+    # Dekorator untuk method TextToCADConverter: catat waktu, jumlah item per jenis dan,
+    # jika output=True, ukuran target (argumen pertama) setelah ditulis.
+    def decorate(func):
+        name = stage or func.__name__.lstrip("_")
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not _sinks:
+                return func(self, *args, **kwargs)
+            target = (args[0] if args else kwargs.get("target")) if output else None
+            before = _position(target) if output and hasattr(target, "write") else None
+            with Span(name) as s:
+                result = func(self, *args, **kwargs)
+                s.items = item_counts(self.items)
+                if output and result is not None:
+                    s.bytes = output_size(target, before)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+class EventList(list):
+    # sink paling sederhana: simpan event mentah (mis. untuk dikirim balik dari proses worker)
+    record = list.append
+
+
+class JSONLinesSink:
+    # Satu event per baris. Path dibuka dalam mode append sehingga banyak proses bisa
+    # menulis ke file yang sama (satu write per baris).
+
+    def __init__(self, target):
+        self._own = not hasattr(target, "write")
+        self.stream = open(target, "a", encoding="utf-8") if self._own else target
+        self._lock = threading.Lock()
+
+    def record(self, event):
+        line = json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def close(self):
+        if self._own:
+            self.stream.close()
+
+
+class MetricsRegistry:
+    # Agregat per tahap di dalam proses: jumlah panggilan, total/maks detik, total byte
+    # output dan jumlah item per jenis dari panggilan terakhir.
+
+    def __init__(self):
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def record(self, event):
+        with self._lock:
+            st = self.stages.get(event["stage"])
+            if st is None:
+                st = self.stages[event["stage"]] = {"calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                                    "bytes": 0, "errors": 0, "depth": event["depth"],
+                                                    "ts": event["ts"], "parent": event["parent"]}
+            st["calls"] += 1
+            st["seconds"] += event["seconds"]
+            st["max_seconds"] = max(st["max_seconds"], event["seconds"])
+            st["depth"] = min(st["depth"], event["depth"])
+            st["ts"] = min(st["ts"], event["ts"])
+            if event.get("bytes"):
+                st["bytes"] += event["bytes"]
+            if "items" in event:
+                st["items"] = event["items"]
+            if "error" in event:
+                st["errors"] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {stage: dict(st) for stage, st in self.stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+
+    def format(self):
+        # tabel untuk ringkasan main(): tiap tahap diikuti sub-tahapnya (diindentasi),
+        # saudara diurutkan menurut waktu mulai pertama
+        stages = self.snapshot()
+        children = {}
+        for stage, st in sorted(stages.items(), key=lambda kv: kv[1]["ts"]):
+            parent = st["parent"] if st["parent"] in stages else None
+            children.setdefault(parent, []).append(stage)
+
+        lines = [f"{'tahap':<28}{'panggil':>8}{'total ms':>11}{'maks ms':>10}{'bytes':>12}  item"]
+
+        def add(stage, depth):
+            st = stages[stage]
+            items = ", ".join(f"{k}={v}" for k, v in st.get("items", {}).items())
+            name = "  " * depth + stage
+            lines.append(f"{name:<28}{st['calls']:>8}{st['seconds'] * 1000:>11.2f}{st['max_seconds'] * 1000:>10.2f}"
+                         f"{st['bytes'] or '':>12}  {items}")
+            for child in children.get(stage, ()):
+                add(child, depth + 1)
+
+        for stage in children.get(None, ()):
+            add(stage, 0)
+        return "\n".join(lines)
+
+
+class ProfileCapture(MetricsRegistry):
+    # Untuk satu request: selama blok `with`, event tahap dicatat dan cProfile/tracemalloc
+    # (opsional) dijalankan. report() menggabungkan tabel tahap, fungsi teratas menurut
+    # waktu kumulatif dan alokasi memori terbesar.
+
+    def __init__(self, cpu: bool = True, memory: bool = False, limit: int = 15):
+        super().__init__()
+        self.cpu = cpu
+        self.memory = memory
+        self.limit = limit
+        self.profiler = None
+        self.snapshot_memory = None
+        self.peak_memory = None
+
+    def __enter__(self):
+        add_sink(self)
+        if self.memory:
+            import tracemalloc
+
+            self._started_tracemalloc = not tracemalloc.is_tracing()
+            if self._started_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        if self.cpu:
+            import cProfile
+
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.memory:
+            import tracemalloc
+
+            self.snapshot_memory = tracemalloc.take_snapshot()
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        remove_sink(self)
+        return False
+
+    def dump(self, path: str):
+        # file pstats untuk snakeviz / python -m pstats
+        self.profiler.dump_stats(path)
+
+    def report(self):
+        import io
+
+        parts = [self.format()]
+        if self.profiler is not None:
+            import pstats
+
+            buf = io.StringIO()
+            pstats.Stats(self.profiler, stream=buf).sort_stats("cumulative").print_stats(self.limit)
+            parts.append(buf.getvalue().strip())
+        if self.snapshot_memory is not None:
+            lines = [f"peak memori (tracemalloc): {self.peak_memory / 1e6:.1f} MB"]
+            for stat in self.snapshot_memory.statistics("lineno")[:self.limit]:
+                lines.append(f"  {stat.size / 1e3:10.1f} KB  {stat.count:>7}x  {stat.traceback}")
+            parts.append("\n".join(lines))
+        return "\n\n".join(parts)
+
+
+@contextlib.contextmanager
+def collect(stats: bool = False, log: str = None, profile: bool = False):
+    # sink untuk satu sesi CLI (--stats / --metrics-log / --profile); menghasilkan
+    # registry untuk dicetak di akhir (ProfileCapture jika profile), atau None
+    with contextlib.ExitStack() as stack:
+        if log:
+            sink = JSONLinesSink(log)
+            stack.callback(sink.close)
+            stack.enter_context(recording(sink))
+        registry = None
+        if profile:
+            registry = stack.enter_context(ProfileCapture(memory=True))
+        elif stats:
+            registry = stack.enter_context(recording(MetricsRegistry()))
+        yield registry
+
+
+if os.environ.get("CAD_METRICS_LOG"):
+    add_sink(JSONLinesSink(os.environ["CAD_METRICS_LOG"]))
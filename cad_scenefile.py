@@ -0,0 +1,166 @@
+import os
+import json
+import tempfile
+
+import numpy as np
+
+from cad_columns import FIELDS, SIDES, ItemColumns
+from cad_export import publish
+
+
+# Berkas adegan biner (.cadscene): hasil parse disimpan sekali lalu dibuka ulang tanpa
+# parse, oleh proses atau alat lain. Isinya kolom ItemColumns apa adanya:
+#
+#   MAGIC (8 byte) | panjang header (uint64 LE) | header JSON | kolom ... (rata 64 byte)
+#
+# Header memuat jumlah item, tabel jenis dan sisi, dtype + offset setiap kolom (kind,
+# side, parent, lalu FIELDS) dan properti tambahan (ItemColumns.extra). load_scene()
+# memetakan seluruh berkas dengan satu numpy.memmap dan setiap kolom adalah view ke
+# dalamnya: membuka adegan berjuta-juta item hanya membaca header, data dibaca OS saat
+# renderer menyentuhnya. Renderer yang menerima ItemColumns (DXF, SVG, mesh) bisa
+# langsung memakai hasilnya.
+
+MAGIC = b"CADSCN\x00\x01"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+
+def _aligned(n: int):
+    return -(-n // ALIGN) * ALIGN
+
+
+def scene_layout(items, dtype=np.float64):
+    # Tata letak adegan tanpa menulisnya: (prefix, [(offset, array)], ukuran total).
+    # prefix = MAGIC + panjang header + header JSON; offset dihitung dari awal berkas/blok.
+    # Dipakai save_scene dan cad_shm (blok shared memory dengan isi yang sama persis).
+    cols = items if isinstance(items, ItemColumns) else ItemColumns.from_items(items, dtype=dtype)
+    arrays = [("kind", cols.kind), ("side", cols.side), ("parent", cols.parent)]
+    arrays += [(name, cols.columns[name]) for name in FIELDS]
+    layout = {}
+    offset = 0
+    for name, array in arrays:
+        layout[name] = {"dtype": array.dtype.str, "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+    header = {"version": FORMAT_VERSION, "count": len(cols), "kinds": list(cols.kinds_table),
+              "sides": list(SIDES), "arrays": layout,
+              "extra": {str(i): props for i, props in cols.extra.items()}}
+    blob = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = MAGIC + len(blob).to_bytes(8, "little") + blob
+    start = _aligned(len(prefix))
+    return prefix, [(start + layout[name]["offset"], array) for name, array in arrays], start + offset
+
+
+def save_scene(items, target, dtype=np.float64):
+    # items: ItemStore/list CADItem (dikonversi lewat ItemColumns.from_items) atau ItemColumns.
+    # target: path atau file biner yang sudah terbuka.
+    prefix, arrays, _ = scene_layout(items, dtype)
+
+    def write(f):
+        written = f.write(prefix)
+        for offset, array in arrays:
+            written += f.write(b"\0" * (offset - written))
+            written += f.write(np.ascontiguousarray(array).data)
+
+    if hasattr(target, "write"):
+        write(target)
+        return target
+    # berkas sementara + os.replace: pembaca (termasuk memmap berkas lama) tidak pernah
+    # melihat berkas setengah jadi
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        publish(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def _decode_header(read, source):
+    # read(n) -> n byte berikutnya dari berkas atau buffer
+    if read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{source}: bukan berkas adegan CAD")
+    size = int.from_bytes(read(8), "little")
+    header = json.loads(read(size))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{source}: versi format {header.get('version')} tidak didukung")
+    header["data_offset"] = _aligned(len(MAGIC) + 8 + size)
+    return header
+
+
+def read_header(path: str):
+    with open(path, "rb") as f:
+        return _decode_header(f.read, path)
+
+
+def scene_columns(buf, source: str = "buffer"):
+    # ItemColumns yang kolomnya view ke buf (array uint8 berisi satu adegan utuh: memmap
+    # berkas atau blok shared memory). Tidak ada data yang disalin.
+    position = [0]
+
+    def read(size):
+        chunk = bytes(buf[position[0]:position[0] + size])
+        position[0] += size
+        return chunk
+
+    header = _decode_header(read, source)
+    n = header["count"]
+    cols = ItemColumns(0, kinds=header["kinds"])
+
+    def column(name, fill=None):
+        spec = header["arrays"].get(name)
+        if spec is None:
+            return np.full(n, fill)
+        dtype = np.dtype(spec["dtype"])
+        start = header["data_offset"] + spec["offset"]
+        return buf[start:start + n * dtype.itemsize].view(dtype)
+
+    cols.kind = column("kind")
+    cols.side = column("side")
+    if header["sides"] != list(SIDES):
+        # berkas dari versi dengan urutan sisi lain: petakan kodenya (satu salinan kecil)
+        cols.side = np.array([SIDES.index(s) if s in SIDES else 0 for s in header["sides"]],
+                             dtype=np.uint8)[cols.side]
+    cols.parent = column("parent")
+    cols.columns = {name: column(name, np.nan) for name in FIELDS}
+    cols.extra = {int(i): props for i, props in header["extra"].items()}
+    return cols
+
+
+def load_scene(path: str, mode: str = "r"):
+    # ItemColumns yang kolomnya view ke memmap berkas. mode "r": hanya baca, "c": salin
+    # saat ditulis (translate/scale tanpa mengubah berkas), "r+": tulis langsung ke berkas.
+    return scene_columns(np.memmap(path, dtype=np.uint8, mode=mode), path)
+
+
+def scene_to_items(path: str):
+    # kebalikan save_scene untuk daftar item biasa: ItemStore berisi CADItem
+    return load_scene(path).to_items()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from cad_export import export_formats
+    from test_teknikal import TextToCADConverter
+
+    parser = argparse.ArgumentParser(description="simpan hasil parse ke berkas adegan, atau render berkas adegan")
+    parser.add_argument("source", help="deskripsi teks, atau path .cadscene dengan --render")
+    parser.add_argument("-o", "--output", help="path .cadscene (mode simpan) atau nama dasar output (mode render)")
+    parser.add_argument("--render", action="store_true", help="source adalah berkas adegan: render tanpa parse")
+    parser.add_argument("--formats", default="dxf,svg", help="format untuk --render")
+    args = parser.parse_args()
+    if args.render:
+        converter = TextToCADConverter.from_scene(args.source)
+        basename = args.output or args.source.rsplit(".", 1)[0]
+        for fmt, result in export_formats(converter, basename, args.formats.split(","), mode="serial").items():
+            print(f"{fmt}: {result.path if result.ok else result.error}")
+    else:
+        converter = TextToCADConverter()
+        converter.parse(args.source)
+        path = converter.save_scene(args.output or "scene.cadscene")
+        print(f"{len(converter.items)} item disimpan ke {path}")
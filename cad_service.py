@@ -0,0 +1,310 @@
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+from urllib.parse import parse_qs, urlsplit
+
+from cad_export import MEDIA_TYPES, WRITERS, export_bytes
+
+
+# Layanan HTTP/1.1 lokal (TCP atau Unix socket) di atas TextToCADConverter. Proses ini
+# hidup lama sehingga import dan worker tetap hangat; parse + render berjalan di
+# executor terbatas dan hasilnya dikirim langsung sebagai isi respons.
+#
+#   POST /convert?format=svg     isi: deskripsi (teks) atau JSON {"description", "format"}
+#   GET  /health                 {"status": "ok"}
+#   GET  /stats                  penghitung request
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 408: "Request Timeout",
+    411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+    431: "Request Header Fields Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def warm_up():
+    # sekali per worker: import dependensi berat dan jalankan satu konversi kecil,
+    # supaya request pertama tidak membayar biaya import
+    from test_teknikal import TextToCADConverter, has_mesh_support
+
+    import ezdxf  # noqa: F401
+    import svgwrite  # noqa: F401
+    if has_mesh_support():
+        import cad_mesh  # noqa: F401
+    TextToCADConverter().parse("kursi 4 kaki 40x40 tinggi 45")
+
+
+def convert_bytes(description: str, fmt: str, cache=None):
+    # dijalankan di worker: (bytes atau None, jumlah item, detik, hit cache?).
+    # cache: argumen shared_cache (direktori, byte memori, byte disk) atau None.
+    start = time.perf_counter()
+    if cache is not None:
+        from cad_cache import convert_cached, shared_cache
+
+        data, items, hit = convert_cached(shared_cache(*cache), description, fmt)
+        return data, items, time.perf_counter() - start, hit
+
+    from test_teknikal import TextToCADConverter
+
+    converter = TextToCADConverter()
+    converter.parse(description)
+    data = export_bytes(converter, fmt)
+    return data, len(converter.items), time.perf_counter() - start, False
+
+
+class ConversionService:
+    def __init__(self, workers: int = None, executor: str = "process", max_pending: int = None,
+                 timeout: float = 30.0, read_timeout: float = 10.0, max_body: int = 1 << 16,
+                 default_format: str = "svg", cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor_kind = executor
+        # request yang sedang dirender + yang antre di executor; lebih dari ini -> 503
+        self.max_pending = max_pending or self.workers * 4
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self.max_body = max_body
+        self.default_format = default_format
+        # cache dua tingkat per worker (cad_cache); tier disk dipakai bersama semua worker
+        self.cache = cache
+        self.pending = 0
+        self.stats = {"requests": 0, "ok": 0, "rejected": 0, "timeouts": 0, "errors": 0, "bytes_out": 0,
+                      "cache_hits": 0}
+        self.executor = None
+
+    def start_executor(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if self.executor_kind == "process":
+            self.executor = ProcessPoolExecutor(self.workers, initializer=warm_up)
+        elif self.executor_kind == "thread":
+            warm_up()
+            self.executor = ThreadPoolExecutor(self.workers)
+        else:
+            raise ValueError(f"executor tidak dikenal: {self.executor_kind}")
+        return self.executor
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    async def convert(self, description: str, fmt: str):
+        # format dari JSON bisa bertipe apa saja; list/dict tidak boleh sampai ke lookup
+        if not isinstance(fmt, str) or fmt not in WRITERS:
+            raise HTTPError(400, f"format tidak dikenal: {fmt}")
+        if self.pending >= self.max_pending:
+            self.stats["rejected"] += 1
+            raise HTTPError(503, "antrean penuh")
+        self.pending += 1
+        loop = asyncio.get_running_loop()
+        try:
+            job = self.executor.submit(convert_bytes, description, fmt, self.cache)
+        except Exception:
+            self.pending -= 1
+            raise
+        # slot antrean dilepas saat job di executor selesai (atau batal sebelum mulai),
+        # bukan saat request selesai: job yang kena timeout masih memakai worker
+        job.add_done_callback(lambda _: self._release(loop))
+        try:
+            # waktu tunggu dihitung sejak masuk antrean; job yang sudah berjalan di worker
+            # tidak bisa dihentikan, tetapi hasilnya dibuang
+            return await asyncio.wait_for(asyncio.wrap_future(job), self.timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise HTTPError(504, f"render melebihi {self.timeout} s") from None
+
+    def _release(self, loop):
+        # dipanggil dari thread executor
+        def release():
+            self.pending -= 1
+
+        try:
+            loop.call_soon_threadsafe(release)
+        except RuntimeError:
+            pass   # loop sudah ditutup (layanan berhenti)
+
+    # --- HTTP ----------------------------------------------------------------------
+
+    async def _read_request(self, reader):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.read_timeout)
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None   # klien menutup koneksi keep-alive
+            raise HTTPError(400, "request terpotong") from None
+        except asyncio.LimitOverrunError:
+            raise HTTPError(431, "header terlalu besar") from None
+        except asyncio.TimeoutError:
+            raise HTTPError(408, "header tidak lengkap") from None
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "request line tidak valid") from None
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        body = b""
+        if "transfer-encoding" in headers:
+            raise HTTPError(411, "gunakan Content-Length")
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HTTPError(400, "Content-Length tidak valid") from None
+        if length > self.max_body:
+            raise HTTPError(413, f"isi request lebih dari {self.max_body} byte")
+        if length:
+            try:
+                body = await asyncio.wait_for(reader.readexactly(length), self.read_timeout)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                raise HTTPError(408, "isi request tidak lengkap") from None
+        keep_alive = headers.get("connection", "").lower() != "close" if version == "HTTP/1.1" \
+            else headers.get("connection", "").lower() == "keep-alive"
+        return method, target, headers, body, keep_alive
+
+    async def _respond(self, method: str, target: str, headers, body: bytes):
+        url = urlsplit(target)
+        if url.path == "/health":
+            return 200, "application/json", json.dumps({"status": "ok"}).encode(), {}
+        if url.path == "/stats":
+            stats = dict(self.stats, pending=self.pending, workers=self.workers, executor=self.executor_kind)
+            return 200, "application/json", json.dumps(stats).encode(), {}
+        if url.path != "/convert":
+            raise HTTPError(404, f"tidak ada {url.path}")
+        if method != "POST":
+            raise HTTPError(405, "gunakan POST")
+
+        query = parse_qs(url.query)
+        fmt = query.get("format", [self.default_format])[0]
+        text = body.decode("utf-8", errors="replace")
+        if headers.get("content-type", "").startswith("application/json"):
+            try:
+                data = json.loads(text)
+            except ValueError as e:
+                raise HTTPError(400, f"JSON tidak valid: {e}") from None
+            text = data.get("description", data.get("text")) if isinstance(data, dict) else None
+            fmt = data.get("format", fmt) if isinstance(data, dict) else fmt
+        if not isinstance(text, str) or not text.strip():
+            raise HTTPError(400, "deskripsi kosong")
+
+        data, items, seconds, hit = await self.convert(text, fmt)
+        self.stats["cache_hits"] += hit
+        if data is None:
+            raise HTTPError(422, f"tidak ada output {fmt} untuk deskripsi ini")
+        return 200, MEDIA_TYPES[fmt], data, {"X-Items": str(items), "X-Render-Seconds": f"{seconds:.4f}"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body, keep_alive = request
+                    self.stats["requests"] += 1
+                    status, content_type, payload, extra = await self._respond(method, target, headers, body)
+                    self.stats["ok"] += 1
+                except HTTPError as e:
+                    status, content_type, extra = e.status, "application/json", {}
+                    payload = json.dumps({"error": str(e)}).encode()
+                    if e.status == 503:
+                        extra["Retry-After"] = "1"
+                    if e.status in (400, 408, 411, 413, 431):
+                        keep_alive = False   # sisa isi request tidak bisa dipercaya
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    status, content_type, extra = 500, "application/json", {}
+                    payload = json.dumps({"error": f"{type(e).__name__}: {e}"}).encode()
+
+                self.stats["bytes_out"] += len(payload)
+                head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Type: {content_type}",
+                        f"Content-Length: {len(payload)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head.extend(f"{k}: {v}" for k, v in extra.items())
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                writer.write(payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix: str = None, ready=None):
+        self.start_executor()
+        try:
+            if unix:
+                server = await asyncio.start_unix_server(self.handle, path=unix)
+                where = unix
+            else:
+                server = await asyncio.start_server(self.handle, host, port)
+                where = "http://%s:%d" % server.sockets[0].getsockname()[:2]
+            print(f"cad_service: {where} ({self.workers} worker {self.executor_kind}, "
+                  f"antrean {self.max_pending}, timeout {self.timeout} s)", flush=True)
+            if ready is not None:
+                ready.set()
+            # SIGTERM/SIGINT: berhenti menerima koneksi lalu matikan worker dengan rapi
+            if hasattr(signal, "SIGTERM"):
+                loop = asyncio.get_running_loop()
+                task = asyncio.current_task()
+                for sig in (signal.SIGTERM, signal.SIGINT):
+                    try:
+                        loop.add_signal_handler(sig, task.cancel)
+                    except NotImplementedError:   # Windows
+                        break
+            async with server:
+                try:
+                    await server.serve_forever()
+                except asyncio.CancelledError:
+                    pass
+        finally:
+            self.close()
+            if unix and os.path.exists(unix):
+                os.unlink(unix)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="layanan konversi teks -> DXF/SVG/OBJ/STL/GLB")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="dengarkan di Unix socket ini, bukan TCP")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--executor", choices=("process", "thread"), default="process")
+    parser.add_argument("--max-pending", type=int, default=0, help="batas request dalam antrean (default 4x workers)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="batas waktu render per request (detik)")
+    parser.add_argument("--max-body", type=int, default=1 << 16)
+    parser.add_argument("--format", default="svg", choices=sorted(WRITERS), help="format bawaan")
+    parser.add_argument("--cache-mb", type=int, default=64, help="cache memori per worker (MB), 0 = mati")
+    parser.add_argument("--cache-dir", help="tier cache disk bersama, mis. .cache/cad")
+    parser.add_argument("--cache-disk-mb", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    cache = None
+    if args.cache_mb or args.cache_dir:
+        cache = (args.cache_dir, args.cache_mb << 20, args.cache_disk_mb << 20)
+    service = ConversionService(args.workers, args.executor, args.max_pending or None, args.timeout,
+                                max_body=args.max_body, default_format=args.format, cache=cache)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import re
+from typing import Callable, NamedTuple
+
+from cad_geometry import register_kind
+from cad_store import BOX_KINDS, CIRCLE_KINDS, POINT_KINDS
+from cad_tokenizer import WORD_SUFFIX, add_keywords, trie_pattern
+
+
+# Registri jenis bentuk. Setiap bentuk mendaftarkan kata kunci (Indonesia + Inggris),
+# parser dan, untuk jenis item baru, hook renderer (lihat cad_geometry.register_kind).
+#
+# Dispatch: semua kata kunci digabung menjadi satu regex berbentuk trie dan deskripsi
+# dipindai sekali. Biaya per karakter sebanding dengan panjang kata kunci, bukan jumlah
+# bentuk, sehingga tetap datar walaupun ratusan bentuk didaftarkan. Jika beberapa bentuk
+# disebut, parser dicoba urut prioritas (angka kecil dulu); parser yang mengembalikan
+# False menolak dan bentuk berikutnya dicoba.
+#
+# Adegan: jika bentuk wadah (container, mis. ruangan) disebut bersama "<jumlah> <bentuk>",
+# setiap klausa berjumlah diurai terpisah dan disalin ke dalam wadah (lihat scene_clauses
+# dan cad_layout), mis. "ruangan 20x30 m dengan 200 kursi dan 10 meja 160x80".
+
+class ShapeType(NamedTuple):
+    name: str
+    keywords: tuple
+    parse: Callable   # parse(converter, tokens) -> None, atau False jika menolak
+    priority: int = 50
+    container: bool = False   # bisa menampung bentuk lain dalam satu adegan
+
+
+_shapes = {}
+_keyword_shape = {}
+_dispatch_re = None
+
+_BOUNDS = {"box": BOX_KINDS, "circle": CIRCLE_KINDS, "point": POINT_KINDS}
+
+
+def register_shape(name: str, keywords, parse, priority: int = 50, words=(), geometry=None,
+                   container: bool = False):
+    # words: kata lain yang dicari parser di token (mis. "tinggi", "kaki")
+    # geometry: {jenis item: {"top": fn, "front": fn, "solid": fn, "bounds": "box"|"circle"|"point"}}
+    global _dispatch_re
+    keywords = tuple(keywords)
+    for kw in keywords:
+        owner = _keyword_shape.get(kw)
+        if owner is not None and owner != name:
+            raise ValueError(f"kata kunci {kw!r} sudah dipakai bentuk {owner!r}")
+    old = _shapes.get(name)
+    if old is not None:
+        for kw in old.keywords:
+            del _keyword_shape[kw]
+    shape = _shapes[name] = ShapeType(name, keywords, parse, priority, container)
+    for kw in keywords:
+        _keyword_shape[kw] = name
+    add_keywords(words)
+    for kind, hooks in (geometry or {}).items():
+        hooks = dict(hooks)
+        bounds = hooks.pop("bounds", None)
+        if bounds is not None:
+            _BOUNDS[bounds].add(kind)
+        register_kind(kind, **hooks)
+    _dispatch_re = None
+    return shape
+
+
+def shapes():
+    return sorted(_shapes.values(), key=lambda shape: shape.priority)
+
+
+def _compiled():
+    global _dispatch_re
+    if _dispatch_re is None:
+        # kata kunci utuh; hanya akhiran WORD_SUFFIX yang boleh ("kursinya", "rooms")
+        first = re.escape("".join(sorted({kw[0] for kw in _keyword_shape})))
+        _dispatch_re = re.compile(rf"(?=[{first}])(?<![a-z])({trie_pattern(_keyword_shape)}){WORD_SUFFIX}")
+    return _dispatch_re
+
+
+def match_shapes(text: str):
+    # bentuk yang disebut di teks (sudah dinormalisasi), urut prioritas
+    if not _keyword_shape:
+        return []
+    found = {_keyword_shape[kw] for kw in _compiled().findall(text)}
+    return sorted((_shapes[name] for name in found), key=lambda shape: shape.priority)
+
+
+def find_shapes(text: str):
+    # [(bentuk, awal, akhir)] untuk setiap kata kunci, urut posisi di teks
+    if not _keyword_shape:
+        return []
+    return [(_shapes[_keyword_shape[m.group(1)]], m.start(), m.end()) for m in _compiled().finditer(text)]
+
+
+# angka tepat sebelum kata kunci ("200 kursi"), bukan bagian ukuran ("45x45 kursi")
+_COUNT = re.compile(r"(?<![\d.x])(\d+)\s*$")
+_CLAUSE_END = re.compile(r"[,;]|\s(?:dan|serta|and)\s")
+
+
+def scene_clauses(text: str, found):
+    # Pecah deskripsi adegan: setiap "<jumlah> <kata kunci> <keterangan>" (sampai koma, "dan"
+    # atau klausa berjumlah berikutnya) menjadi (bentuk, jumlah, teks klausa). Kata kunci tanpa
+    # jumlah ("ruangan persegi", "dudukan persegi") tetap bagian dari teks di sekitarnya.
+    # Hasil: (klausa, sisa teks untuk wadah); klausa kosong berarti bukan adegan.
+    counted = []
+    for shape, start, end in found:
+        if shape.container:
+            continue
+        m = _COUNT.search(text, max(0, start - 12), start)
+        if m:
+            counted.append((shape, int(m.group(1)), m.start(1), end))
+    clauses = []
+    rest = []
+    pos = 0
+    for i, (shape, count, start, end) in enumerate(counted):
+        limit = counted[i + 1][2] if i + 1 < len(counted) else len(text)
+        stop = _CLAUSE_END.search(text, end, limit)
+        stop = stop.start() if stop else limit
+        clauses.append((shape, count, text[start:stop]))
+        rest.append(text[pos:start])
+        pos = stop
+    rest.append(text[pos:])
+    return clauses, " ".join(rest)
@@ -0,0 +1,156 @@
+import gc
+import os
+import atexit
+import inspect
+import secrets
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from cad_scenefile import scene_columns, scene_layout
+
+
+# Serah terima adegan antarproses tanpa pickle. Hasil parse ditulis sekali ke satu blok
+# multiprocessing.shared_memory dengan tata letak yang sama persis dengan berkas .cadscene
+# (header JSON + kolom ItemColumns rata 64 byte); worker render cukup menerima nama blok,
+# attach, lalu memakai kolomnya sebagai view tanpa menyalin data.
+#
+#   with SharedScene.create(converter.items) as scene:       # pemilik (proses induk)
+#       pool.submit(render_worker, scene.name, ...)
+#
+#   scene = SharedScene.attach(name)                         # worker
+#   try:
+#       converter.items = scene.items                        # view read-only ke blok
+#       ...
+#   finally:
+#       converter = None                                     # lepas semua view dulu
+#       scene.close()
+#
+# Umur blok:
+#   - hanya pemilik (create) yang meng-unlink; worker hanya close(). Blok tetap ada sampai
+#     pemilik memanggil unlink()/keluar dari blok with, walaupun worker masih attach
+#     (halaman fisik dibebaskan OS setelah mapping terakhir ditutup).
+#   - close() gagal dengan BufferError selama masih ada view (converter, ItemColumns)
+#     yang dipegang: lepaskan referensinya lebih dulu.
+#   - blok yang lupa di-unlink dibersihkan saat proses pemilik keluar (atexit), dan bila
+#     proses itu mati mendadak, oleh resource tracker multiprocessing.
+#   - attach tidak didaftarkan ke resource tracker: di Python < 3.13 proses yang attach
+#     akan meng-unlink blok milik proses lain saat ia keluar. Karena worker berbagi tracker
+#     dengan pemilik, cadangan tracker untuk pemilik yang mati mendadak hanya berlaku
+#     sampai worker pertama attach; atexit tetap berlaku.
+
+PREFIX = "cadscn_"
+
+_owned = {}   # nama -> (pid, SharedMemory) blok yang dibuat proses ini
+
+
+# Python 3.13+: SharedMemory(track=False). Sebelumnya attach selalu mendaftar ke resource
+# tracker (hanya POSIX), jadi pendaftarannya dibatalkan lagi setelah attach.
+_TRACK_ARG = "track" in inspect.signature(shared_memory.SharedMemory).parameters
+_UNTRACK = not _TRACK_ARG and os.name == "posix"
+
+
+def _open(name: str):
+    if _TRACK_ARG:
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if _UNTRACK:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+@atexit.register
+def _unlink_owned():
+    for name, (pid, shm) in list(_owned.items()):
+        if pid == os.getpid():
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+    _owned.clear()
+
+
+class SharedScene:
+    def __init__(self, shm, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self._items = None
+
+    @classmethod
+    def create(cls, items, dtype=np.float64):
+        # items: ItemStore/list CADItem atau ItemColumns, disalin sekali ke blok baru
+        prefix, arrays, size = scene_layout(items, dtype)
+        shm = shared_memory.SharedMemory(name=PREFIX + secrets.token_hex(8), create=True, size=size)
+        _owned[shm.name] = (os.getpid(), shm)
+        scene = cls(shm, owner=True)
+        try:
+            buf = np.frombuffer(shm.buf, dtype=np.uint8)
+            buf[:len(prefix)] = np.frombuffer(prefix, dtype=np.uint8)
+            for offset, array in arrays:
+                buf[offset:offset + array.nbytes] = np.ascontiguousarray(array).view(np.uint8)
+            del buf
+        except BaseException:
+            scene.close()
+            scene.unlink()
+            raise
+        return scene
+
+    @classmethod
+    def attach(cls, name: str):
+        return cls(_open(name), owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def nbytes(self):
+        return self.shm.size
+
+    @property
+    def items(self):
+        # ItemColumns yang kolomnya view read-only ke blok
+        if self._items is None:
+            buf = np.frombuffer(self.shm.buf, dtype=np.uint8)
+            buf.flags.writeable = False
+            self._items = scene_columns(buf, self.shm.name)
+        return self._items
+
+    def close(self):
+        # lepas mapping proses ini; blok sendiri tetap ada sampai unlink()
+        self._items = None
+        try:
+            self.shm.close()
+            return
+        except BufferError:
+            # view yang hanya tertahan siklus referensi
+            gc.collect()
+        try:
+            self.shm.close()
+        except BufferError:
+            raise BufferError(f"{self.shm.name}: masih ada view ke blok shared memory; "
+                              "lepaskan converter/ItemColumns sebelum close()") from None
+
+    def unlink(self):
+        if not self.owner:
+            raise RuntimeError(f"{self.shm.name}: hanya pemilik yang boleh meng-unlink blok")
+        _owned.pop(self.shm.name, None)
+        if _UNTRACK:
+            # worker multiprocessing memakai resource tracker yang sama dengan proses ini,
+            # sehingga unregister mereka saat attach ikut menghapus pendaftaran pemilik;
+            # daftarkan lagi supaya unregister di dalam unlink() tidak ditolak tracker
+            resource_tracker.register(self.shm._name, "shared_memory")
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.close()
+        finally:
+            if self.owner:
+                self.unlink()
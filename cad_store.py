@@ -0,0 +1,158 @@
+# Induk bawaan per jenis item: kaki menempel ke dudukan, pintu/jendela ke ruangan.
+PARENT_KIND = {"leg": "seat", "door": "room", "window": "room"}
+
+# Cara jenis item masuk ke bounds(): kotak x..x+width, lingkaran cx±radius, titik cx/cy saja.
+# Bentuk baru menambahkan jenisnya lewat cad_shapes.register_shape.
+BOX_KINDS = {"seat", "rect", "room", "table", "shelf"}
+CIRCLE_KINDS = {"circle"}
+POINT_KINDS = {"leg"}
+
+
+_props_edits = 0
+
+
+def props_version():
+    # naik setiap kali props item mana pun diubah di tempat (lihat Props)
+    return _props_edits
+
+
+class Props(dict):
+    # props CADItem. Perubahan di tempat (item.props["width"] = 50) menaikkan
+    # props_version() sehingga cache yang dibangun dari item (geometri converter) tahu
+    # isinya sudah basi, walaupun daftar item dan jumlahnya tidak berubah.
+    __slots__ = ()
+
+    def _edited(self):
+        global _props_edits
+        _props_edits += 1
+
+    def __setitem__(self, key, value):
+        self._edited()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._edited()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._edited()
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._edited()
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self._edited()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._edited()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._edited()
+        return super().setdefault(key, default)
+
+    def clear(self):
+        self._edited()
+        super().clear()
+
+
+class ItemStore:
+    # Daftar item yang juga diindeks per jenis dan menyimpan relasi induk/anak,
+    # sehingga renderer tidak perlu memindai seluruh daftar untuk setiap item.
+    # version naik setiap kali daftar berubah; panggil touch() setelah mengubah item
+    # dengan cara yang tidak terlihat oleh store.
+
+    def __init__(self, items=()):
+        self._items = []
+        self._by_kind = {}
+        self._parent = {}
+        self._children = {}
+        self.version = 0
+        self.extend(items)
+
+    def append(self, item, parent=None):
+        if parent is None and item.kind in PARENT_KIND:
+            siblings = self._by_kind.get(PARENT_KIND[item.kind])
+            parent = siblings[-1] if siblings else None
+        self._items.append(item)
+        self.version += 1
+        self._by_kind.setdefault(item.kind, []).append(item)
+        if parent is not None:
+            self._parent[item] = parent
+            self._children.setdefault(parent, []).append(item)
+        return item
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def clear(self):
+        self._items.clear()
+        self._by_kind.clear()
+        self._parent.clear()
+        self._children.clear()
+        self.version += 1
+
+    def touch(self):
+        self.version += 1
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __repr__(self):
+        return f"ItemStore({self._items!r})"
+
+    def of_kind(self, kind: str):
+        return self._by_kind.get(kind, [])
+
+    def first(self, kind: str):
+        items = self._by_kind.get(kind)
+        return items[0] if items else None
+
+    def kinds(self):
+        return {kind: len(items) for kind, items in self._by_kind.items() if items}
+
+    def parent_of(self, item):
+        return self._parent.get(item)
+
+    def children(self, item, kinds=None):
+        children = self._children.get(item, [])
+        if kinds is None:
+            return children
+        if isinstance(kinds, str):
+            kinds = (kinds,)
+        return [c for c in children if c.kind in kinds]
+
+    def bounds(self):
+        # (minx, miny, maxx, maxy) tampak atas, atau None jika tidak ada item berukuran
+        all_x = []
+        all_y = []
+        for it in self._items:
+            if it.kind in BOX_KINDS:
+                x = it.props.get("x", 0.0)
+                y = it.props.get("y", 0.0)
+                w = it.props.get("width", 0.0)
+                d = it.props.get("depth", 0.0)
+                all_x.extend([x, x + w])
+                all_y.extend([y, y + d])
+            elif it.kind in CIRCLE_KINDS:
+                cx = it.props.get("cx", 0.0)
+                cy = it.props.get("cy", 0.0)
+                r = it.props.get("radius", 0.0)
+                all_x.extend([cx - r, cx + r])
+                all_y.extend([cy - r, cy + r])
+            elif it.kind in POINT_KINDS:
+                all_x.append(it.props.get("cx", 0.0))
+                all_y.append(it.props.get("cy", 0.0))
+        if not all_x:
+            return None
+        return min(all_x), min(all_y), max(all_x), max(all_y)
@@ -0,0 +1,90 @@
+from cad_geometry import Circle, iter_front, iter_top
+
+
+# Simbol yang dipakai ulang lewat <use>. Ukuran simbol 1x1 lalu diskalakan oleh
+# width/height di <use>; vector-effect menjaga tebal garis tetap 2 px.
+SYMBOLS = (
+    '<symbol id="leg" viewBox="-1 -1 2 2"><circle r="1" fill="black" /></symbol>',
+    '<symbol id="leg-bar" viewBox="0 0 1 1" preserveAspectRatio="none">'
+    '<rect width="1" height="1" fill="none" stroke="black" stroke-width="2" vector-effect="non-scaling-stroke" />'
+    '</symbol>',
+    '<symbol id="door" viewBox="0 0 1 1" preserveAspectRatio="none">'
+    '<rect width="1" height="1" fill="none" stroke="black" stroke-width="2" vector-effect="non-scaling-stroke" />'
+    '</symbol>',
+    '<symbol id="window" viewBox="0 0 1 1" preserveAspectRatio="none">'
+    '<rect width="1" height="1" fill="none" stroke="black" stroke-width="2" vector-effect="non-scaling-stroke" />'
+    '</symbol>',
+)
+
+_SYMBOL_ROLE = {"leg": "leg-bar", "door": "door", "window": "window"}
+
+
+def svg_number(v):
+    # 4 desimal (0.1 mm) sudah cukup, tanpa nol di belakang
+    s = "%.4f" % v
+    return s.rstrip("0").rstrip(".") if "." in s else s
+
+
+def svg_element(prim):
+    if type(prim) is Circle:
+        if prim.role == "leg":
+            d = svg_number(prim.r * 2)
+            return (f'<use xlink:href="#leg" x="{svg_number(prim.cx - prim.r)}" y="{svg_number(prim.cy - prim.r)}" '
+                    f'width="{d}" height="{d}" />')
+        return (f'<circle cx="{svg_number(prim.cx)}" cy="{svg_number(prim.cy)}" r="{svg_number(prim.r)}" '
+                f'fill="none" stroke="black" stroke-width="2" />')
+    symbol = _SYMBOL_ROLE.get(prim.role)
+    if symbol:
+        return (f'<use xlink:href="#{symbol}" x="{svg_number(prim.x)}" y="{svg_number(prim.y)}" '
+                f'width="{svg_number(prim.w)}" height="{svg_number(prim.h)}" />')
+    return (f'<rect x="{svg_number(prim.x)}" y="{svg_number(prim.y)}" width="{svg_number(prim.w)}" '
+            f'height="{svg_number(prim.h)}" fill="none" stroke="black" stroke-width="2" />')
+
+
+def _write_group(out, primitives, chunk_size: int):
+    buf = []
+    for prim in primitives:
+        buf.append(svg_element(prim))
+        if len(buf) >= chunk_size:
+            out.write("".join(buf))
+            buf.clear()
+    if buf:
+        out.write("".join(buf))
+
+
+def write_svg(items, out, chunk_size: int = 2048):
+    # Dua lintasan atas item: bounding box dulu (untuk ukuran kanvas), lalu elemen ditulis
+    # langsung ke `out` per blok. Tidak ada pohon DOM, jadi memori tidak tumbuh dengan
+    # jumlah item.
+    minx, miny, maxx, maxy = 0, 0, 800, 600
+    bounds = items.bounds()
+    if bounds:
+        minx, maxx = bounds[0] - 20, bounds[2] + 20
+        miny, maxy = bounds[1] - 20, bounds[3] + 20
+    width = int(max(800, maxx - minx + 200))
+    height = int(max(600, maxy - miny + 600))
+
+    out.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+    out.write(f'<svg baseProfile="full" height="{height}px" version="1.1" width="{width}px" '
+              'xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">')
+    out.write("<defs>" + "".join(SYMBOLS) + "</defs>")
+
+    out.write(f'<g id="top_view" transform="translate({svg_number(50 - minx)}, {svg_number(50 - miny)})">')
+    out.write('<text font-size="14px" font-weight="bold" x="0" y="-10">TAMPAK ATAS</text>')
+    _write_group(out, iter_top(items), chunk_size)
+    out.write("</g>")
+
+    out.write(f'<g id="front_view" transform="translate({svg_number(50 - minx)}, {svg_number(maxy - miny + 120)})">')
+    out.write('<text font-size="14px" font-weight="bold" x="0" y="-10">TAMPAK DEPAN</text>')
+    _write_group(out, iter_front(items), chunk_size)
+    out.write("</g></svg>\n")
+
+
+def render_svg_stream(items, target, chunk_size: int = 2048):
+    # target: path file atau objek file teks yang sudah terbuka
+    if hasattr(target, "write"):
+        write_svg(items, target, chunk_size)
+        return target
+    with open(target, "w", encoding="utf-8", buffering=1 << 16) as out:
+        write_svg(items, out, chunk_size)
+    return target
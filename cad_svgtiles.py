@@ -0,0 +1,145 @@
+import os
+import json
+import math
+
+from cad_geometry import Circle, iter_top
+from cad_svgstream import SYMBOLS, svg_element, svg_number
+
+
+# Tampak atas sebagai piramida tile SVG + manifest.json, untuk denah yang terlalu besar
+# bagi satu dokumen. Level 0 berdetail penuh dengan tile selebar tile_size cm; setiap level
+# berikutnya menggandakan luas tile (satu tile menutup 2x2 tile level sebelumnya) dan
+# memakai detail lebih kasar:
+#
+#   level 0   semua primitif seperti render_svg_stream
+#   level 1   kaki menjadi titik, pintu/jendela dibuang
+#   level 2+  seperti level 1, bentuk yang lebih kecil dari MIN_PX piksel juga menjadi titik
+#
+# Titik yang jatuh di piksel yang sama pada satu level hanya ditulis sekali, sehingga
+# jumlah elemen tile kasar dibatasi resolusinya, bukan jumlah item.
+#
+# Setiap primitif dimasukkan sekali ke ember tile yang dipotong bounding box-nya
+# (pembagian ruang per level), jadi tile hanya berisi elemen yang benar-benar beririsan
+# dengannya dan tile kosong tidak ditulis. Semua tile berukuran tile_px piksel; viewBox
+# memetakan koordinat cm apa adanya sehingga elemen tidak perlu ditransformasi.
+#
+# manifest.json: bounds adegan, tile_size, tile_px dan per level: lebar tile dalam cm,
+# jumlah kolom/baris dan daftar [kolom, baris, path, jumlah elemen]. Tile (c, r) menutup
+# x = bounds[0] + c * tile, y = bounds[1] + r * tile. Viewer memilih level dari zoom lalu
+# hanya memuat tile yang terlihat.
+
+TILE_SIZE = 1000.0
+TILE_PX = 512
+MIN_PX = 3.0
+POINT_PX = 1.5
+MAX_LEVELS = 12
+MANIFEST = "manifest.json"
+
+_STYLE = "<style>*{vector-effect:non-scaling-stroke}</style>"
+
+
+def _extent(prim):
+    if type(prim) is Circle:
+        return prim.cx - prim.r, prim.cy - prim.r, prim.cx + prim.r, prim.cy + prim.r
+    return prim.x, prim.y, prim.x + prim.w, prim.y + prim.h
+
+
+def _point(x: float, y: float, r: float):
+    return f'<circle cx="{svg_number(x)}" cy="{svg_number(y)}" r="{svg_number(r)}" fill="black" />'
+
+
+def level_count(bounds, tile_size: float = TILE_SIZE):
+    # level sampai seluruh adegan muat dalam satu tile
+    if not bounds:
+        return 1
+    span = max(bounds[2] - bounds[0], bounds[3] - bounds[1], tile_size)
+    return min(math.ceil(math.log2(span / tile_size)) + 1, MAX_LEVELS)
+
+
+def write_tiles(items, directory: str, tile_size: float = TILE_SIZE, tile_px: int = TILE_PX, levels: int = None):
+    bounds = items.bounds()
+    if bounds:
+        bounds = (bounds[0] - 20, bounds[1] - 20, bounds[2] + 20, bounds[3] + 20)
+    else:
+        bounds = (0.0, 0.0, tile_size, tile_size)
+    levels = levels or level_count(bounds, tile_size)
+    minx, miny = bounds[0], bounds[1]
+    grids = []
+    for level in range(levels):
+        tile = tile_size * 2 ** level
+        grids.append((tile, max(math.ceil((bounds[2] - minx) / tile), 1),
+                      max(math.ceil((bounds[3] - miny) / tile), 1), {}, set()))
+
+    for prim in iter_top(items):
+        x0, y0, x1, y1 = _extent(prim)
+        full = None
+        for level, (tile, columns, rows, buckets, points) in enumerate(grids):
+            px = tile / tile_px   # cm per piksel di level ini
+            if level == 0:
+                element = full = svg_element(prim)
+            elif prim.role in ("door", "window"):
+                continue
+            elif prim.role == "leg" or (level >= 2 and max(x1 - x0, y1 - y0) < MIN_PX * px):
+                x, y = (x0 + x1) / 2, (y0 + y1) / 2
+                pixel = (int((x - minx) // px), int((y - miny) // px))
+                if pixel in points:
+                    continue
+                points.add(pixel)
+                element = _point(x, y, POINT_PX * px)
+            else:
+                element = full
+            c0, c1 = int((x0 - minx) // tile), int((x1 - minx) // tile)
+            r0, r1 = int((y0 - miny) // tile), int((y1 - miny) // tile)
+            for c in range(max(c0, 0), min(c1, columns - 1) + 1):
+                for r in range(max(r0, 0), min(r1, rows - 1) + 1):
+                    bucket = buckets.get((c, r))
+                    if bucket is None:
+                        bucket = buckets[(c, r)] = []
+                    bucket.append(element)
+
+    manifest = {"version": 1, "bounds": list(bounds), "tile_size": tile_size, "tile_px": tile_px, "levels": []}
+    for level, (tile, columns, rows, buckets, _) in enumerate(grids):
+        folder = os.path.join(directory, str(level))
+        os.makedirs(folder, exist_ok=True)
+        tiles = []
+        for (c, r), elements in sorted(buckets.items()):
+            name = f"{level}/{c}_{r}.svg"
+            _write_tile(os.path.join(directory, name), elements, minx + c * tile, miny + r * tile, tile, tile_px)
+            tiles.append([c, r, name, len(elements)])
+        manifest["levels"].append({"level": level, "tile": tile, "columns": columns, "rows": rows, "tiles": tiles})
+    path = os.path.join(directory, MANIFEST)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    return path
+
+
+def _write_tile(path: str, elements, x: float, y: float, tile: float, tile_px: int):
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as out:
+        out.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        out.write(f'<svg baseProfile="full" height="{tile_px}px" version="1.1" width="{tile_px}px" '
+                  f'viewBox="{svg_number(x)} {svg_number(y)} {svg_number(tile)} {svg_number(tile)}" '
+                  'xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">')
+        out.write("<defs>" + "".join(SYMBOLS) + "</defs>" + _STYLE)
+        out.write("".join(elements))
+        out.write("</svg>\n")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from test_teknikal import TextToCADConverter
+
+    parser = argparse.ArgumentParser(description="tampak atas sebagai tile SVG bertingkat + manifest.json")
+    parser.add_argument("source", help="deskripsi teks atau berkas .cadscene")
+    parser.add_argument("-o", "--output", default="tiles", help="direktori output")
+    parser.add_argument("--tile-size", type=float, default=TILE_SIZE, help="lebar tile level 0 dalam cm")
+    parser.add_argument("--tile-px", type=int, default=TILE_PX)
+    parser.add_argument("--levels", type=int, help="jumlah level (default: sampai adegan muat satu tile)")
+    args = parser.parse_args()
+    if args.source.endswith(".cadscene") and os.path.exists(args.source):
+        converter = TextToCADConverter.from_scene(args.source)
+    else:
+        converter = TextToCADConverter()
+        converter.parse(args.source)
+    path = converter.render_svg_tiles(args.output, args.tile_size, args.tile_px, args.levels)
+    print(f"{len(converter.items)} item -> {path}")
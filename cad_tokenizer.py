@@ -0,0 +1,212 @@
+import re
+from typing import NamedTuple
+
+
+NUMBER = "number"
+DIM = "dim"
+WORD = "word"
+DIRECTION = "direction"
+
+DIRECTIONS = {
+    "barat": "west", "timur": "east", "utara": "north", "selatan": "south",
+    "west": "west", "east": "east", "north": "north", "south": "south",
+}
+
+# Kata kunci yang dipakai parser. Kata lain tidak menjadi token sehingga teks pengisi
+# yang panjang dilewati oleh mesin regex tanpa membuat objek Python.
+KEYWORDS = (
+    "kursi", "chair", "dudukan", "tinggi", "kaki",
+    "ruangan", "room", "pintu", "jendela",
+    "kotak", "persegi", "lingkaran", "circle",
+)
+
+# Akhiran yang boleh menempel pada kata kunci: "ruang" -> "ruangan", "kursinya",
+# "dudukannya", "rooms", "boxes". Kata kunci harus diikuti salah satunya lalu batas kata,
+# jadi awalan kata lain ("desk" di "deskripsi", "rak" di "raksasa") tidak ikut cocok.
+WORD_SUFFIX = r"(?:(?:an)?(?:nya)?|e?s)(?![a-z])"
+
+_NUM = r"\d+(?:\.\d+)?"
+# Satuan hanya dikenali jika tidak diikuti huruf lain, jadi "40 meja" tidak dianggap "40 m";
+# "meter", "meters", "metre" dan "metres" semuanya menjadi "m".
+_UNIT = r"(?:\s*(?P<{}>meters?|metres?|mm|cm|m)(?![a-z]))?"
+UNIT_ALIASES = {"meter": "m", "meters": "m", "metre": "m", "metres": "m"}
+
+
+def trie_pattern(words):
+    # Alternatif kata sebagai trie: ("kaki", "kotak", "kursi") -> "k(?:aki|otak|ursi)".
+    # Mesin regex mengikuti awalan bersama, sehingga biaya per posisi sebanding dengan
+    # panjang kata, bukan jumlah kata. Akhiran opsional bersifat greedy: kata terpanjang menang.
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = None
+
+    def emit(node):
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+def _compile(words):
+    # Satu pola gabungan, dipindai sekali dari kiri ke kanan: dimensi AxB, angka (+ satuan),
+    # kata kunci. Kata berakhiran ikut cocok ("dudukannya" -> "dudukan", lihat WORD_SUFFIX).
+    # Lookahead huruf awal membuat posisi yang tidak mungkin cocok langsung dilewati.
+    alternatives = trie_pattern(words)
+    first = re.escape("".join(sorted({w[0] for w in words})))
+    return re.compile(
+        rf"(?=[\d{first}])(?:"
+        rf"(?P<a>{_NUM})\s*[x×]\s*(?P<b>{_NUM})" + _UNIT.format("du") +
+        rf"|(?P<n>{_NUM})" + _UNIT.format("nu") +
+        rf"|(?<![a-z])(?P<w>{alternatives}){WORD_SUFFIX})"
+    )
+
+
+TOKEN_RE = _compile(KEYWORDS + tuple(DIRECTIONS))
+
+
+def add_keywords(words):
+    # kata kunci tambahan dari parser bentuk baru (cad_shapes.register_shape)
+    global KEYWORDS, TOKEN_RE
+    new = tuple(w for w in dict.fromkeys(words) if w not in KEYWORDS and w not in DIRECTIONS)
+    if new:
+        KEYWORDS += new
+        TOKEN_RE = _compile(KEYWORDS + tuple(DIRECTIONS))
+
+
+class Token(NamedTuple):
+    kind: str
+    value: object          # angka (cm), nama arah, atau kata kunci
+    value2: float = None   # angka kedua untuk DIM
+    unit: str = None       # satuan ("m", "cm", "mm") atau None
+    raw: float = None      # angka pertama sebelum dinormalisasi
+    start: int = 0
+    end: int = 0
+
+
+def normalize_unit(value: float, unit):
+    # semua ukuran disimpan dalam cm
+    if unit == "m":
+        return value * 100.0
+    if unit == "mm":
+        return value / 10.0
+    return value
+
+
+class TokenStream:
+    # Token dibuat sesuai kebutuhan: parser yang sudah menemukan semua yang dicarinya di awal
+    # teks tidak perlu memindai sisa deskripsi yang panjang. Setiap bagian teks tetap hanya
+    # dipindai sekali, berapa pun jumlah pencarian yang dilakukan parser.
+
+    def __init__(self, text: str, matches):
+        self.text = text
+        self.tokens = []
+        self._words = {}
+        self._matches = matches
+
+    def _pull(self):
+        # buat satu token berikutnya; False jika teks sudah habis
+        if self._matches is None:
+            return False
+        m = next(self._matches, None)
+        if m is None:
+            self._matches = None
+            return False
+        t = _make_token(m)
+        if t.kind == WORD:
+            self._words.setdefault(t.value, []).append(len(self.tokens))
+        self.tokens.append(t)
+        return True
+
+    def __iter__(self):
+        tokens = self.tokens
+        i = 0
+        while i < len(tokens) or self._pull():
+            yield tokens[i]
+            i += 1
+
+    def __len__(self):
+        while self._pull():
+            pass
+        return len(self.tokens)
+
+    def index_of(self, word: str, start: int = 0):
+        for i in self._words.get(word, ()):
+            if i >= start:
+                return i
+        while self._pull():
+            t = self.tokens[-1]
+            if t.kind == WORD and t.value == word and len(self.tokens) > start:
+                return len(self.tokens) - 1
+        return -1
+
+    def find(self, kinds, start: int = 0):
+        tokens = self.tokens
+        for i in range(start, len(tokens)):
+            if tokens[i].kind in kinds:
+                return tokens[i]
+        while self._pull():
+            if len(tokens) > start and tokens[-1].kind in kinds:
+                return tokens[-1]
+        return None
+
+    def find_after(self, word: str, kinds):
+        i = self.index_of(word)
+        if i < 0:
+            return None
+        return self.find(kinds, i + 1)
+
+    def number_after(self, word: str):
+        # angka pertama setelah kata kunci; dimensi AxB dihitung sebagai angka pertamanya
+        t = self.find_after(word, (NUMBER, DIM))
+        return None if t is None else t.value
+
+    def count_before(self, i: int):
+        # angka yang hanya dipisah spasi dari token ke-i, mis. "4 kaki"
+        if i > 0:
+            prev = self.tokens[i - 1]
+            if prev.kind == NUMBER and not self.text[prev.end:self.tokens[i].start].strip():
+                return prev.raw
+        return None
+
+    def number_before(self, word: str):
+        i = self.index_of(word)
+        while i >= 0:
+            count = self.count_before(i)
+            if count is not None:
+                return count
+            i = self.index_of(word, i + 1)
+        return None
+
+
+_new_token = tuple.__new__
+
+
+def _make_token(m):
+    start, end = m.span()
+    last = m.lastgroup
+    if last == "w":
+        word = m.group("w")
+        side = DIRECTIONS.get(word)
+        if side:
+            return _new_token(Token, (DIRECTION, side, None, None, None, start, end))
+        return _new_token(Token, (WORD, word, None, None, None, start, end))
+    if last == "n" or last == "nu":
+        raw = float(m.group("n"))
+        unit = m.group("nu")
+        unit = UNIT_ALIASES.get(unit, unit)
+        return _new_token(Token, (NUMBER, normalize_unit(raw, unit), None, unit, raw, start, end))
+    a = float(m.group("a"))
+    unit = m.group("du")
+    unit = UNIT_ALIASES.get(unit, unit)
+    b = normalize_unit(float(m.group("b")), unit)
+    return _new_token(Token, (DIM, normalize_unit(a, unit), b, unit, a, start, end))
+
+
+def tokenize(text: str):
+    return TokenStream(text, TOKEN_RE.finditer(text))
@@ -1,539 +1,676 @@
-import re
-import sys
-import subprocess
-from datetime import datetime
-
-
-REQUIRED = ["ezdxf", "svgwrite"]
-for pkg in REQUIRED:
-    try:
-        __import__(pkg)
-    except ImportError:
-        print(f"Package '{pkg}' belum ditemukan. Menginstall {pkg}...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
-
-import ezdxf
-import svgwrite
-
-
-HAS_TRIMESH = True
-try:
-    import numpy as np
-    import trimesh
-except Exception:
-    HAS_TRIMESH = False
-
-
-def to_number(s):
-    
-    try:
-        return float(s)
-    except Exception:
-        return None
-
-
-class CADItem:
-    
-    def __init__(self, kind, **kwargs):
-        self.kind = kind  # 'seat', 'leg', 'room', 'door', 'window', 'rect', 'circle', ...
-        self.props = kwargs
-
-
-class TextToCADConverter:
-    
-    def __init__(self):
-        self.items = []  
-
-  
-    def parse(self, description: str):
-        desc = description.lower().strip()
-        
-        desc = desc.replace("×", "x")
-        desc = desc.replace("X", "x")
-
-        
-        if "kursi" in desc or "chair" in desc:
-            self._parse_chair(desc)
-       
-        elif "ruangan" in desc or "room" in desc:
-            self._parse_room(desc)
-        else:
-            
-            self._parse_basic_shapes(desc)
-
-    def _parse_chair(self, desc: str):
-        
-        seat_w = 40.0
-        seat_d = 40.0
-        seat_h = 45.0
-        legs = 4
-
-       
-        m = re.search(r'dudukan.*?(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)\s*(cm|mm|m)?', desc)
-        if m:
-            a = float(m.group(1))
-            b = float(m.group(2))
-            unit = m.group(3)
-            if unit == "m":
-                a *= 100.0
-                b *= 100.0
-            elif unit == "mm":
-                a /= 10.0
-                b /= 10.0
-            seat_w, seat_d = a, b
-        else:
-            
-            m2 = re.search(r'dudukan.*?(\d+(?:\.\d+)?)\s*(cm|mm|m)?', desc)
-            if m2:
-                val = float(m2.group(1))
-                unit = m2.group(2)
-                if unit == "m":
-                    val *= 100.0
-                elif unit == "mm":
-                    val /= 10.0
-                seat_w = seat_d = val
-
-        
-        mh = re.search(r'tinggi.*?(\d+(?:\.\d+)?)\s*(cm|mm|m)?', desc)
-        if mh:
-            v = float(mh.group(1))
-            u = mh.group(2)
-            if u == "m":
-                v *= 100.0
-            elif u == "mm":
-                v /= 10.0
-            seat_h = v
-
-        
-        mleg = re.search(r'(\d+)\s*kaki', desc)
-        if mleg:
-            legs = int(mleg.group(1))
-
-        
-        seat_x = 0.0
-        seat_y = 0.0
-        self.items.append(CADItem("seat", x=seat_x, y=seat_y, width=seat_w, depth=seat_d, height=seat_h))
-
-        
-        leg_radius = max(min(seat_w, seat_d) * 0.05, 0.5)  
-        leg_pos = []
-       
-        if legs == 1:
-            leg_pos = [(seat_x + seat_w / 2, seat_y + seat_d / 2)]
-        elif legs == 2:
-            leg_pos = [(seat_x + 0.15 * seat_w, seat_y + seat_d / 2),
-                       (seat_x + 0.85 * seat_w, seat_y + seat_d / 2)]
-        elif legs == 3:
-            leg_pos = [(seat_x + 0.1 * seat_w, seat_y + 0.9 * seat_d),
-                       (seat_x + 0.9 * seat_w, seat_y + 0.9 * seat_d),
-                       (seat_x + 0.5 * seat_w, seat_y + 0.1 * seat_d)]
-        else:
-            
-            leg_pos = [
-                (seat_x + 0.1 * seat_w, seat_y + 0.1 * seat_d),
-                (seat_x + 0.9 * seat_w, seat_y + 0.1 * seat_d),
-                (seat_x + 0.1 * seat_w, seat_y + 0.9 * seat_d),
-                (seat_x + 0.9 * seat_w, seat_y + 0.9 * seat_d),
-            ]
-            if legs > 4:
-                leg_pos.append((seat_x + 0.5 * seat_w, seat_y + 0.5 * seat_d))
-
-        for lx, ly in leg_pos[:legs]:
-            self.items.append(CADItem("leg", cx=lx, cy=ly, radius=leg_radius, height=seat_h))
-
-    def _parse_room(self, desc: str):
-        
-        room_w = 400.0
-        room_d = 500.0
-
-       
-        m = re.search(r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)(?:\s*(m|meter|cm|mm))?', desc)
-        if m:
-            a = float(m.group(1))
-            b = float(m.group(2))
-            unit = m.group(3)
-            if unit and unit.startswith("m"):
-                a *= 100.0
-                b *= 100.0
-            elif unit == "cm" or (unit is None and "meter" not in desc and "cm" in desc):
-                
-                a = a if unit == "cm" else a
-           
-            room_w, room_d = a * (100.0 if unit and unit.startswith("m") else 1.0), b * (100.0 if unit and unit.startswith("m") else 1.0)
-
-       
-        if "meter" in desc and "x" in desc and not m:
-            m2 = re.search(r'(\d+(?:\.\d+)?)\s*m', desc)
-            if m2:
-                
-                val = float(m2.group(1)) * 100.0
-                room_w = room_d = val
-
-        
-        self.items.append(CADItem("room", x=0.0, y=0.0, width=room_w, depth=room_d, height=300.0))
-
-        
-        sides_map = {"barat": "west", "timur": "east", "utara": "north", "selatan": "south"}
-        
-        for kind in ["pintu", "jendela"]:
-            for m2 in re.finditer(rf'(\d+)?\s*{kind}.*?(barat|timur|utara|selatan)?', desc):
-                count_raw = m2.group(1)
-                side_raw = m2.group(2)
-                count = int(count_raw) if count_raw else 1
-                side = sides_map.get(side_raw, None) if side_raw else None
-                for _ in range(count):
-                    
-                    if kind == "pintu":
-                        w = 90.0  # cm
-                        h = 210.0
-                        self.items.append(CADItem("door", side=side or "south", width=w, height=h))
-                    else:
-                        w = 120.0
-                        h = 120.0
-                        self.items.append(CADItem("window", side=side or "north", width=w, height=h))
-
-    def _parse_basic_shapes(self, desc: str):
-        
-        if "kotak" in desc or "persegi" in desc:
-            m = re.search(r'(\d+(?:\.\d+)?)\s*[x×]\s*(\d+(?:\.\d+)?)(?:\s*(cm|mm|m))?', desc)
-            if m:
-                a = float(m.group(1))
-                b = float(m.group(2))
-                unit = m.group(3)
-                if unit == "m":
-                    a *= 100.0
-                    b *= 100.0
-                elif unit == "mm":
-                    a /= 10.0
-                    b /= 10.0
-                self.items.append(CADItem("rect", x=0.0, y=0.0, width=a, depth=b, height=30.0))
-                return
-        if "lingkaran" in desc or "circle" in desc:
-            m = re.search(r'(\d+(?:\.\d+)?)\s*(cm|mm|m)?', desc)
-            if m:
-                r = float(m.group(1))
-                u = m.group(2)
-                if u == "m":
-                    r *= 100.0
-                elif u == "mm":
-                    r /= 10.0
-                self.items.append(CADItem("circle", cx=r, cy=r, radius=r, height=30.0))
-                return
-
-        
-        self.items.append(CADItem("rect", x=0.0, y=0.0, width=100.0, depth=50.0, height=30.0))
-
-    def render_dxf(self, filename: str):
-        doc = ezdxf.new("R2010")
-        msp = doc.modelspace()
-
-       
-        msp.add_text("TAMPAK ATAS", dxfattribs={"height": 5, "insert": (0, -10)})
-        msp.add_text("TAMPAK DEPAN", dxfattribs={"height": 5, "insert": (0, 300)})
-
-        
-        for item in self.items:
-            if item.kind == "seat" or item.kind == "rect":
-                x = item.props.get("x", 0.0)
-                y = item.props.get("y", 0.0)
-                w = item.props.get("width")
-                d = item.props.get("depth")
-                pts = [(x, y), (x + w, y), (x + w, y + d), (x, y + d), (x, y)]
-                msp.add_lwpolyline(pts)
-            elif item.kind == "circle":
-                cx = item.props.get("cx", 0.0)
-                cy = item.props.get("cy", 0.0)
-                r = item.props.get("radius", 1.0)
-                msp.add_circle((cx, cy), r)
-            elif item.kind == "leg":
-                cx = item.props.get("cx")
-                cy = item.props.get("cy")
-                r = item.props.get("radius", 1.0)
-                
-                msp.add_circle((cx, cy), r)
-            elif item.kind == "room":
-                x = item.props.get("x", 0.0)
-                y = item.props.get("y", 0.0)
-                w = item.props.get("width", 400.0)
-                d = item.props.get("depth", 500.0)
-                pts = [(x, y), (x + w, y), (x + w, y + d), (x, y + d), (x, y)]
-                msp.add_lwpolyline(pts)
-            elif item.kind in ("door", "window"):
-                
-                side = item.props.get("side", "south")
-                w = item.props.get("width", 90.0)
-                
-                room = next((it for it in self.items if it.kind == "room"), None)
-                if room:
-                    rx = room.props["x"]
-                    ry = room.props["y"]
-                    rw = room.props["width"]
-                    rd = room.props["depth"]
-                    if side == "north":
-                        
-                        x0 = rx + (rw - w) / 2
-                        y0 = ry
-                        pts = [(x0, y0 - 0.5), (x0 + w, y0 - 0.5), (x0 + w, y0 + 0.5), (x0, y0 + 0.5), (x0, y0)]
-                        msp.add_lwpolyline(pts)
-                    elif side == "south":
-                        x0 = rx + (rw - w) / 2
-                        y0 = ry + rd
-                        pts = [(x0, y0 - 0.5), (x0 + w, y0 - 0.5), (x0 + w, y0 + 0.5), (x0, y0 + 0.5), (x0, y0)]
-                        msp.add_lwpolyline(pts)
-                    elif side == "west":
-                        x0 = rx
-                        y0 = ry + (rd - w) / 2
-                        pts = [(x0 - 0.5, y0), (x0 + 0.5, y0), (x0 + 0.5, y0 + w), (x0 - 0.5, y0 + w), (x0, y0)]
-                        msp.add_lwpolyline(pts)
-                    elif side == "east":
-                        x0 = rx + rw
-                        y0 = ry + (rd - w) / 2
-                        pts = [(x0 - 0.5, y0), (x0 + 0.5, y0), (x0 + 0.5, y0 + w), (x0 - 0.5, y0 + w), (x0, y0)]
-                        msp.add_lwpolyline(pts)
-
-        
-        y_offset = 320
-        for item in self.items:
-            if item.kind == "seat":
-                
-                x = item.props.get("x", 0.0)
-                w = item.props.get("width")
-                h = item.props.get("height")
-          
-                pts = [(x, y_offset), (x + w, y_offset), (x + w, y_offset + 5), (x, y_offset + 5), (x, y_offset)]
-                msp.add_lwpolyline(pts)
-               
-                for leg in [it for it in self.items if it.kind == "leg"]:
-                    cx = leg.props.get("cx")
-                    r = leg.props.get("radius", 1.0)
-                    
-                    lx = cx - r
-                    ly = y_offset + 5
-                    lh = leg.props.get("height", h)
-                    pts = [(lx, ly), (lx + r * 2, ly), (lx + r * 2, ly + lh), (lx, ly + lh), (lx, ly)]
-                    msp.add_lwpolyline(pts)
-            elif item.kind == "rect":
-                x = item.props.get("x", 0.0)
-                w = item.props.get("width", 0.0)
-                h = item.props.get("height", 30.0)
-                pts = [(x, y_offset), (x + w, y_offset), (x + w, y_offset + h), (x, y_offset + h), (x, y_offset)]
-                msp.add_lwpolyline(pts)
-            elif item.kind == "room":
-                
-                x = item.props.get("x", 0.0)
-                w = item.props.get("width", 0.0)
-                h = item.props.get("height", 300.0)
-                pts = [(x, y_offset), (x + w, y_offset), (x + w, y_offset + h), (x, y_offset + h), (x, y_offset)]
-                msp.add_lwpolyline(pts)
-                
-                for iw in [it for it in self.items if it.kind in ("window", "door")]:
-                    ww = iw.props.get("width", 90.0)
-                    wh = iw.props.get("height", 120.0) if iw.kind == "window" else iw.props.get("height", 210.0)
-                    
-                    cx = x + w / 2
-                    lx = cx - ww / 2
-                    ly = y_offset + 50  
-                    pts = [(lx, ly), (lx + ww, ly), (lx + ww, ly + wh), (lx, ly + wh), (lx, ly)]
-                    msp.add_lwpolyline(pts)
-
-        
-        doc.saveas(filename)
-        return filename
-
-    def render_svg(self, filename: str):
-        
-        minx, miny, maxx, maxy = 0, 0, 800, 600
-        
-        all_x = []
-        all_y = []
-        for it in self.items:
-            if it.kind in ("seat", "rect", "room"):
-                x = it.props.get("x", 0.0)
-                y = it.props.get("y", 0.0)
-                w = it.props.get("width", 0.0)
-                d = it.props.get("depth", 0.0)
-                all_x.extend([x, x + w])
-                all_y.extend([y, y + d])
-            elif it.kind == "circle":
-                cx = it.props.get("cx", 0.0)
-                cy = it.props.get("cy", 0.0)
-                r = it.props.get("radius", 0.0)
-                all_x.extend([cx - r, cx + r])
-                all_y.extend([cy - r, cy + r])
-            elif it.kind == "leg":
-                cx = it.props.get("cx", 0.0)
-                cy = it.props.get("cy", 0.0)
-                all_x.append(cx)
-                all_y.append(cy)
-        if all_x and all_y:
-            minx, maxx = min(all_x) - 20, max(all_x) + 20
-            miny, maxy = min(all_y) - 20, max(all_y) + 20
-
-        width = int(max(800, maxx - minx + 200))
-        height = int(max(600, maxy - miny + 600))
-        dwg = svgwrite.Drawing(filename, size=(f"{width}px", f"{height}px"))
-
-        # top view group
-        top_group = dwg.add(dwg.g(id="top_view", transform=f"translate({50 - minx}, {50 - miny})"))
-        top_group.add(dwg.text("TAMPAK ATAS", insert=(0, -10), font_size="14px", font_weight="bold"))
-
-        for it in self.items:
-            if it.kind in ("seat", "rect", "room"):
-                x = it.props.get("x", 0.0)
-                y = it.props.get("y", 0.0)
-                w = it.props.get("width", 0.0)
-                d = it.props.get("depth", 0.0)
-                top_group.add(dwg.rect(insert=(x, y), size=(w, d), fill="none", stroke="black", stroke_width=2))
-            elif it.kind == "circle":
-                cx = it.props.get("cx", 0.0)
-                cy = it.props.get("cy", 0.0)
-                r = it.props.get("radius", 0.0)
-                top_group.add(dwg.circle(center=(cx, cy), r=r, fill="none", stroke="black", stroke_width=2))
-            elif it.kind == "leg":
-                cx = it.props.get("cx", 0.0)
-                cy = it.props.get("cy", 0.0)
-                r = it.props.get("radius", 1.0)
-                top_group.add(dwg.circle(center=(cx, cy), r=r, fill="black"))
-
-      
-        front_y_offset = maxy - miny + 120
-        front_group = dwg.add(dwg.g(id="front_view", transform=f"translate({50 - minx}, {front_y_offset})"))
-        front_group.add(dwg.text("TAMPAK DEPAN", insert=(0, -10), font_size="14px", font_weight="bold"))
-
-        for it in self.items:
-            if it.kind == "seat":
-                x = it.props.get("x", 0.0)
-                w = it.props.get("width", 0.0)
-                h = it.props.get("height", 45.0)
-                
-                front_group.add(dwg.rect(insert=(x, 0), size=(w, 5), fill="none", stroke="black", stroke_width=2))
-                
-                for leg in [l for l in self.items if l.kind == "leg"]:
-                    cx = leg.props.get("cx")
-                    r = leg.props.get("radius", 1.0)
-                    lx = cx - r
-                    ly = 5
-                    lh = leg.props.get("height", h)
-                    front_group.add(dwg.rect(insert=(lx, ly), size=(r * 2, lh), fill="none", stroke="black", stroke_width=2))
-            elif it.kind == "rect":
-                x = it.props.get("x", 0.0)
-                w = it.props.get("width", 0.0)
-                h = it.props.get("height", 30.0)
-                front_group.add(dwg.rect(insert=(x, 0), size=(w, h), fill="none", stroke="black", stroke_width=2))
-            elif it.kind == "room":
-                x = it.props.get("x", 0.0)
-                w = it.props.get("width", 400.0)
-                h = it.props.get("height", 300.0)
-                front_group.add(dwg.rect(insert=(x, 0), size=(w, h), fill="none", stroke="black", stroke_width=2))
-              
-                for iw in [it for it in self.items if it.kind in ("window", "door")]:
-                    ww = iw.props.get("width", 90.0)
-                    wh = iw.props.get("height", 120.0) if iw.kind == "window" else iw.props.get("height", 210.0)
-                    cx = x + w / 2
-                    lx = cx - ww / 2
-                    ly = 50
-                    front_group.add(dwg.rect(insert=(lx, ly), size=(ww, wh), fill="none", stroke="black", stroke_width=2))
-
-        dwg.save()
-        return filename
-    
-    def export_obj_extrude(self, filename: str):
-        if not HAS_TRIMESH:
-            print("trimesh/numpy tidak tersedia — melewatkan ekspor 3D.")
-            return None
-
-        meshes = []
-        for it in self.items:
-            if it.kind in ("seat", "rect", "room"):
-                x = it.props.get("x", 0.0)
-                y = it.props.get("y", 0.0)
-                w = it.props.get("width", 0.0)
-                d = it.props.get("depth", 0.0)
-                h = it.props.get("height", 10.0)
-
-              
-                mesh = trimesh.creation.box(extents=(w, d, h))
-                mesh.apply_translation((x + w / 2, y + d / 2, h / 2))
-                meshes.append(mesh)
-
-            elif it.kind == "circle":
-                cx = it.props.get("cx", 0.0)
-                cy = it.props.get("cy", 0.0)
-                r = it.props.get("radius", 1.0)
-                h = it.props.get("height", 10.0)
-
-                
-                mesh = trimesh.creation.cylinder(radius=r, height=h, sections=32)
-                mesh.apply_translation((cx, cy, h / 2))
-                meshes.append(mesh)
-
-        if not meshes:
-            print("Tidak ada mesh untuk diekspor.")
-            return None
-
-        scene = trimesh.util.concatenate(meshes)
-        scene.export(filename)
-        return filename
-
-
-def main():
-    print("========================================================================\n")
-
-    namaprogram = "Test Teknikal PT Green Global Sumatera\n"
-    devby = "Developed by Ananda Rauf Maududi\n"
-    devdate = "Tanggal Test: 24 September 2025\n"
-
-    print(namaprogram)
-    print(devby)
-    print(devdate)
-    print("========================================================================\n")
-
-    print("Contoh input yang dapat diproses:")
-    print("- 'Kursi dengan 4 kaki, dudukan persegi 40x40 cm, tinggi 45 cm'")
-    print("- 'Ruangan ukuran 4x5 meter, dengan 1 pintu di sisi barat dan 1 jendela di sisi utara'")
-    print("- 'Kotak 100x50' atau 'Lingkaran diameter 80'\n")
-
-    input_deskripsi_sketsa = input("Masukan deskripsi sketsa anda: ")
-
-    converter = TextToCADConverter()
-    converter.parse(input_deskripsi_sketsa)
-
-   
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    dxf_filename = f"output_{timestamp}.dxf"
-    svg_filename = f"output_{timestamp}.svg"
-
-    try:
-        converter.render_dxf(dxf_filename)
-        print(f"DXF berhasil dibuat: {dxf_filename}")
-    except Exception as e:
-        print("Gagal membuat DXF:", e)
-
-    try:
-        converter.render_svg(svg_filename)
-        print(f"SVG berhasil dibuat: {svg_filename}")
-    except Exception as e:
-        print("Gagal membuat SVG:", e)
-
-
-    if HAS_TRIMESH:
-        obj_filename = f"output_{timestamp}.obj"
-        try:
-            converter.export_obj_extrude(obj_filename)
-            print(f"OBJ ekstrusi (3D) dibuat: {obj_filename}")
-        except Exception as e:
-            print("Gagal membuat OBJ ekstrusi:", e)
-    else:
-        print("Trimesh tidak tersedia — lewati ekspor 3D (instal 'trimesh' dan 'numpy' jika ingin).")
-
- 
-    if converter.items:
-        print("\nBenda yang terdeteksi:")
-        for i, it in enumerate(converter.items, 1):
-            print(f"{i}. type={it.kind}, props={it.props}")
-
-    print("\nSelesai.")
-
-
-if __name__ == "__main__":
-    main()
+import os
+import re
+import sys
+import itertools
+from datetime import datetime
+
+from cad_dxf import render_dxf_blocks, write_dxf_stream
+from cad_export import MESH_FORMATS, export_formats
+from cad_geometry import Circle, build_geometry, rect_points
+from cad_metrics import collect, instrumented, span
+from cad_layout import GAP, ROW_AISLE, SpatialHash, door_zones, interior, place, wants_rows
+from cad_shapes import find_shapes, register_shape, scene_clauses
+from cad_store import ItemStore, Props, props_version
+from cad_svgstream import render_svg_stream
+from cad_tokenizer import DIM, NUMBER, WORD, DIRECTION, TokenStream, tokenize
+
+
+# Dependensi berat (ezdxf, svgwrite, numpy) baru di-import saat renderer-nya pertama
+# kali dipakai, sehingga parse saja atau SVG streaming tidak membayar biayanya.
+REQUIRED = ["ezdxf", "svgwrite"]
+OPTIONAL = ["numpy", "trimesh"]
+
+
+def install_requirements(packages=REQUIRED):
+    # dipanggil eksplisit lewat `python test_teknikal.py --install`, tidak pernah saat import
+    import subprocess
+    from importlib.util import find_spec
+
+    missing = [pkg for pkg in packages if find_spec(pkg) is None]
+    for pkg in missing:
+        print(f"Package '{pkg}' belum ditemukan. Menginstall {pkg}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
+    return missing
+
+
+_capabilities = {}
+
+
+def has_mesh_support():
+    # Probe malas: dicek sekali saat pertama ditanya. Ekspor 3D (cad_mesh) hanya
+    # membutuhkan numpy; trimesh tidak lagi dipakai untuk menulis file.
+    if "mesh" not in _capabilities:
+        try:
+            import numpy  # noqa: F401
+            _capabilities["mesh"] = True
+        except Exception:
+            _capabilities["mesh"] = False
+    return _capabilities["mesh"]
+
+
+def __getattr__(name):
+    # `HAS_TRIMESH` tetap bisa di-import seperti dulu, tetapi baru dievaluasi saat diakses
+    if name == "HAS_TRIMESH":
+        return has_mesh_support()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_output_counter = itertools.count()
+
+
+def make_output_basename(prefix: str = "output", directory: str = ""):
+    # timestamp + pid + counter: unik walaupun dipanggil berkali-kali dalam detik yang sama
+    # atau dari beberapa proses sekaligus.
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    name = f"{prefix}_{timestamp}_{os.getpid()}_{next(_output_counter)}"
+    return os.path.join(directory, name) if directory else name
+
+
+def to_number(s):
+    
+    try:
+        return float(s)
+    except Exception:
+        return None
+
+
+def first_number(lookup, words):
+    # lookup = tokens.number_after / number_before; kata pertama yang memberi angka menang
+    for word in words:
+        value = lookup(word)
+        if value is not None:
+            return value
+    return None
+
+
+def normalize_description(description: str):
+    # teks yang benar-benar dibaca parser; juga kunci cache tingkat 1 (cad_cache)
+    return description.lower().strip().replace("×", "x")
+
+
+class CADItem:
+    __slots__ = ("kind", "props")
+
+    def __init__(self, kind, **kwargs):
+        self.kind = kind  # 'seat', 'leg', 'room', 'door', 'window', 'rect', 'circle', ...
+        self.props = Props(kwargs)
+
+
+class TextToCADConverter:
+    
+    def __init__(self):
+        self.items = ItemStore()
+        self._geometry = None
+        self._geometry_key = None
+
+  
+    @instrumented()
+    def parse(self, description: str):
+        desc = normalize_description(description)
+        tokens = tokenize(desc)
+
+        # satu pemindaian untuk semua kata kunci bentuk (cad_shapes), lalu parser bentuk
+        # dengan prioritas tertinggi yang mau menangani deskripsi ini
+        found = find_shapes(desc)
+        container = next((shape for shape, _, _ in found if shape.container), None)
+        if container is not None:
+            clauses, rest = scene_clauses(desc, found)
+            if clauses:
+                self._parse_scene(container, rest, clauses, rows=wants_rows(desc))
+                return
+        for shape in sorted({shape for shape, _, _ in found}, key=lambda shape: shape.priority):
+            if shape.parse(self, tokens) is not False:
+                return
+        self._parse_default(tokens)
+
+    @instrumented()
+    def _parse_scene(self, container, rest: str, clauses, rows: bool = False):
+        # "ruangan 20x30 m dengan 200 kursi dan 10 meja": wadah dari sisa teks, setiap klausa
+        # berjumlah diurai sekali menjadi prototipe lalu disalin ke posisi dari cad_layout
+        first = len(self.items)
+        container.parse(self, tokenize(rest))
+        room = self.items[first]
+
+        prototypes = []
+        for shape, count, text in clauses:
+            proto = TextToCADConverter()
+            tokens = tokenize(text)
+            if shape.parse(proto, tokens) is False:
+                proto._parse_default(tokens)
+            prototypes.append((shape, count, proto.items, proto.items.bounds()))
+
+        # jenis yang didaftarkan tanpa bounds (register_shape) tidak punya ukuran untuk ditata
+        for shape, count, items, b in prototypes:
+            if b is None and len(items):
+                print(f"{count} {shape.keywords[0]} dilewati: ukurannya tidak diketahui.")
+        prototypes = [p for p in prototypes if p[3] is not None]
+
+        cell = max((max(b[2] - b[0], b[3] - b[1]) for _, _, _, b in prototypes), default=0.0) + GAP
+        index = SpatialHash(cell)
+        for zone in door_zones(self.items, room):
+            index.insert(zone)
+        region = interior(room)
+        y = None
+        for shape, count, items, (minx, miny, maxx, maxy) in prototypes:
+            positions, y = place(index, region, (maxx - minx, maxy - miny), count,
+                                 row_gap=ROW_AISLE if rows else None, start_y=y)
+            for x, y0 in positions:
+                self._add_copy(items, x - minx, y0 - miny)
+            if len(positions) < count:
+                print(f"Hanya {len(positions)} dari {count} {shape.keywords[0]} muat di dalam {container.keywords[0]}.")
+
+    def _add_copy(self, items, dx: float, dy: float):
+        # salinan item prototipe digeser (dx, dy), relasi induk/anak ikut disalin
+        copies = {}
+        for item in items:
+            props = dict(item.props)
+            if "x" in props:
+                props["x"] += dx
+                props["y"] += dy
+            if "cx" in props:
+                props["cx"] += dx
+                props["cy"] += dy
+            parent = items.parent_of(item)
+            copies[item] = self.items.append(CADItem(item.kind, **props),
+                                             parent=copies[parent] if parent is not None else None)
+
+    @instrumented()
+    def _parse_chair(self, tokens: TokenStream):
+        
+        seat_w = 40.0
+        seat_d = 40.0
+        seat_h = 45.0
+        legs = 4
+
+       
+        dim = tokens.find_after("dudukan", (DIM,))
+        if dim:
+            seat_w, seat_d = dim.value, dim.value2
+        else:
+            
+            val = tokens.number_after("dudukan")
+            if val is not None:
+                seat_w = seat_d = val
+
+        
+        val = tokens.number_after("tinggi")
+        if val is not None:
+            seat_h = val
+
+        
+        count = tokens.number_before("kaki")
+        if count is not None:
+            legs = int(count)
+
+        
+        seat_x = 0.0
+        seat_y = 0.0
+        seat = self.items.append(CADItem("seat", x=seat_x, y=seat_y, width=seat_w, depth=seat_d, height=seat_h))
+
+        self._add_legs(seat, legs)
+
+    def _add_legs(self, top, legs: int):
+        # kaki di bawah papan (dudukan kursi / daun meja), tingginya sama dengan papan
+        x, y = top.props["x"], top.props["y"]
+        w, d, h = top.props["width"], top.props["depth"], top.props["height"]
+        leg_radius = max(min(w, d) * 0.05, 0.5)  
+        leg_pos = []
+       
+        if legs == 1:
+            leg_pos = [(x + w / 2, y + d / 2)]
+        elif legs == 2:
+            leg_pos = [(x + 0.15 * w, y + d / 2),
+                       (x + 0.85 * w, y + d / 2)]
+        elif legs == 3:
+            leg_pos = [(x + 0.1 * w, y + 0.9 * d),
+                       (x + 0.9 * w, y + 0.9 * d),
+                       (x + 0.5 * w, y + 0.1 * d)]
+        else:
+            
+            leg_pos = [
+                (x + 0.1 * w, y + 0.1 * d),
+                (x + 0.9 * w, y + 0.1 * d),
+                (x + 0.1 * w, y + 0.9 * d),
+                (x + 0.9 * w, y + 0.9 * d),
+            ]
+            if legs > 4:
+                leg_pos.append((x + 0.5 * w, y + 0.5 * d))
+
+        for lx, ly in leg_pos[:legs]:
+            self.items.append(CADItem("leg", cx=lx, cy=ly, radius=leg_radius, height=h), parent=top)
+
+    @instrumented()
+    def _parse_table(self, tokens: TokenStream):
+        # "meja 120x80 tinggi 75 dengan 4 kaki" / "table 120x80 height 75 with 4 legs"
+        w, d, h, legs = 120.0, 80.0, 75.0, 4
+        dim = tokens.find((DIM,))
+        if dim:
+            w, d = dim.value, dim.value2
+        val = first_number(tokens.number_after, ("tinggi", "height"))
+        if val is not None:
+            h = val
+        count = first_number(tokens.number_before, ("kaki", "leg"))
+        if count is not None:
+            legs = int(count)
+        table = self.items.append(CADItem("table", x=0.0, y=0.0, width=w, depth=d, height=h))
+        self._add_legs(table, legs)
+
+    @instrumented()
+    def _parse_shelf(self, tokens: TokenStream):
+        # "rak buku 80x30 tinggi 180 dengan 5 tingkat" / "bookcase 80x30 height 180 with 5 levels"
+        w, d, h, levels = 80.0, 30.0, 180.0, 5
+        dim = tokens.find((DIM,))
+        if dim:
+            w, d = dim.value, dim.value2
+        val = first_number(tokens.number_after, ("tinggi", "height"))
+        if val is not None:
+            h = val
+        count = first_number(tokens.number_before, ("tingkat", "susun", "level", "shelves"))
+        if count is not None:
+            levels = max(int(count), 1)
+        self.items.append(CADItem("shelf", x=0.0, y=0.0, width=w, depth=d, height=h, levels=levels))
+
+    @instrumented()
+    def _parse_room(self, tokens: TokenStream):
+        
+        room_w = 400.0
+        room_d = 500.0
+
+       
+        dim = tokens.find((DIM,))
+        if dim:
+            room_w, room_d = dim.value, dim.value2
+        elif "meter" in tokens.text and "x" in tokens.text:
+            
+            for t in tokens:
+                if t.kind == NUMBER and t.unit == "m":
+                    room_w = room_d = t.value
+                    break
+
+        
+        room = self.items.append(CADItem("room", x=0.0, y=0.0, width=room_w, depth=room_d, height=300.0))
+
+        
+        # "2 pintu di sisi barat": jumlah = angka tepat sebelum kata kunci,
+        # sisi = arah pertama sesudahnya sebelum bukaan berikutnya disebut.
+        openings = {"pintu": [], "jendela": []}
+        current = None
+        for i, t in enumerate(tokens):
+            if t.kind == WORD and t.value in openings:
+                count = tokens.count_before(i)
+                current = [int(count) if count is not None else 1, None]
+                openings[t.value].append(current)
+            elif t.kind == DIRECTION and current is not None and current[1] is None:
+                current[1] = t.value
+
+        for kind in ["pintu", "jendela"]:
+            for count, side in openings[kind]:
+                for _ in range(count):
+                    
+                    if kind == "pintu":
+                        w = 90.0  # cm
+                        h = 210.0
+                        self.items.append(CADItem("door", side=side or "south", width=w, height=h), parent=room)
+                    else:
+                        w = 120.0
+                        h = 120.0
+                        self.items.append(CADItem("window", side=side or "north", width=w, height=h), parent=room)
+
+    @instrumented()
+    def _parse_box(self, tokens: TokenStream):
+        dim = tokens.find((DIM,))
+        if not dim:
+            return False
+        self.items.append(CADItem("rect", x=0.0, y=0.0, width=dim.value, depth=dim.value2, height=30.0))
+
+    @instrumented()
+    def _parse_circle(self, tokens: TokenStream):
+        t = tokens.find((NUMBER, DIM))
+        if not t:
+            return False
+        r = t.value
+        self.items.append(CADItem("circle", cx=r, cy=r, radius=r, height=30.0))
+
+    @instrumented()
+    def _parse_default(self, tokens: TokenStream):
+        # tidak ada bentuk yang dikenali (atau semua parser menolak): kotak bawaan
+        self.items.append(CADItem("rect", x=0.0, y=0.0, width=100.0, depth=50.0, height=30.0))
+
+    @instrumented(output=True)
+    def save_scene(self, target):
+        # hasil parse ke berkas adegan biner (cad_scenefile); dibuka lagi dengan from_scene
+        from cad_scenefile import save_scene
+
+        return save_scene(self.items, target)
+
+    @classmethod
+    def from_scene(cls, path: str, mode: str = "r"):
+        # item langsung dari memmap berkas adegan, tanpa parse
+        from cad_scenefile import load_scene
+
+        converter = cls()
+        converter.items = load_scene(path, mode)
+        return converter
+
+    def geometry(self):
+        # IR geometri dibangun sekali lalu dipakai ulang oleh semua renderer selama
+        # daftar item tidak berubah: item ditambah/dihapus (version), props diedit di
+        # tempat (props_version) atau kolom ditransformasi
+        key = (id(self.items), len(self.items), getattr(self.items, "version", None), props_version())
+        if self._geometry is None or self._geometry_key != key:
+            with span("geometry"):
+                self._geometry = build_geometry(self.items)
+            self._geometry_key = key
+        return self._geometry
+
+    @instrumented(output=True)
+    def render_dxf(self, target):
+        # target: path file atau stream teks yang sudah terbuka (mis. io.StringIO)
+        import ezdxf
+
+        geo = self.geometry()
+        doc = ezdxf.new("R2010")
+        msp = doc.modelspace()
+
+       
+        msp.add_text("TAMPAK ATAS", dxfattribs={"height": 5, "insert": (0, -10)})
+        msp.add_text("TAMPAK DEPAN", dxfattribs={"height": 5, "insert": (0, 300)})
+
+        
+        for prim in geo.top:
+            if type(prim) is Circle:
+                msp.add_circle((prim.cx, prim.cy), prim.r)
+            else:
+                msp.add_lwpolyline(rect_points(prim.x, prim.y, prim.w, prim.h))
+
+        
+        y_offset = 320
+        for prim in geo.front:
+            msp.add_lwpolyline(rect_points(prim.x, y_offset + prim.y, prim.w, prim.h))
+
+        
+        with span("dxf.write"):
+            if hasattr(target, "write"):
+                doc.write(target)
+            else:
+                doc.saveas(target)
+        return target
+
+    @instrumented(output=True)
+    def render_dxf_blocks(self, target, min_instances: int = 2):
+        # bagian berulang sebagai BLOCK + INSERT: file lebih kecil dan cepat ditulis
+        return render_dxf_blocks(self.geometry(), target, min_instances)
+
+    @instrumented(output=True)
+    def render_dxf_stream(self, target):
+        # DXF R12 ditulis langsung ke file/stream tanpa dokumen ezdxf di memori
+        return write_dxf_stream(self.items, target)
+
+    @instrumented(output=True)
+    def render_svg(self, target):
+        # target: path file atau stream teks yang sudah terbuka
+        import svgwrite
+
+        geo = self.geometry()
+        
+        minx, miny, maxx, maxy = 0, 0, 800, 600
+        
+        if geo.bounds:
+            minx, maxx = geo.bounds[0] - 20, geo.bounds[2] + 20
+            miny, maxy = geo.bounds[1] - 20, geo.bounds[3] + 20
+
+        width = int(max(800, maxx - minx + 200))
+        height = int(max(600, maxy - miny + 600))
+        stream = hasattr(target, "write")
+        dwg = svgwrite.Drawing(None if stream else target, size=(f"{width}px", f"{height}px"))
+
+        # top view group
+        top_group = dwg.add(dwg.g(id="top_view", transform=f"translate({50 - minx}, {50 - miny})"))
+        top_group.add(dwg.text("TAMPAK ATAS", insert=(0, -10), font_size="14px", font_weight="bold"))
+
+        for prim in geo.top:
+            if type(prim) is Circle:
+                if prim.role == "leg":
+                    top_group.add(dwg.circle(center=(prim.cx, prim.cy), r=prim.r, fill="black"))
+                else:
+                    top_group.add(dwg.circle(center=(prim.cx, prim.cy), r=prim.r, fill="none", stroke="black", stroke_width=2))
+            else:
+                top_group.add(dwg.rect(insert=(prim.x, prim.y), size=(prim.w, prim.h), fill="none", stroke="black", stroke_width=2))
+
+      
+        front_y_offset = maxy - miny + 120
+        front_group = dwg.add(dwg.g(id="front_view", transform=f"translate({50 - minx}, {front_y_offset})"))
+        front_group.add(dwg.text("TAMPAK DEPAN", insert=(0, -10), font_size="14px", font_weight="bold"))
+
+        for prim in geo.front:
+            front_group.add(dwg.rect(insert=(prim.x, prim.y), size=(prim.w, prim.h), fill="none", stroke="black", stroke_width=2))
+
+        with span("svg.write"):
+            if stream:
+                dwg.write(target)
+            else:
+                dwg.save()
+        return target
+
+    @instrumented(output=True)
+    def render_svg_stream(self, target, chunk_size: int = 2048):
+        # SVG tanpa DOM svgwrite: memori konstan, cocok untuk denah besar
+        return render_svg_stream(self.items, target, chunk_size)
+
+    @instrumented()
+    def render_svg_tiles(self, directory: str, tile_size: float = 1000.0, tile_px: int = 512, levels: int = None):
+        # tampak atas sebagai tile SVG bertingkat detail + manifest.json (cad_svgtiles)
+        from cad_svgtiles import write_tiles
+
+        return write_tiles(self.items, directory, tile_size, tile_px, levels)
+    
+    def _solid_arrays(self):
+        from cad_mesh import solid_arrays
+
+        geometry = None if hasattr(self.items, "columns") else self.geometry()
+        return solid_arrays(self.items, geometry)
+
+    @instrumented()
+    def mesh(self, quantize: bool = False):
+        # Semua kotak/silinder dibangun sekaligus dari mesh templat (lihat cad_mesh),
+        # bukan satu objek trimesh per primitif, lalu vertex yang sama digabung.
+        # quantize=True: posisi float32. Hasil (vertices, faces) atau None jika kosong.
+        from cad_mesh import build_mesh, weld
+
+        boxes, cylinders = self._solid_arrays()
+        if not len(boxes) and not len(cylinders):
+            print("Tidak ada mesh untuk diekspor.")
+            return None
+        with span("mesh.build"):
+            vertices, faces = build_mesh(boxes, cylinders)
+        with span("mesh.weld"):
+            return weld(vertices, faces, quantize=quantize)
+
+    @instrumented(output=True)
+    def export_obj_extrude(self, target, quantize: bool = False):
+        if not has_mesh_support():
+            print("numpy tidak tersedia — melewatkan ekspor 3D.")
+            return None
+        from cad_mesh import write_obj
+
+        mesh = self.mesh(quantize)
+        if mesh is None:
+            return None
+        with span("obj.write"):
+            write_obj(*mesh, target)
+        return target
+
+    @instrumented(output=True)
+    def export_stl(self, target):
+        # target untuk STL/GLB: path file atau stream biner
+        if not has_mesh_support():
+            print("numpy tidak tersedia — melewatkan ekspor 3D.")
+            return None
+        from cad_mesh import write_stl
+
+        mesh = self.mesh(quantize=True)   # STL selalu float32
+        if mesh is None:
+            return None
+        with span("stl.write"):
+            write_stl(*mesh, target)
+        return target
+
+    @instrumented(output=True)
+    def export_glb(self, target, instances: bool = False):
+        # instances=True: tiap solid menjadi node sendiri yang memakai mesh templat bersama
+        if not has_mesh_support():
+            print("numpy tidak tersedia — melewatkan ekspor 3D.")
+            return None
+        from cad_mesh import write_glb, write_glb_instances
+
+        if instances:
+            boxes, cylinders = self._solid_arrays()
+            if not len(boxes) and not len(cylinders):
+                print("Tidak ada mesh untuk diekspor.")
+                return None
+            with span("glb.write"):
+                write_glb_instances(boxes, cylinders, target)
+            return target
+        mesh = self.mesh(quantize=True)   # glTF menyimpan posisi sebagai float32
+        if mesh is None:
+            return None
+        with span("glb.write"):
+            write_glb(*mesh, target)
+        return target
+
+
+# Bentuk bawaan. Prioritas kecil menang jika beberapa bentuk disebut sekaligus, mis.
+# "kursi ... dudukan persegi" tetap kursi; kotak/lingkaran tanpa ukuran menolak dan
+# jatuh ke bentuk berikutnya atau kotak bawaan.
+register_shape("chair", ("kursi", "chair"), TextToCADConverter._parse_chair, priority=10,
+               words=("dudukan", "tinggi", "kaki"))
+register_shape("table", ("meja", "table", "desk"), TextToCADConverter._parse_table, priority=20,
+               words=("tinggi", "height", "kaki", "leg"))
+register_shape("shelf", ("rak", "shelf", "shelves", "bookcase"), TextToCADConverter._parse_shelf, priority=30,
+               words=("tinggi", "height", "tingkat", "susun", "level", "shelves"))
+register_shape("room", ("ruang", "kamar", "room"), TextToCADConverter._parse_room, priority=40,
+               words=("pintu", "jendela"), container=True)
+register_shape("box", ("kotak", "persegi", "box", "square", "rectangle"), TextToCADConverter._parse_box,
+               priority=50)
+register_shape("circle", ("lingkaran", "circle"), TextToCADConverter._parse_circle, priority=60)
+
+
+def edit_loop(description: str, basename: str, formats=("dxf", "svg")):
+    # --edit: deskripsi diedit berulang kali; DXF/SVG yang sama hanya ditambal (cad_incremental)
+    from cad_incremental import EditSession
+
+    session = EditSession()
+    session.update(description)
+    session.build(*formats)
+    while True:
+        try:
+            description = input("\nEdit deskripsi (kosong untuk selesai): ")
+        except EOFError:
+            break
+        if not description.strip():
+            break
+        diff = session.update(description)
+        paths = [getattr(session, f"render_{fmt}")(f"{basename}.{fmt}") for fmt in formats]
+        print(f"{len(diff.added)} item baru, {len(diff.removed)} dihapus, {len(diff.changed)} berubah: "
+              + ", ".join(paths))
+
+
+def main(formats=("dxf", "svg", "obj"), stats: bool = False, metrics_log: str = None, profile: bool = False,
+         edit: bool = False, archive: str = None, compression: str = "deflate", level: int = 6):
+    print("========================================================================\n")
+
+    namaprogram = "Test Teknikal PT Green Global Sumatera\n"
+    devby = "Developed by Ananda Rauf Maududi\n"
+    devdate = "Tanggal Test: 24 September 2025\n"
+
+    print(namaprogram)
+    print(devby)
+    print(devdate)
+    print("========================================================================\n")
+
+    print("Contoh input yang dapat diproses:")
+    print("- 'Kursi dengan 4 kaki, dudukan persegi 40x40 cm, tinggi 45 cm'")
+    print("- 'Ruangan ukuran 4x5 meter, dengan 1 pintu di sisi barat dan 1 jendela di sisi utara'")
+    print("- 'Meja 120x80 tinggi 75 dengan 4 kaki' atau 'Rak buku 80x30 tinggi 180 dengan 5 tingkat'")
+    print("- 'Kotak 100x50' atau 'Lingkaran diameter 80'")
+    print("- 'Ruangan 20x30 m dengan 200 kursi dan 10 meja, 1 pintu di sisi selatan'\n")
+
+    input_deskripsi_sketsa = input("Masukan deskripsi sketsa anda: ")
+
+    # --stats / --metrics-log / --profile: waktu, jumlah item dan ukuran output per tahap
+    with collect(stats, metrics_log, profile) as registry:
+        converter = TextToCADConverter()
+        converter.parse(input_deskripsi_sketsa)
+
+   
+        basename = make_output_basename()
+
+        if set(formats) & MESH_FORMATS and not has_mesh_support():
+            print("numpy tidak tersedia — lewati ekspor 3D (instal 'numpy' jika ingin).")
+            formats = tuple(fmt for fmt in formats if fmt not in MESH_FORMATS)
+
+    
+        labels = {"dxf": "DXF berhasil dibuat", "svg": "SVG berhasil dibuat", "obj": "OBJ ekstrusi (3D) dibuat",
+                  "stl": "STL (3D) dibuat", "glb": "GLB (3D) dibuat"}
+        failures = {"dxf": "Gagal membuat DXF:", "svg": "Gagal membuat SVG:", "obj": "Gagal membuat OBJ ekstrusi:",
+                    "stl": "Gagal membuat STL:", "glb": "Gagal membuat GLB:"}
+        if archive:
+            # semua format langsung ke satu arsip zip (cad_archive)
+            from cad_archive import CADArchive
+
+            with CADArchive(archive, compression, level) as out:
+                results = out.add(converter, os.path.basename(basename), formats,
+                                  description=input_deskripsi_sketsa)
+        else:
+            # profil hanya melihat proses ini, jadi semua format dirender di sini
+            results = export_formats(converter, basename, formats, mode="serial" if profile else "auto")
+    for fmt, result in results.items():
+        if result.ok:
+            path = f"{archive}:{result.path}" if archive else result.path
+            print(f"{labels[fmt]}: {path} ({result.seconds:.2f} s)")
+        else:
+            print(failures[fmt], result.error)
+
+ 
+    if converter.items:
+        print("\nBenda yang terdeteksi:")
+        for i, it in enumerate(converter.items, 1):
+            print(f"{i}. type={it.kind}, props={it.props}")
+
+    if registry is not None:
+        print("\nStatistik per tahap:")
+        print(registry.report() if profile else registry.format())
+
+    if edit:
+        edit_loop(input_deskripsi_sketsa, basename, tuple(fmt for fmt in ("dxf", "svg") if results.get(fmt)
+                                                          and results[fmt].ok))
+
+    print("\nSelesai.")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from cad_archive import COMPRESSION, DEFAULT_LEVEL, check_level
+
+    parser = argparse.ArgumentParser(description="konversi deskripsi teks menjadi DXF/SVG/OBJ")
+    parser.add_argument("--install", action="store_true", help="instal dependensi yang belum ada lalu keluar")
+    parser.add_argument("--stats", action="store_true", help="cetak waktu, jumlah item dan ukuran output per tahap")
+    parser.add_argument("--metrics-log", help="tambahkan event per tahap ke file JSONL ini")
+    parser.add_argument("--profile", action="store_true", help="cProfile + tracemalloc untuk konversi ini")
+    parser.add_argument("--edit", action="store_true", help="setelah konversi, edit deskripsi berulang kali dan "
+                                                            "perbarui DXF/SVG secara inkremental")
+    parser.add_argument("--archive", help="tulis semua format ke satu arsip zip ini (+ manifest.json)")
+    parser.add_argument("--compression", choices=tuple(COMPRESSION), default="deflate", help="kompresi --archive")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL, help="level kompresi --archive")
+    args = parser.parse_args()
+    if args.archive:
+        try:
+            check_level(args.compression, args.level)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.install:
+        install_requirements(REQUIRED + OPTIONAL)
+    else:
+        main(stats=args.stats, metrics_log=args.metrics_log, profile=args.profile, edit=args.edit,
+             archive=args.archive, compression=args.compression, level=args.level)
@@ -1,55 +1,232 @@
-import ezdxf
-import matplotlib.pyplot as plt
-
-
-print("========================================================================\n")
-
-namaprogram = "Test Teknikal PT Green Global Sumatera\n"
-devby = "Developed by Ananda Rauf Maududi\n"
-devdate = "Tanggal Test: 23 September 2025\n"
-
-print(namaprogram)
-print(devby)
-print(devdate)
-print("========================================================================\n")
-
-
-
-dimension_length = int(input("Masukan ukuran dimension length: "))
-dimension_width = int(input("Masukan ukuran dimension width: "))
-
-
-
-doc = ezdxf.new(dxfversion="R2010")
-msp = doc.modelspace()
-
-
-points = [
-    (0, 0),
-    (dimension_length, 0),
-    (dimension_length, dimension_width),
-    (0, dimension_width),
-    (0, 0)  
-]
-
-msp.add_lwpolyline(points, close=True)
-
-dxf_filename = "output_persegi_panjang.dxf"
-doc.saveas(dxf_filename)
-print(f"File DXF berhasil dibuat: {dxf_filename}")
-
-
-x_coords = [p[0] for p in points]
-y_coords = [p[1] for p in points]
-
-plt.figure(figsize=(6, 6))
-plt.plot(x_coords, y_coords, 'b-', linewidth=2)
-plt.fill(x_coords, y_coords, alpha=0.2, color='skyblue')
-plt.title(f"Preview Persegi Panjang ({dimension_length} x {dimension_width})")
-plt.axis('equal')
-plt.grid(True)
-
-png_filename = "output_persegipanjang.png"
-plt.savefig(png_filename, dpi=150)
-plt.close()
-print(f"File PNG berhasil dibuat: {png_filename}")
+import os
+import re
+import csv
+import math
+from typing import NamedTuple
+
+
+# Persegi panjang ke DXF + preview PNG. Tanpa argumen: mode interaktif seperti semula
+# (dua input lalu output_persegi_panjang.dxf dan output_persegipanjang.png). Mode batch
+# membaca banyak pasangan panjang/lebar dari CSV:
+#
+#   python test_teknikal_persegi_panjang.py --csv panel.csv -o output_panel -j 4
+#   python test_teknikal_persegi_panjang.py --csv panel.csv --single-dxf panel.dxf --no-preview
+#
+# Biaya terbesar skrip lama adalah membuat dan menutup figure pyplot untuk setiap persegi.
+# Di sini satu Figure Agg (tanpa pyplot) dan satu dokumen ezdxf dipakai ulang: setiap persegi
+# hanya mengganti titik PolyCollection/LineCollection dan LWPOLYLINE lalu menyimpan.
+
+DXF_FILENAME = "output_persegi_panjang.dxf"
+PNG_FILENAME = "output_persegipanjang.png"
+
+
+class Rectangle(NamedTuple):
+    length: float
+    width: float
+    name: str = "persegi_panjang"
+
+
+def rectangle_points(length: float, width: float):
+    return [(0, 0), (length, 0), (length, width), (0, width), (0, 0)]
+
+
+def _number(text: str):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def unique_names(rects):
+    # Nama dipakai sebagai nama file: hanya huruf, angka, "_", "-" dan "." (tanpa "/" atau
+    # ".." yang keluar dari direktori output). Nama yang sudah dipakai (tanpa membedakan huruf
+    # besar/kecil) diberi akhiran nomor urut, mis. "a" kedua di baris 2 menjadi "a_0002".
+    used = set()
+    out = []
+    for i, rect in enumerate(rects, 1):
+        name = re.sub(r"[^\w.-]+", "_", os.path.basename(rect.name.replace("\\", "/"))).strip("._")
+        name = name or f"persegi_{i:04d}"
+        candidate, n = name, i
+        while candidate.lower() in used:
+            candidate = f"{name}_{n:04d}"
+            n += 1
+        used.add(candidate.lower())
+        out.append(rect if candidate == rect.name else rect._replace(name=candidate))
+    return out
+
+
+def read_csv(path: str):
+    # kolom: panjang, lebar[, nama]; baris judul, baris kosong dan komentar (#) dilewati
+    rects = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            try:
+                length, width = _number(row[0]), _number(row[1])
+            except (ValueError, IndexError):
+                if rects:
+                    raise ValueError(f"baris CSV tidak valid: {row!r}")
+                continue   # baris judul
+            name = row[2].strip() if len(row) > 2 and row[2].strip() else f"persegi_{len(rects) + 1:04d}"
+            rects.append(Rectangle(length, width, name))
+    return unique_names(rects)
+
+
+class RectangleDXF:
+    # satu dokumen dengan satu LWPOLYLINE; save() hanya mengganti titiknya
+
+    def __init__(self):
+        import ezdxf
+
+        self.doc = ezdxf.new(dxfversion="R2010")
+        self.polyline = self.doc.modelspace().add_lwpolyline(rectangle_points(1, 1), close=True)
+
+    def save(self, rect, path: str):
+        self.polyline.set_points(rectangle_points(rect.length, rect.width))
+        self.doc.saveas(path)
+        return path
+
+
+def write_dxf_sheet(rects, path: str, gap: float = None):
+    # semua persegi di satu DXF, disusun dalam grid dengan nama di atas masing-masing
+    import ezdxf
+
+    doc = ezdxf.new(dxfversion="R2010")
+    msp = doc.modelspace()
+    if rects:
+        cell_w = max(r.length for r in rects)
+        cell_h = max(r.width for r in rects)
+        gap = gap if gap is not None else 0.2 * max(cell_w, cell_h)
+        columns = math.ceil(math.sqrt(len(rects)))
+        text_h = 0.05 * max(cell_w, cell_h)
+        for i, rect in enumerate(rects):
+            x = (i % columns) * (cell_w + gap)
+            y = -(i // columns) * (cell_h + gap)
+            msp.add_lwpolyline([(x + px, y + py) for px, py in rectangle_points(rect.length, rect.width)],
+                               close=True)
+            msp.add_text(rect.name, dxfattribs={"height": text_h, "insert": (x, y + rect.width + text_h / 2)})
+    doc.saveas(path)
+    return path
+
+
+class PreviewRenderer:
+    # Figure Agg yang dipakai ulang: isi dan garis tepi adalah satu PolyCollection dan satu
+    # LineCollection yang titiknya diganti per persegi. Tampilan mengikuti skrip lama
+    # (garis biru tebal 2, isi skyblue alpha 0.2, sumbu sama, grid, 6x6 inci, dpi 150).
+
+    def __init__(self, dpi: int = 150, figsize=(6, 6)):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.figure import Figure
+
+        self.dpi = dpi
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self.fill = self.ax.add_collection(PolyCollection([], facecolors="skyblue", alpha=0.2, edgecolors="none"))
+        self.outline = self.ax.add_collection(LineCollection([], colors="b", linewidths=2))
+        self.ax.set_aspect("equal", adjustable="datalim")
+        self.ax.grid(True)
+
+    def render(self, rect, path: str):
+        points = rectangle_points(rect.length, rect.width)
+        self.fill.set_verts([points])
+        self.outline.set_segments([points])
+        # collection tidak ikut autoscale: batas data diganti manual lalu margin bawaan 5%
+        self.ax.dataLim.update_from_data_xy(points, ignore=True)
+        self.ax.autoscale_view()
+        self.ax.set_title(f"Preview Persegi Panjang ({rect.length} x {rect.width})")
+        self.figure.savefig(path, dpi=self.dpi)
+        return path
+
+
+_worker = {}
+
+
+def _render_chunk(rects, directory: str, dxf: bool, preview: bool):
+    # dijalankan di proses pool (atau langsung jika serial); dokumen dan figure per proses
+    if dxf and "dxf" not in _worker:
+        _worker["dxf"] = RectangleDXF()
+    if preview and "png" not in _worker:
+        _worker["png"] = PreviewRenderer()
+    out = []
+    for rect in rects:
+        base = os.path.join(directory, rect.name)
+        out.append((_worker["dxf"].save(rect, base + ".dxf") if dxf else None,
+                    _worker["png"].render(rect, base + ".png") if preview else None))
+    return out
+
+
+def batch(rects, directory: str = ".", single_dxf: str = None, preview: bool = True, jobs: int = 1,
+          chunk_size: int = 32):
+    # Satu DXF per persegi (atau satu lembar DXF jika single_dxf) + preview PNG per persegi.
+    # jobs > 1: potongan berisi chunk_size persegi dibagi ke ProcessPoolExecutor.
+    # Nama file dari rect.name setelah unique_names. Hasil: {"dxf": [path...], "png": [path...]}
+    os.makedirs(directory, exist_ok=True)
+    rects = unique_names(rects)
+    result = {"dxf": [], "png": []}
+    if single_dxf:
+        result["dxf"].append(write_dxf_sheet(rects, os.path.join(directory, single_dxf)))
+    dxf_each = not single_dxf
+    if not (dxf_each or preview):
+        return result
+
+    chunks = [rects[i:i + chunk_size] for i in range(0, len(rects), chunk_size)]
+    if jobs > 1 and len(chunks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            done = list(pool.map(_render_chunk, chunks, *zip(*[(directory, dxf_each, preview)] * len(chunks))))
+    else:
+        done = [_render_chunk(chunk, directory, dxf_each, preview) for chunk in chunks]
+    for chunk in done:
+        for dxf_path, png_path in chunk:
+            if dxf_path:
+                result["dxf"].append(dxf_path)
+            if png_path:
+                result["png"].append(png_path)
+    return result
+
+
+def main():
+    print("========================================================================\n")
+
+    namaprogram = "Test Teknikal PT Green Global Sumatera\n"
+    devby = "Developed by Ananda Rauf Maududi\n"
+    devdate = "Tanggal Test: 23 September 2025\n"
+
+    print(namaprogram)
+    print(devby)
+    print(devdate)
+    print("========================================================================\n")
+
+    dimension_length = int(input("Masukan ukuran dimension length: "))
+    dimension_width = int(input("Masukan ukuran dimension width: "))
+    rect = Rectangle(dimension_length, dimension_width)
+
+    RectangleDXF().save(rect, DXF_FILENAME)
+    print(f"File DXF berhasil dibuat: {DXF_FILENAME}")
+
+    PreviewRenderer().render(rect, PNG_FILENAME)
+    print(f"File PNG berhasil dibuat: {PNG_FILENAME}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="persegi panjang ke DXF + preview PNG (interaktif atau batch CSV)")
+    parser.add_argument("--csv", help="CSV panjang,lebar[,nama]; tanpa ini program bertanya lewat input()")
+    parser.add_argument("-o", "--output", default="output_persegi_panjang", help="direktori output batch")
+    parser.add_argument("--single-dxf", metavar="NAMA", help="tulis semua persegi ke satu DXF ini (di direktori output)")
+    parser.add_argument("--no-preview", action="store_true", help="jangan buat PNG")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="jumlah proses untuk batch")
+    args = parser.parse_args()
+    if args.csv:
+        rects = read_csv(args.csv)
+        start = time.perf_counter()
+        result = batch(rects, args.output, args.single_dxf, not args.no_preview, args.jobs)
+        seconds = time.perf_counter() - start
+        print(f"{len(rects)} persegi: {len(result['dxf'])} DXF, {len(result['png'])} PNG di {args.output} "
+              f"({seconds:.2f} s, {len(rects) / seconds if seconds else 0:.1f} persegi/s)")
+    else:
+        main()
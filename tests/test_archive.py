@@ -0,0 +1,105 @@
+import io
+import os
+import json
+import stat
+import zipfile
+
+import pytest
+
+from cad_archive import MANIFEST, CADArchive, check_level
+from test_teknikal import TextToCADConverter
+
+
+def converter(description="kursi 4 kaki 40x40 tinggi 45"):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def read(path):
+    with zipfile.ZipFile(path) as zf:
+        return set(zf.namelist()), json.loads(zf.read(MANIFEST))
+
+
+def test_manifest_lists_exactly_the_members(tmp_path):
+    path = tmp_path / "out.zip"
+    with CADArchive(str(path)) as archive:
+        results = archive.add(converter(), "kursi", ("dxf", "svg"), description="kursi")
+        entry = archive.entry("cache", items=0)
+        archive.add_bytes(entry, "svg", b"<svg/>")
+        empty = archive.add_bytes(entry, "obj", b"")
+    assert all(r.ok for r in results.values())
+    assert not empty.ok and empty.path is None
+    names, manifest = read(path)
+    listed = {f["member"] for e in manifest["entries"] for f in e["files"].values()}
+    assert listed == names - {MANIFEST} == {"kursi.dxf", "kursi.svg", "cache.svg"}
+    kursi, cache = manifest["entries"]
+    assert kursi["description"] == "kursi" and kursi["items"] == len(converter().items)
+    assert cache["errors"] == {"obj": "tidak ada output"}
+
+
+def test_renderer_without_output_leaves_no_member(tmp_path):
+    # lingkaran tanpa solid 3D tetap tanpa anggota .obj yang kosong
+    path = tmp_path / "out.zip"
+    conv = TextToCADConverter()
+    with CADArchive(str(path), "stored") as archive:
+        results = archive.add(conv, "kosong", ("svg", "obj"))
+    names, manifest = read(path)
+    assert not results["obj"].ok
+    assert "kosong.obj" not in names
+    assert "obj" in manifest["entries"][0]["errors"]
+
+
+def test_archive_file_mode_follows_umask(tmp_path):
+    old = os.umask(0o022)
+    try:
+        path = tmp_path / "out.zip"
+        with CADArchive(str(path)) as archive:
+            archive.add(converter(), "kursi", ("svg",))
+    finally:
+        os.umask(old)
+    if os.name == "posix":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_stream_target_and_discard(tmp_path):
+    buf = io.BytesIO()
+    with CADArchive(buf, "lzma") as archive:
+        archive.add(converter(), "kursi", ("dxf",))
+    assert "kursi.dxf" in zipfile.ZipFile(io.BytesIO(buf.getvalue())).namelist()
+
+    path = tmp_path / "batal.zip"
+    with pytest.raises(RuntimeError):
+        with CADArchive(str(path)) as archive:
+            archive.add(converter(), "kursi", ("svg",))
+            raise RuntimeError("gagal")
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("compression, level", [("deflate", 10), ("deflate", -1), ("bzip2", 0), ("gzip", 6)])
+def test_invalid_level_rejected_before_writing(tmp_path, compression, level):
+    with pytest.raises(ValueError):
+        check_level(compression, level)
+    with pytest.raises(ValueError):
+        CADArchive(str(tmp_path / "out.zip"), compression, level)
+    assert os.listdir(tmp_path) == []
+
+
+def test_batch_cached_archive_matches_manifest(tmp_path, monkeypatch):
+    # artefak kosong dari cache (renderer tanpa output) tidak boleh tercatat sebagai anggota
+    import cad_export
+    from cad_batch import convert_record
+
+    render = cad_export.export_bytes
+    monkeypatch.setattr(cad_export, "export_bytes", lambda conv, fmt: None if fmt == "obj" else render(conv, fmt))
+    cache = (str(tmp_path / "cache"), 1 << 20, 1 << 24)
+    path = tmp_path / "batch.zip"
+    with CADArchive(str(path)) as archive:
+        for i, text in enumerate(["lingkaran 30", "lingkaran 30"]):
+            result = convert_record({"index": i, "id": i, "description": text}, str(tmp_path),
+                                    ("svg", "obj"), cache, archive)
+            assert result["errors"] == {"obj": "tidak ada output"} and "obj" not in result["outputs"]
+    names, manifest = read(path)
+    listed = {f["member"] for e in manifest["entries"] for f in e["files"].values()}
+    assert listed == names - {MANIFEST} and len(listed) == 2
+    assert all(e["errors"] == {"obj": "tidak ada output"} for e in manifest["entries"])
@@ -0,0 +1,45 @@
+import io
+import os
+import json
+
+from cad_batch import convert_record, iter_records, main, run_batch
+
+
+def records(text, input_format="auto"):
+    return list(iter_records(io.StringIO(text), input_format))
+
+
+def test_iter_records_text_and_jsonl():
+    got = records('kotak 100x50\n\n{"id": "a", "description": "lingkaran 30"}\n{"text": "kursi"}\n')
+    assert [(r["index"], r["id"], r["description"]) for r in got] == [
+        (0, 0, "kotak 100x50"), (2, "a", "lingkaran 30"), (3, 3, "kursi")]
+
+
+def test_iter_records_bad_json_lines_are_input_errors():
+    got = records('{"id": 1\n["kotak"]\n"kotak"\n12\n', "jsonl")
+    assert [r["description"] for r in got] == [None] * 4
+    assert all(r["error"] for r in got)
+    results = [convert_record(r) for r in got]
+    assert all(not r["ok"] and "input" in r["errors"] for r in results)
+
+
+def test_run_batch_serial_and_pool_keep_input_order(tmp_path):
+    texts = ["kotak 100x50", "lingkaran 30", "kursi 4 kaki", "ruangan 4x5 m"]
+    for workers in (1, 2):
+        out = tmp_path / f"j{workers}"
+        recs = [{"index": i, "id": i, "description": t} for i, t in enumerate(texts)]
+        results = list(run_batch(recs, str(out), ("dxf", "svg"), workers=workers, max_pending=2))
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert all(r["ok"] for r in results)
+        paths = [p for r in results for p in r["outputs"].values()]
+        assert len(set(paths)) == 8 and all(os.path.getsize(p) for p in paths)
+
+
+def test_main_writes_jsonl_results_and_exit_code(tmp_path):
+    source = tmp_path / "in.txt"
+    source.write_text('kotak 100x50\n{"id": 1\n', encoding="utf-8")
+    results = tmp_path / "hasil.jsonl"
+    code = main([str(source), "-o", str(tmp_path / "out"), "-r", str(results), "-j", "1", "--formats", "svg"])
+    lines = [json.loads(line) for line in results.read_text(encoding="utf-8").splitlines()]
+    assert code == 1
+    assert [r["ok"] for r in lines] == [True, False]
@@ -0,0 +1,80 @@
+import os
+import time
+
+from cad_cache import (DiskTier, MemoryTier, RenderCache, convert_cached, dump_items, items_key, load_items,
+                       parse_cached, render_cached)
+from cad_export import export_bytes
+from test_teknikal import TextToCADConverter
+
+
+def parsed(description):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def test_memory_tier_lru_by_entries():
+    tier = MemoryTier(max_entries=2)
+    tier.put("a", b"1")
+    tier.put("b", b"2")
+    tier.get("a")
+    tier.put("c", b"3")   # "b" paling lama tidak dipakai
+    assert (tier.get("a"), tier.get("b"), tier.get("c")) == (b"1", None, b"3")
+
+
+def test_memory_tier_lru_by_bytes():
+    tier = MemoryTier(max_bytes=10)
+    tier.put("a", b"x" * 4)
+    tier.put("b", b"x" * 4)
+    tier.put("c", b"x" * 4)   # 12 byte: "a" dibuang
+    assert (len(tier), tier.nbytes, tier.get("a")) == (2, 8, None)
+    tier.put("d", b"x" * 11)   # lebih besar dari batas: tidak disimpan
+    assert tier.get("d") is None and len(tier) == 2
+
+
+def test_disk_tier_evicts_oldest_down_to_low_water(tmp_path):
+    tier = DiskTier(str(tmp_path), max_bytes=1000, low_water=0.5)
+    for i in range(9):
+        tier.put(f"a{i:02d}x", b"x" * 100)
+        past = time.time() - 100 + i
+        os.utime(tier._path(f"a{i:02d}x"), (past, past))
+    tier.get("a00x")   # hit memperbarui mtime
+    tier.put("a09x", b"x" * 200)   # 1100 > 1000 -> turun ke 500
+    assert tier.size() <= 500 and tier.evictions > 0
+    assert tier.get("a00x") == b"x" * 100 and tier.get("a09x") is not None
+    assert tier.get("a01x") is None
+
+
+def test_items_round_trip_with_parents():
+    converter = parsed("kursi 4 kaki")
+    data = dump_items(converter.items)
+    store = load_items(data)
+    assert dump_items(store) == data
+    assert store.parent_of(store.of_kind("leg")[0]) is store.first("seat")
+
+
+def test_normalized_description_hits_and_shared_artifacts():
+    cache = RenderCache()
+    svg, _, hit = convert_cached(cache, "Ruangan 4x5 meter", "svg")
+    assert not hit and svg == export_bytes(parsed("ruangan 4x5 meter"), "svg")
+    assert parse_cached(cache, "RUANGAN 4×5 METER")[1] is None   # tingkat 1 hit, tanpa parse
+    # deskripsi lain dengan item yang sama memakai artefak yang sama (tingkat 2)
+    assert convert_cached(cache, "ruangan 400x500", "svg") == (svg, 1, True)
+    assert cache.stats["items_memory_hits"] == 1 and cache.stats["artifact_memory_hits"] == 1
+
+
+def test_disk_tier_shared_between_caches(tmp_path):
+    first = RenderCache(str(tmp_path))
+    data, _, _ = convert_cached(first, "kotak 100x50", "dxf")
+    second = RenderCache(str(tmp_path))
+    assert convert_cached(second, "kotak 100x50", "dxf") == (data, 1, True)
+    assert second.stats["items_disk_hits"] == 1 and second.stats["artifact_disk_hits"] == 1
+
+
+def test_no_output_is_cached_as_empty():
+    cache = RenderCache()
+    data = dump_items(TextToCADConverter().items)
+    key = items_key(data)
+    assert render_cached(cache, data, "obj") == (None, False)
+    assert cache.get_artifact(key, "obj") == b""
+    assert render_cached(cache, data, "obj") == (None, True)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from cad_columns import ItemColumns
+from cad_export import export_bytes
+from test_teknikal import CADItem, TextToCADConverter
+
+SCENE = "Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan"
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def rows(items):
+    index = {id(it): i for i, it in enumerate(items)}
+    out = []
+    for it in items:
+        parent = items.parent_of(it)
+        out.append((it.kind, dict(it.props), index[id(parent)] if parent is not None else None))
+    return out
+
+
+def test_caditem_is_slotted():
+    item = CADItem("rect", x=0.0)
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.color = "red"
+
+
+def test_round_trip_keeps_kinds_props_and_parents():
+    store = parsed().items
+    cols = ItemColumns.from_items(store)
+    assert len(cols) == len(store)
+    assert rows(cols.to_items()) == rows(store)
+    assert [it.kind for it in cols] == [it.kind for it in store]
+    assert cols.kinds() == store.kinds()
+    assert cols.bounds() == pytest.approx(store.bounds())
+
+
+def test_unknown_props_and_kinds_survive():
+    store = [CADItem("table", x=1.0, y=2.0, width=3.0, depth=4.0, height=5.0, legs=4),
+             CADItem("rect", x=0.0, y=0.0, width=1.0, depth=1.0, height=1.0, label="a")]
+    back = ItemColumns.from_items(store).to_items()
+    assert [dict(it.props) for it in back] == [dict(it.props) for it in store]
+
+
+def test_translate_scale_and_version():
+    cols = ItemColumns.from_items(parsed("kotak 100x50").items)
+    version = cols.version
+    cols.translate(10.0, 20.0)
+    cols.scale(2.0)
+    assert cols.version == version + 2
+    assert cols.bounds() == pytest.approx((20.0, 40.0, 220.0, 140.0))
+
+
+def test_float32_columns():
+    cols = ItemColumns.from_items(parsed().items, dtype=np.float32)
+    assert cols.x.dtype == np.float32
+    assert cols.nbytes() < ItemColumns.from_items(parsed().items).nbytes()
+
+
+def drawing(data: bytes):
+    # DXF: hanya bagian ENTITIES (header memuat GUID dan waktu pembuatan)
+    if not data.startswith(b"  0\nSECTION"):
+        return data
+    start = data.index(b"ENTITIES")
+    return data[start:data.index(b"ENDSEC", start)]
+
+
+@pytest.mark.parametrize("fmt", ["dxf", "svg"])
+def test_renderers_accept_columns(fmt):
+    converter = parsed()
+    expected = export_bytes(converter, fmt)
+    converter.items = ItemColumns.from_items(converter.items)
+    assert drawing(export_bytes(converter, fmt)) == drawing(expected)
@@ -0,0 +1,61 @@
+import io
+from collections import Counter
+
+import ezdxf
+
+from cad_geometry import build_geometry
+from test_teknikal import TextToCADConverter
+
+SCENE = "Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan"
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def read(text: str):
+    return ezdxf.read(io.StringIO(text))
+
+
+def shapes(msp):
+    return Counter(e.dxftype() for e in msp if e.dxftype() != "TEXT")
+
+
+def test_blocks_for_repeated_parts():
+    converter = parsed()
+    geo = build_geometry(converter.items)
+    doc = read(converter.render_dxf_blocks(io.StringIO()).getvalue())
+    msp = doc.modelspace()
+    counts = shapes(msp)
+    # setiap primitif tepat satu entitas: INSERT untuk yang berulang, selain itu entitas biasa
+    assert sum(counts.values()) == len(geo.top) + len(geo.front)
+    assert counts["INSERT"] > counts["LWPOLYLINE"] + counts["CIRCLE"]
+    used = {e.dxf.name for e in msp.query("INSERT")}
+    assert used and all(name in doc.blocks for name in used)
+    legs = [e for e in msp.query("INSERT") if e.dxf.name.startswith("LEG_CIRCLE")]
+    assert len(legs) == sum(p.role == "leg" and type(p).__name__ == "Circle" for p in geo.top)
+
+
+def test_min_instances_disables_blocks():
+    converter = parsed()
+    doc = read(converter.render_dxf_blocks(io.StringIO(), min_instances=10 ** 9).getvalue())
+    assert shapes(doc.modelspace())["INSERT"] == 0
+
+
+def test_r12_stream_writer(tmp_path):
+    converter = parsed()
+    geo = build_geometry(converter.items)
+    path = tmp_path / "denah.dxf"
+    converter.render_dxf_stream(str(path))
+    doc = ezdxf.readfile(str(path))
+    assert doc.dxfversion == "AC1009"
+    assert sum(shapes(doc.modelspace()).values()) == len(geo.top) + len(geo.front)
+
+
+def test_default_renderer_entity_count():
+    converter = parsed("kursi 4 kaki")
+    geo = build_geometry(converter.items)
+    doc = read(converter.render_dxf(io.StringIO()).getvalue())
+    assert sum(shapes(doc.modelspace()).values()) == len(geo.top) + len(geo.front)
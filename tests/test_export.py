@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from cad_export import export_bytes, export_formats
+from test_teknikal import TextToCADConverter
+
+
+def parsed(description="kursi 4 kaki dudukan 40x40 tinggi 45"):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+class Broken(TextToCADConverter):
+    def render_svg(self, target):
+        raise RuntimeError("rusak")
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread", "process", "auto"])
+def test_modes_write_the_same_files(tmp_path, mode):
+    results = export_formats(parsed(), str(tmp_path / "out"), ("svg", "obj"), mode=mode)
+    assert all(r.ok for r in results.values())
+    converter = parsed()
+    for fmt, result in results.items():
+        with open(result.path, "rb") as f:
+            assert f.read() == export_bytes(converter, fmt)
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread"])
+def test_one_failure_does_not_stop_the_others(tmp_path, mode):
+    converter = Broken()
+    converter.parse("kotak 100x50")
+    results = export_formats(converter, str(tmp_path / "out"), ("dxf", "svg", "obj"), mode=mode)
+    assert not results["svg"].ok and results["svg"].error == "RuntimeError: rusak"
+    assert results["dxf"].ok and results["obj"].ok
+    assert sorted(os.listdir(tmp_path)) == ["out.dxf", "out.obj"]
+
+
+def test_bad_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        export_formats(parsed(), str(tmp_path / "out"), ("pdf",))
+    with pytest.raises(ValueError):
+        export_formats(parsed(), str(tmp_path / "out"), ("dxf", "svg"), mode="cluster")
+    with pytest.raises(ValueError):
+        export_bytes(parsed(), "pdf")
+
+
+def test_main_exports_every_format(tmp_path, monkeypatch):
+    import test_teknikal
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "Kotak 100x50")
+    test_teknikal.main()
+    assert sorted(os.path.splitext(name)[1] for name in os.listdir(tmp_path)) == [".dxf", ".obj", ".svg"]
@@ -0,0 +1,57 @@
+from cad_geometry import Box, Circle, Cylinder, Rect, build_geometry, register_kind
+from cad_export import export_bytes
+from cad_store import props_version
+from test_teknikal import CADItem, TextToCADConverter
+
+
+def parsed(description):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def test_chair_geometry():
+    geo = build_geometry(parsed("kursi 4 kaki dudukan 40x40 tinggi 45").items)
+    assert sum(isinstance(p, Rect) and p.role == "outline" for p in geo.top) == 1
+    assert sum(isinstance(p, Circle) and p.role == "leg" for p in geo.top) == 4
+    assert sum(isinstance(p, Box) for p in geo.solids) == 1
+    assert sum(isinstance(p, Cylinder) for p in geo.solids) == 4
+    assert geo.bounds == (0.0, 0.0, 40.0, 40.0)
+
+
+def test_geometry_built_once_for_all_formats(monkeypatch):
+    import test_teknikal
+
+    calls = []
+    build = test_teknikal.build_geometry
+    monkeypatch.setattr(test_teknikal, "build_geometry", lambda items: calls.append(1) or build(items))
+    converter = parsed("kursi 4 kaki")
+    for fmt in ("dxf", "svg", "obj"):
+        assert export_bytes(converter, fmt)
+    assert len(calls) == 1
+
+
+def test_geometry_rebuilt_after_edits():
+    converter = parsed("kotak 100x50")
+    assert converter.geometry().bounds == (0.0, 0.0, 100.0, 50.0)
+    # props diedit di tempat
+    before = props_version()
+    converter.items[0].props["width"] = 300.0
+    assert props_version() > before
+    assert converter.geometry().bounds == (0.0, 0.0, 300.0, 50.0)
+    # item ditambah
+    converter.items.append(CADItem("circle", cx=500.0, cy=0.0, radius=10.0, height=10.0))
+    assert converter.geometry().bounds == (0.0, -10.0, 510.0, 50.0)
+    # daftar item diganti
+    converter.items = parsed("lingkaran 30").items   # jari-jari 30, pusat (30, 30)
+    assert converter.geometry().bounds == (0.0, 0.0, 60.0, 60.0)
+
+
+def test_register_kind_feeds_every_backend():
+    register_kind("uji_tiang", top=lambda items, it: [Circle(it.props["cx"], it.props["cy"], 5.0)],
+                  solid=lambda items, it: [Cylinder(it.props["cx"], it.props["cy"], 0.0, 5.0, 100.0)])
+    converter = TextToCADConverter()
+    converter.items.append(CADItem("uji_tiang", cx=0.0, cy=0.0))
+    assert b"<circle" in export_bytes(converter, "svg")
+    assert b"CIRCLE" in export_bytes(converter, "dxf")
+    assert export_bytes(converter, "obj").count(b"\nf ") > 0
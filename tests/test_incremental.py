@@ -0,0 +1,77 @@
+import io
+from collections import Counter
+
+import ezdxf
+import pytest
+
+from cad_incremental import EditSession, item_keys
+from test_teknikal import TextToCADConverter
+
+EDITS = [
+    "Kursi dengan 4 kaki, dudukan 40x40, tinggi 45",
+    "Kursi dengan 4 kaki, dudukan 40x40, tinggi 50",
+    "Kursi dengan 3 kaki, dudukan 50x40, tinggi 50",
+    "Ruangan 4x5 meter, 1 pintu di sisi barat",
+    "Ruangan 4x5 meter, 1 pintu di sisi barat dan 2 jendela di sisi utara",
+    "Ruangan 6x5 meter, 1 jendela di sisi utara",
+]
+
+
+def fresh(description):
+    session = EditSession()
+    session.update(description)
+    return session
+
+
+def svg(session):
+    return session.render_svg(io.StringIO()).getvalue()
+
+
+def dxf_shapes(session):
+    # entitas tanpa handle: (jenis, titik/pusat dibulatkan)
+    doc = ezdxf.read(io.StringIO(session.render_dxf(io.StringIO()).getvalue()))
+    out = Counter()
+    for e in doc.modelspace():
+        if e.dxftype() == "CIRCLE":
+            out["CIRCLE", tuple(round(v, 6) for v in e.dxf.center), round(e.dxf.radius, 6)] += 1
+        elif e.dxftype() == "LWPOLYLINE":
+            out["LWPOLYLINE", tuple((round(x, 6), round(y, 6)) for x, y in e.get_points("xy"))] += 1
+        else:
+            out[e.dxftype(), e.dxf.text] += 1
+    return out
+
+
+def test_item_keys_are_stable_and_hierarchical():
+    converter = TextToCADConverter()
+    converter.parse("Ruangan 4x5 meter, 1 pintu di sisi barat dan 2 jendela di sisi utara")
+    assert sorted(item_keys(converter.items).values()) == [
+        "room#0", "room#0/door#0", "room#0/window#0", "room#0/window#1"]
+
+
+def test_diff_reports_only_changed_items():
+    session = fresh(EDITS[0])
+    diff = session.update(EDITS[1])
+    assert diff.added == [] and diff.removed == []
+    assert sorted(diff.changed) == ["seat#0"] + [f"seat#0/leg#{i}" for i in range(4)]
+    assert not session.update(EDITS[1])
+    diff = session.update(EDITS[2])
+    assert diff.removed == ["seat#0/leg#3"]
+
+
+def test_patched_documents_match_a_fresh_render():
+    session = EditSession()
+    session.update(EDITS[0])
+    session.build("dxf", "svg")
+    for description in EDITS[1:]:
+        session.update(description)
+        expected = fresh(description)
+        assert svg(session) == svg(expected), description
+        assert dxf_shapes(session) == dxf_shapes(expected), description
+
+
+@pytest.mark.parametrize("description", EDITS[:1] + EDITS[3:4])
+def test_first_render_matches_converter(description):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    session = fresh(description)
+    assert svg(session) == converter.render_svg(io.StringIO()).getvalue()
@@ -0,0 +1,64 @@
+import io
+
+import numpy as np
+import pytest
+
+from cad_columns import ItemColumns
+from cad_mesh import BOX_FACES, build_mesh, cylinder_sections, solid_arrays, write_obj
+from test_teknikal import TextToCADConverter
+
+SCENE = "Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan, 1 jendela di sisi utara"
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def volume(vertices, faces):
+    # volume bertanda (teorema divergensi): positif jika normal menghadap keluar
+    tri = vertices[faces]
+    return np.einsum("ij,ij->i", tri[:, 0], np.cross(tri[:, 1], tri[:, 2])).sum() / 6.0
+
+
+def test_box_template_is_closed_and_outward():
+    vertices, faces = build_mesh([(10, 20, 5, 2, 3, 4)], [])
+    assert (len(vertices), len(faces)) == (8, len(BOX_FACES))
+    assert vertices.min(axis=0).tolist() == [10, 20, 5] and vertices.max(axis=0).tolist() == [12, 23, 9]
+    assert volume(vertices, faces) == pytest.approx(24.0)
+
+
+def test_cylinder_sections_follow_radius():
+    assert cylinder_sections([0.1, 10.0, 1000.0]).tolist() == [8, 32, 64]
+    vertices, faces = build_mesh([], [(0, 0, 0, 10.0, 5.0)])
+    sections = 32
+    assert (len(vertices), len(faces)) == (2 * sections + 2, 4 * sections)
+    area = 0.5 * sections * 10.0 ** 2 * np.sin(2 * np.pi / sections)
+    assert volume(vertices, faces) == pytest.approx(area * 5.0)
+
+
+def test_many_instances_keep_separate_index_ranges():
+    boxes = np.array([(i * 10.0, 0, 0, 1, 1, 1) for i in range(100)])
+    cylinders = np.array([(0, i * 10.0, 0, 1.0, 2.0) for i in range(50)])
+    vertices, faces = build_mesh(boxes, cylinders)
+    assert faces.max() == len(vertices) - 1
+    assert volume(vertices, faces) > 0
+
+
+def test_column_solids_match_ir_solids():
+    converter = parsed()
+    by_ir = solid_arrays(converter.items, converter.geometry())
+    by_columns = solid_arrays(ItemColumns.from_items(converter.items))
+    for a, b in zip(by_ir, by_columns):
+        assert sorted(map(tuple, a.tolist())) == pytest.approx(sorted(map(tuple, b.tolist())))
+
+
+def test_obj_output_matches_mesh():
+    converter = parsed("kursi 4 kaki dudukan 40x40 tinggi 45")
+    vertices, faces = converter.mesh()
+    text = converter.export_obj_extrude(io.StringIO()).getvalue()
+    lines = text.splitlines()
+    assert sum(line.startswith("v ") for line in lines) == len(vertices)
+    assert sum(line.startswith("f ") for line in lines) == len(faces)
+    assert write_obj(vertices, faces, io.StringIO(), chunk=5).getvalue() == text
@@ -0,0 +1,64 @@
+import io
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from cad_mesh import STL_RECORD, build_mesh, weld
+from test_teknikal import TextToCADConverter
+
+
+def parsed(description="kursi 4 kaki dudukan 40x40 tinggi 45"):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def test_weld_merges_shared_corners_and_drops_degenerate_faces():
+    # dua kubus bersentuhan: 4 sudut bersama
+    vertices, faces = build_mesh([(0, 0, 0, 1, 1, 1), (1, 0, 0, 1, 1, 1)], [])
+    welded, welded_faces = weld(vertices, faces)
+    assert (len(vertices), len(welded)) == (16, 12)
+    assert np.allclose(welded[welded_faces], vertices[faces])
+    flat, flat_faces = weld(np.array([(0, 0, 0), (1, 0, 0), (1, 0, 0)], float), np.array([[0, 1, 2]]))
+    assert len(flat_faces) == 0
+
+
+def test_weld_quantize_merges_float32_neighbours():
+    vertices = np.array([(0, 0, 0), (1.0, 0, 0), (1.0 + 1e-12, 0, 0)])
+    faces = np.array([[0, 1, 2]])
+    assert len(weld(vertices, faces)[0]) == 3
+    assert len(weld(vertices, faces, quantize=True)[0]) == 2
+
+
+def test_stl_is_binary_with_one_record_per_face():
+    converter = parsed()
+    vertices, faces = converter.mesh(quantize=True)
+    data = converter.export_stl(io.BytesIO()).getvalue()
+    (count,) = struct.unpack("<I", data[80:84])
+    assert count == len(faces) and len(data) == 84 + 50 * count
+    records = np.frombuffer(data[84:], dtype=STL_RECORD)
+    assert np.allclose(records["triangle"], vertices[faces])
+    assert np.allclose(np.linalg.norm(records["normal"], axis=1), 1.0)
+
+
+@pytest.mark.parametrize("instances", [False, True])
+def test_glb_container(instances):
+    data = parsed().export_glb(io.BytesIO(), instances=instances).getvalue()
+    magic, version, total, json_len, json_type = struct.unpack("<5I", data[:20])
+    assert (magic, version, total, json_type) == (0x46546C67, 2, len(data), 0x4E4F534A)
+    doc = json.loads(data[20:20 + json_len])
+    bin_len, bin_type = struct.unpack("<2I", data[20 + json_len:28 + json_len])
+    assert bin_type == 0x004E4942 and bin_len == doc["buffers"][0]["byteLength"]
+    assert all(v["byteOffset"] + v["byteLength"] <= bin_len for v in doc["bufferViews"])
+    assert len(doc["nodes"]) > 1
+
+
+def test_trimesh_reads_outputs():
+    trimesh = pytest.importorskip("trimesh")
+    converter = parsed()
+    vertices, faces = converter.mesh()
+    for fmt, method in (("stl", converter.export_stl), ("glb", converter.export_glb)):
+        mesh = trimesh.load(io.BytesIO(method(io.BytesIO()).getvalue()), file_type=fmt, force="mesh")
+        assert len(mesh.faces) == len(faces)
@@ -0,0 +1,70 @@
+import io
+import json
+
+import cad_metrics
+from cad_metrics import EventList, MetricsRegistry, ProfileCapture, collect, recording, span
+from cad_export import export_formats
+from test_teknikal import TextToCADConverter
+
+
+def test_no_sink_no_events():
+    assert not cad_metrics.enabled()
+    assert span("x") is cad_metrics._NULL
+    TextToCADConverter().parse("kotak 100x50")
+
+
+def test_parse_and_render_events():
+    converter = TextToCADConverter()
+    with recording(EventList()) as events:
+        converter.parse("kursi 4 kaki dudukan 40x40 tinggi 45")
+        out = io.StringIO()
+        converter.render_svg(out)
+    stages = {e["stage"]: e for e in events}
+    assert stages["parse"]["items"] == {"seat": 1, "leg": 4}
+    assert stages["parse_chair"]["parent"] == "parse" and stages["parse_chair"]["depth"] == 1
+    assert stages["render_svg"]["bytes"] == len(out.getvalue())
+    assert stages["geometry"]["parent"] == "render_svg"
+    assert not cad_metrics.enabled()
+
+
+def test_error_is_recorded_and_reraised():
+    registry = MetricsRegistry()
+    with recording(registry):
+        try:
+            with span("gagal"):
+                raise ValueError("x")
+        except ValueError:
+            pass
+    assert registry.snapshot()["gagal"]["errors"] == 1
+
+
+def test_registry_aggregates_and_formats():
+    registry = MetricsRegistry()
+    converter = TextToCADConverter()
+    with recording(registry):
+        for _ in range(3):
+            converter.parse("kotak 100x50")
+    st = registry.snapshot()["parse"]
+    assert st["calls"] == 3 and st["max_seconds"] <= st["seconds"]
+    table = registry.format().splitlines()
+    assert table[0].startswith("tahap") and any(line.startswith("parse ") for line in table)
+
+
+def test_jsonl_sink_and_process_workers(tmp_path):
+    log = tmp_path / "tahap.jsonl"
+    converter = TextToCADConverter()
+    converter.parse("kotak 100x50")
+    with collect(log=str(log)):
+        export_formats(converter, str(tmp_path / "out"), ("dxf", "svg"), mode="process")
+    events = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    # event dari proses worker dikirim balik dan ditulis oleh sink proses induk
+    assert {"render_dxf", "render_svg"} <= {e["stage"] for e in events}
+
+
+def test_profile_capture_report():
+    with collect(profile=True) as profile:
+        TextToCADConverter().parse("ruangan 4x5 m dengan 1 pintu")
+    assert isinstance(profile, ProfileCapture)
+    report = profile.report()
+    assert "parse" in report and "cumulative" in report
+    assert not cad_metrics.enabled()
@@ -0,0 +1,56 @@
+import os
+
+import ezdxf
+import pytest
+
+from test_teknikal_persegi_panjang import Rectangle, batch, read_csv, unique_names, write_dxf_sheet
+
+
+def test_read_csv_skips_header_comments_and_blank_lines(tmp_path):
+    path = tmp_path / "panel.csv"
+    path.write_text("panjang,lebar,nama\n# komentar\n\n100,50,pintu\n2.5,1\n", encoding="utf-8")
+    assert read_csv(str(path)) == [Rectangle(100, 50, "pintu"), Rectangle(2.5, 1, "persegi_0002")]
+    path.write_text("100,50\nabc,1\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_csv(str(path))
+
+
+def test_unique_names_sanitise_and_deduplicate():
+    names = [r.name for r in unique_names([Rectangle(1, 1, n) for n in
+                                           ("a", "A", "../../etc/x", "..", "a b/c", "a_0002", "a")])]
+    assert names == ["a", "A_0002", "x", "persegi_0004", "c", "a_0002_0006", "a_0007"]
+    assert len({n.lower() for n in names}) == len(names)
+
+
+def test_batch_writes_inside_output_dir(tmp_path):
+    out = tmp_path / "out"
+    rects = [Rectangle(100, 50, "../luar"), Rectangle(30, 20, "luar"), Rectangle(10, 10, "sub/dalam")]
+    result = batch(rects, str(out), preview=False)
+    assert sorted(os.listdir(out)) == ["dalam.dxf", "luar.dxf", "luar_0002.dxf"]
+    assert sorted(os.listdir(tmp_path)) == ["out"]
+    points = ezdxf.readfile(result["dxf"][0]).modelspace().query("LWPOLYLINE")[0].get_points("xy")
+    assert [tuple(p) for p in points] == [(0, 0), (100, 0), (100, 50), (0, 50), (0, 0)]
+
+
+def test_single_sheet_and_previews(tmp_path):
+    pytest.importorskip("matplotlib")
+    rects = [Rectangle(100 + i, 50, f"p{i}") for i in range(5)]
+    result = batch(rects, str(tmp_path), single_dxf="semua.dxf", preview=True, chunk_size=2)
+    assert result["dxf"] == [str(tmp_path / "semua.dxf")]
+    assert len(ezdxf.readfile(result["dxf"][0]).modelspace().query("LWPOLYLINE")) == 5
+    assert [os.path.basename(p) for p in result["png"]] == [f"p{i}.png" for i in range(5)]
+    for path in result["png"]:
+        with open(path, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_pool_matches_serial(tmp_path):
+    rects = [Rectangle(10 + i, 5, f"p{i}") for i in range(6)]
+    serial = batch(rects, str(tmp_path / "a"), preview=False, jobs=1, chunk_size=2)
+    pooled = batch(rects, str(tmp_path / "b"), preview=False, jobs=2, chunk_size=2)
+    assert [os.path.basename(p) for p in serial["dxf"]] == [os.path.basename(p) for p in pooled["dxf"]]
+
+
+def test_empty_sheet(tmp_path):
+    path = write_dxf_sheet([], str(tmp_path / "kosong.dxf"))
+    assert len(ezdxf.readfile(path).modelspace()) == 0
@@ -0,0 +1,55 @@
+from collections import Counter
+
+from cad_layout import SpatialHash
+from cad_shapes import register_shape
+from test_teknikal import CADItem, TextToCADConverter
+
+
+def parse(description):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def top_boxes(converter, kind):
+    return [(it.props["x"], it.props["y"], it.props["x"] + it.props["width"], it.props["y"] + it.props["depth"])
+            for it in converter.items if it.kind == kind]
+
+
+def test_counted_objects_are_placed_inside_room():
+    converter = parse("Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan")
+    kinds = Counter(it.kind for it in converter.items)
+    assert (kinds["room"], kinds["seat"], kinds["table"], kinds["door"]) == (1, 6, 2, 1)
+    boxes = top_boxes(converter, "seat") + top_boxes(converter, "table")
+    for minx, miny, maxx, maxy in boxes:
+        assert 50.0 <= minx and maxx <= 950.0 and 50.0 <= miny and maxy <= 950.0
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1]
+
+
+def test_overflow_is_reported(capsys):
+    converter = parse("ruangan 3x3 m dengan 50 kursi")
+    placed = sum(it.kind == "seat" for it in converter.items)
+    assert 0 < placed < 50
+    assert f"Hanya {placed} dari 50" in capsys.readouterr().out
+
+
+def test_kind_without_bounds_is_skipped(capsys):
+    # bentuk pihak ketiga tanpa "bounds": adegan tetap jadi, bentuk itu dilewati
+    def parse_statue(converter, tokens):
+        converter.items.append(CADItem("uji_patung", x=0.0, y=0.0))
+
+    register_shape("uji_patung", ("patungtes",), parse_statue)
+    converter = parse("ruangan 10x10 m dengan 3 patungtes dan 4 kursi")
+    kinds = Counter(it.kind for it in converter.items)
+    assert kinds["seat"] == 4 and kinds["uji_patung"] == 0
+    assert "3 patungtes dilewati" in capsys.readouterr().out
+
+
+def test_spatial_hash_query():
+    index = SpatialHash(100.0)
+    index.insert((0.0, 0.0, 50.0, 50.0))
+    index.insert((300.0, 300.0, 350.0, 350.0))
+    assert list(index.query((40.0, 40.0, 320.0, 320.0))) == [0, 1]
+    assert list(index.query((50.0, 0.0, 200.0, 200.0))) == []   # hanya bersentuhan di tepi
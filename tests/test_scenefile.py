@@ -0,0 +1,92 @@
+import io
+import os
+import stat
+
+import numpy as np
+import pytest
+
+from cad_export import export_bytes
+from cad_scenefile import load_scene, read_header, save_scene, scene_to_items
+from test_teknikal import TextToCADConverter
+
+
+def test_scene_file_mode_follows_umask(tmp_path):
+    converter = TextToCADConverter()
+    converter.parse("kotak 100x50")
+    old = os.umask(0o022)
+    try:
+        path = save_scene(converter.items, str(tmp_path / "kotak.cadscene"))
+    finally:
+        os.umask(old)
+    assert os.listdir(tmp_path) == ["kotak.cadscene"]
+    if os.name == "posix":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+SCENE = "Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan"
+
+
+def rows(items):
+    index = {id(it): i for i, it in enumerate(items)}
+    return [(it.kind, dict(it.props), index.get(id(items.parent_of(it)))) for it in items]
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def test_round_trip(tmp_path):
+    converter = parsed()
+    path = str(tmp_path / "ruang.cadscene")
+    converter.save_scene(path)
+    assert rows(scene_to_items(path)) == rows(converter.items)
+    header = read_header(path)
+    assert header["count"] == len(converter.items) and header["data_offset"] % 64 == 0
+
+
+def test_columns_are_views_into_the_file(tmp_path):
+    path = str(tmp_path / "ruang.cadscene")
+    save_scene(parsed().items, path)
+    cols = load_scene(path)
+    assert isinstance(cols.x.base, np.memmap) or isinstance(cols.x.base.base, np.memmap)
+    with pytest.raises(ValueError):
+        cols.translate(1.0, 1.0)   # mode "r": hanya baca
+    copy = load_scene(path, mode="c")
+    copy.translate(10.0, 0.0)
+    assert load_scene(path).bounds() == cols.bounds()
+
+
+def test_render_from_scene_matches_parse(tmp_path):
+    converter = parsed()
+    path = str(tmp_path / "ruang.cadscene")
+    converter.save_scene(path)
+    loaded = TextToCADConverter.from_scene(path)
+    assert export_bytes(loaded, "svg") == export_bytes(converter, "svg")
+
+
+def test_stream_target_and_bad_files(tmp_path):
+    buf = io.BytesIO()
+    save_scene(parsed("kotak 100x50").items, buf)
+    path = tmp_path / "a.cadscene"
+    path.write_bytes(buf.getvalue())
+    assert [it.kind for it in scene_to_items(str(path))] == ["rect"]
+    path.write_bytes(b"bukan adegan")
+    with pytest.raises(ValueError):
+        read_header(str(path))
+    path.write_bytes(buf.getvalue().replace(b'"version":1', b'"version":9'))
+    with pytest.raises(ValueError):
+        load_scene(str(path))
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path, monkeypatch):
+    import cad_scenefile
+
+    def fail(tmp, target):
+        raise OSError("disk penuh")
+
+    monkeypatch.setattr(cad_scenefile, "publish", fail)
+    with pytest.raises(OSError):
+        save_scene(parsed("kotak 100x50").items, str(tmp_path / "a.cadscene"))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,102 @@
+import json
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from cad_service import ConversionService, HTTPError
+
+
+@pytest.fixture
+def service():
+    service = ConversionService(workers=1, executor="thread", max_pending=1, timeout=5.0)
+    service.start_executor()
+    yield service
+    service.close()
+
+
+async def request(service, raw: bytes):
+    # satu request HTTP mentah lewat handle() di server sementara
+    server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), body
+
+
+def post(body: bytes, content_type="text/plain", query="format=svg"):
+    return (f"POST /convert?{query} HTTP/1.1\r\nHost: x\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode() + body
+
+
+def test_convert_returns_output_bytes(service):
+    status, body = asyncio.run(request(service, post(b"kotak 100x50")))
+    assert status == 200
+    assert b"<svg" in body
+
+
+@pytest.mark.parametrize("payload", [{"description": "kotak 100x50", "format": ["svg"]},
+                                     {"description": "kotak 100x50", "format": {"svg": 1}},
+                                     {"description": "kotak 100x50", "format": "pdf"}])
+def test_bad_format_is_400(service, payload):
+    raw = post(json.dumps(payload).encode(), content_type="application/json")
+    status, body = asyncio.run(request(service, raw))
+    assert status == 400
+    assert service.stats["errors"] == 0
+
+
+@pytest.mark.parametrize("raw, status", [
+    (b"POST /convert HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 411),
+    (b"POST /convert HTTP/1.1\r\nContent-Length: abc\r\n\r\n", 400),
+    (b"POST /convert HTTP/1.1\r\nContent-Length: 999999999\r\n\r\n", 413),
+    (b"GET /nope HTTP/1.1\r\nConnection: close\r\n\r\n", 404),
+    (b"GET /convert HTTP/1.1\r\nConnection: close\r\n\r\n", 405),
+])
+def test_malformed_requests(service, raw, status):
+    assert asyncio.run(request(service, raw))[0] == status
+
+
+def test_empty_description_is_400(service):
+    assert asyncio.run(request(service, post(b"   ")))[0] == 400
+
+
+def running_job(release):
+    # Future yang sudah "berjalan" di worker (tidak bisa dibatalkan) sampai `release` di-set
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def finish():
+        release.wait(5)
+        future.set_result((b"", 0, 0.0, False))
+
+    threading.Thread(target=finish, daemon=True).start()
+    return future
+
+
+def test_queue_slot_held_until_job_finishes(service, monkeypatch):
+    # job yang kena timeout masih memakai worker: request berikutnya ditolak 503
+    release = threading.Event()
+    monkeypatch.setattr(service, "timeout", 0.05)
+    service.executor.submit = lambda fn, *args: running_job(release)
+
+    async def run():
+        with pytest.raises(HTTPError) as first:
+            await service.convert("kotak 100x50", "svg")
+        assert first.value.status == 504
+        with pytest.raises(HTTPError) as second:
+            await service.convert("kotak 100x50", "svg")
+        assert second.value.status == 503
+        release.set()
+        for _ in range(100):
+            if service.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert service.pending == 0
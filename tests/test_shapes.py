@@ -0,0 +1,49 @@
+import pytest
+
+import cad_cache
+from cad_shapes import match_shapes, register_shape
+from test_teknikal import TextToCADConverter, normalize_description
+
+
+def kinds(description):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return [item.kind for item in converter.items]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("deskripsi: kotak 100x50", ["box"]),
+    ("kotak raksasa 100x50", ["box"]),
+    ("lingkaran 30 untuk rakit", ["circle"]),
+    ("ruangannya 4x5 meter", ["room"]),
+    ("two boxes 30x30", ["box"]),
+])
+def test_keywords_match_whole_words(text, expected):
+    assert [shape.name for shape in match_shapes(normalize_description(text))] == expected
+
+
+def test_prefix_of_other_word_does_not_dispatch():
+    # "desk" di "deskripsi" dulu membuat kotak menjadi meja
+    assert kinds("deskripsi: kotak 100x50") == ["rect"]
+
+
+def test_register_shape_dispatches_new_keyword():
+    calls = []
+
+    def parse(converter, tokens):
+        calls.append(tokens.text)
+
+    register_shape("uji_lemari", ("lemariuji",), parse, priority=1)
+    assert kinds("lemariuji 2 pintu") == []
+    assert calls == ["lemariuji 2 pintu"]
+    with pytest.raises(ValueError):
+        register_shape("uji_lain", ("lemariuji",), parse)
+
+
+def test_cache_version_invalidates_old_entries(tmp_path, monkeypatch):
+    # entri disk dari parser lama tidak boleh dipakai setelah CACHE_VERSION naik
+    old = cad_cache.RenderCache(str(tmp_path))
+    old.put_items("kotak 100x50", b"[]")
+    assert cad_cache.RenderCache(str(tmp_path)).get_items("kotak 100x50") == b"[]"
+    monkeypatch.setattr(cad_cache, "CACHE_VERSION", cad_cache.CACHE_VERSION + 1)
+    assert cad_cache.RenderCache(str(tmp_path)).get_items("kotak 100x50") is None
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import cad_shm
+from cad_columns import ItemColumns
+from cad_export import export_bytes, export_formats
+from cad_shm import SharedScene
+from test_teknikal import TextToCADConverter
+
+SCENE = "Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan"
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def test_attach_reads_the_same_columns():
+    converter = parsed()
+    with SharedScene.create(converter.items) as scene:
+        assert scene.name.startswith(cad_shm.PREFIX) and scene.name in cad_shm._owned
+        worker = SharedScene.attach(scene.name)
+        items = worker.items
+        assert len(items) == len(converter.items) and items.bounds() == converter.items.bounds()
+        assert items.kinds() == converter.items.kinds()
+        with pytest.raises(ValueError):
+            items.x[0] = 1.0   # view read-only ke blok
+        del items
+        worker.close()
+    assert scene.name not in cad_shm._owned
+    with pytest.raises(FileNotFoundError):
+        SharedScene.attach(scene.name)
+
+
+def test_close_with_live_view_raises():
+    with SharedScene.create(parsed("kotak 100x50").items) as scene:
+        worker = SharedScene.attach(scene.name)
+        view = np.asarray(worker.items.x)
+        with pytest.raises(BufferError):
+            worker.close()
+        del view
+        worker.close()
+
+
+def test_only_owner_unlinks():
+    with SharedScene.create(parsed("kotak 100x50").items) as scene:
+        worker = SharedScene.attach(scene.name)
+        with pytest.raises(RuntimeError):
+            worker.unlink()
+        worker.close()
+        # blok masih ada setelah worker close
+        SharedScene.attach(scene.name).close()
+
+
+def test_export_formats_shm_matches_pickle(tmp_path):
+    converter = parsed()
+    formats = ("dxf", "svg", "obj")
+    pickled = export_formats(converter, str(tmp_path / "pickle"), formats, mode="process")
+    shared = export_formats(parsed(), str(tmp_path / "shm"), formats, mode="process", transport="shm")
+    for fmt in formats:
+        assert pickled[fmt].ok and shared[fmt].ok, shared[fmt].error
+    assert (tmp_path / "shm.svg").read_bytes() == (tmp_path / "pickle.svg").read_bytes()
+    # worker membaca ItemColumns: urutan solid OBJ mengikuti kolom, bukan ItemStore
+    columns = TextToCADConverter()
+    columns.items = ItemColumns.from_items(converter.items)
+    assert (tmp_path / "shm.obj").read_bytes() == export_bytes(columns, "obj")
+    assert not cad_shm._owned
+
+
+def test_unknown_transport():
+    with pytest.raises(ValueError):
+        export_formats(parsed("kotak 100x50"), "out", ("dxf", "svg"), transport="pipa")
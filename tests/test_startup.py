@@ -0,0 +1,52 @@
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("ezdxf", "svgwrite", "numpy", "trimesh", "matplotlib", "subprocess", "concurrent.futures")
+
+
+def loaded_after(code: str):
+    # modul berat yang termuat setelah `code` dijalankan di interpreter baru
+    script = f"import sys\n{code}\nimport json\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def test_import_and_parse_stay_light():
+    assert loaded_after("import test_teknikal as t; t.TextToCADConverter().parse('Kursi dengan 4 kaki')") == []
+
+
+def test_stream_svg_needs_no_heavy_imports():
+    code = ("import io, test_teknikal as t; c = t.TextToCADConverter(); c.parse('kotak 100x50'); "
+            "c.render_svg_stream(io.StringIO())")
+    assert loaded_after(code) == []
+
+
+def test_dxf_loads_ezdxf_only_when_rendering():
+    code = ("import io, test_teknikal as t; c = t.TextToCADConverter(); c.parse('kotak 100x50'); "
+            "c.render_dxf(io.StringIO())")
+    assert "ezdxf" in loaded_after(code)
+
+
+def test_has_trimesh_is_a_lazy_probe(monkeypatch):
+    import test_teknikal
+
+    monkeypatch.setattr(test_teknikal, "_capabilities", {})
+    assert test_teknikal.HAS_TRIMESH is test_teknikal.has_mesh_support()
+    assert "mesh" in test_teknikal._capabilities
+    with pytest.raises(AttributeError):
+        test_teknikal.NOT_THERE
+
+
+def test_install_requirements_only_installs_missing(monkeypatch):
+    import subprocess as sp
+    import test_teknikal
+
+    calls = []
+    monkeypatch.setattr(sp, "check_call", lambda args: calls.append(args[-1]))
+    assert test_teknikal.install_requirements(("json", "paket_yang_tidak_ada_xyz")) == ["paket_yang_tidak_ada_xyz"]
+    assert calls == ["paket_yang_tidak_ada_xyz"]
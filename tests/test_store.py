@@ -0,0 +1,55 @@
+from cad_store import ItemStore
+from test_teknikal import CADItem, TextToCADConverter
+
+
+def chairs(n):
+    store = ItemStore()
+    for i in range(n):
+        store.append(CADItem("seat", x=i * 100.0, y=0.0, width=40.0, depth=40.0, height=45.0))
+        for cx, cy in ((2, 2), (38, 2), (2, 38), (38, 38)):
+            store.append(CADItem("leg", cx=i * 100.0 + cx, cy=cy, radius=2.0, height=45.0))
+    return store
+
+
+def test_kind_index():
+    store = chairs(3)
+    assert store.kinds() == {"seat": 3, "leg": 12}
+    assert store.first("seat") is store[0]
+    assert store.of_kind("leg") == [it for it in store if it.kind == "leg"]
+    assert store.of_kind("room") == [] and store.first("room") is None
+
+
+def test_default_parent_is_latest_parent_kind():
+    # kaki menempel ke dudukan terakhir yang ditambahkan
+    store = chairs(2)
+    first, second = store.of_kind("seat")
+    assert [store.parent_of(leg) for leg in store.children(first)] == [first] * 4
+    assert store.children(second, "leg") == store.of_kind("leg")[4:]
+    assert store.children(second, ("door",)) == []
+    assert store.parent_of(first) is None
+
+
+def test_explicit_parent_and_orphan_legs():
+    store = ItemStore()
+    leg = store.append(CADItem("leg", cx=0.0, cy=0.0, radius=2.0, height=45.0))
+    assert store.parent_of(leg) is None
+    room = store.append(CADItem("room", x=0.0, y=0.0, width=400.0, depth=500.0, height=300.0))
+    door = store.append(CADItem("door", side="south", width=90.0, height=210.0))
+    assert store.parent_of(door) is room and store.children(room) == [door]
+
+
+def test_bounds_and_clear():
+    store = chairs(2)
+    assert store.bounds() == (0.0, 0.0, 140.0, 40.0)
+    version = store.version
+    store.clear()
+    assert len(store) == 0 and store.kinds() == {} and store.bounds() is None
+    assert store.version > version
+
+
+def test_renderers_see_every_leg(tmp_path):
+    converter = TextToCADConverter()
+    converter.items = chairs(50)
+    svg = tmp_path / "kursi.svg"
+    assert converter.render_svg(str(svg))
+    assert svg.read_text(encoding="utf-8").count("<circle") == 200
@@ -0,0 +1,56 @@
+import os
+import sys
+import json
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import suite  # noqa: E402
+
+
+def result(seconds=0.1, peak_mb=50.0, nbytes=1000, calibration_s=None):
+    meta = {"calibration_s": calibration_s} if calibration_s else {}
+    return {"meta": meta, "results": {"render_svg/100": {"seconds": seconds, "peak_mb": peak_mb, "bytes": nbytes}}}
+
+
+@pytest.mark.parametrize("new, metric", [
+    (result(seconds=0.2), "seconds"),
+    (result(peak_mb=100.0), "peak_mb"),
+    (result(nbytes=2000), "bytes"),
+])
+def test_compare_flags_regressions(new, metric):
+    assert [r[1] for r in suite.compare(result(), new)] == [metric]
+
+
+def test_compare_ignores_noise_below_absolute_thresholds():
+    # +50% tetapi hanya 1 ms / 2 MB / 10 byte: di bawah ambang absolut
+    old = result(seconds=0.002, peak_mb=4.0, nbytes=1000)
+    assert suite.compare(old, result(seconds=0.003, peak_mb=6.0, nbytes=1010)) == []
+
+
+def test_compare_normalizes_by_calibration():
+    old = result(seconds=0.1, calibration_s=1.0)
+    slower_machine = result(seconds=0.2, calibration_s=2.0)
+    assert suite.compare(old, slower_machine) == []
+    assert suite.compare(old, slower_machine, calibrate=False)
+
+
+def test_main_compare_exit_code(tmp_path):
+    old, new = tmp_path / "lama.json", tmp_path / "baru.json"
+    old.write_text(json.dumps(result()), encoding="utf-8")
+    new.write_text(json.dumps(result(seconds=0.5)), encoding="utf-8")
+    assert suite.main(["--compare", str(old), str(old)]) == 0
+    assert suite.main(["--compare", str(old), str(new)]) == 1
+
+
+@pytest.mark.parametrize("case, size", [("parse_basic", 64), ("render_svg", 10), ("export_obj_extrude", 10)])
+def test_run_case(case, size):
+    r = suite.run_case(case, size, min_time=0.0, min_repeat=1, max_repeat=1)
+    assert r["case"] == case and r["size"] == size
+    assert r["items"] > 0 and r["bytes"] > 0 and r["seconds"] > 0
+
+
+def test_unknown_case_rejected():
+    with pytest.raises(SystemExit):
+        suite.main(["--cases", "render_pdf"])
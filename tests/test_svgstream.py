@@ -0,0 +1,57 @@
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from cad_geometry import build_geometry
+from cad_svgstream import render_svg_stream, svg_number
+from test_teknikal import TextToCADConverter
+
+SVG = "{http://www.w3.org/2000/svg}"
+SCENE = "Ruangan 10x10 m dengan 6 kursi dan 2 meja 160x80, 1 pintu di sisi selatan, 1 jendela di sisi utara"
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def stream(items, chunk_size=2048):
+    out = io.StringIO()
+    render_svg_stream(items, out, chunk_size)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("value, text", [(1.0, "1"), (0.5, "0.5"), (-2.25, "-2.25"), (1 / 3, "0.3333"), (0, "0")])
+def test_svg_number(value, text):
+    assert svg_number(value) == text
+
+
+def test_output_is_valid_svg_with_one_element_per_primitive():
+    converter = parsed()
+    root = ET.fromstring(stream(converter.items))
+    geo = build_geometry(converter.items)
+    top, front = root.findall(f"{SVG}g")
+    assert top.get("id") == "top_view" and front.get("id") == "front_view"
+    assert len(top) - 1 == len(geo.top)   # tanpa <text> judul
+    assert len(front) - 1 == len(geo.front)
+
+
+def test_chunk_size_does_not_change_output():
+    items = parsed().items
+    assert stream(items, 1) == stream(items, 7) == stream(items)
+
+
+def test_canvas_matches_dom_renderer():
+    converter = parsed()
+    dom = ET.fromstring(converter.render_svg(io.StringIO()).getvalue())
+    streamed = ET.fromstring(stream(converter.items))
+    assert (streamed.get("width"), streamed.get("height")) == (dom.get("width"), dom.get("height"))
+
+
+def test_path_target(tmp_path):
+    converter = parsed("kursi 4 kaki")
+    path = tmp_path / "kursi.svg"
+    assert converter.render_svg_stream(str(path)) == str(path)
+    assert path.read_text(encoding="utf-8") == stream(converter.items)
@@ -0,0 +1,82 @@
+import json
+import os
+import xml.etree.ElementTree as ET
+
+from cad_geometry import iter_top
+from cad_svgtiles import MANIFEST, level_count, write_tiles
+from test_teknikal import TextToCADConverter
+
+SVG = "{http://www.w3.org/2000/svg}"
+SCENE = "Ruangan 20x20 m dengan 40 kursi dan 4 meja 160x80, 1 pintu di sisi selatan, 1 jendela di sisi utara"
+
+
+def parsed(description=SCENE):
+    converter = TextToCADConverter()
+    converter.parse(description)
+    return converter
+
+
+def tiles(tmp_path, description=SCENE, **kwargs):
+    path = parsed(description).render_svg_tiles(str(tmp_path), **kwargs)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_level_count():
+    assert level_count(None) == 1
+    assert level_count((0, 0, 500, 500)) == 1
+    assert level_count((0, 0, 1000, 1000)) == 1
+    assert level_count((0, 0, 4000, 100)) == 3
+
+
+def test_manifest_lists_every_written_tile(tmp_path):
+    manifest = tiles(tmp_path, tile_size=500.0)
+    assert len(manifest["levels"]) == level_count(manifest["bounds"], 500.0)
+    written = {os.path.relpath(os.path.join(root, name), tmp_path).replace(os.sep, "/")
+               for root, _, names in os.walk(tmp_path) for name in names if name != MANIFEST}
+    listed = {tile[2] for level in manifest["levels"] for tile in level["tiles"]}
+    assert written == listed
+    for level in manifest["levels"]:
+        for c, r, name, count in level["tiles"]:
+            assert 0 <= c < level["columns"] and 0 <= r < level["rows"] and count > 0
+    # level terakhir: seluruh adegan dalam satu tile
+    assert len(manifest["levels"][-1]["tiles"]) == 1
+
+
+def test_tiles_are_valid_svg_with_tile_viewbox(tmp_path):
+    manifest = tiles(tmp_path, tile_size=500.0)
+    minx, miny = manifest["bounds"][:2]
+    for level in manifest["levels"]:
+        for c, r, name, count in level["tiles"]:
+            root = ET.parse(tmp_path / name).getroot()
+            x, y, w, h = map(float, root.get("viewBox").split())
+            assert (x, y, w, h) == (minx + c * level["tile"], miny + r * level["tile"], level["tile"], level["tile"])
+            assert root.get("width") == f"{manifest['tile_px']}px"
+
+
+def test_level_zero_holds_every_primitive(tmp_path):
+    # satu tile menutup semuanya: level 0 berisi semua primitif tampak atas
+    converter = parsed()
+    manifest = tiles(tmp_path, tile_size=5000.0)
+    assert len(manifest["levels"]) == 1
+    (_, _, _, count), = manifest["levels"][0]["tiles"]
+    assert count == sum(1 for _ in iter_top(converter.items))
+
+
+def test_coarse_levels_drop_doors_and_windows(tmp_path):
+    manifest = tiles(tmp_path, tile_size=500.0, levels=2)
+    fine = sum(t[3] for t in manifest["levels"][0]["tiles"])
+    coarse = sum(t[3] for t in manifest["levels"][1]["tiles"])
+    assert coarse < fine
+    fine_text, coarse_text = ("".join((tmp_path / t[2]).read_text(encoding="utf-8") for t in level["tiles"])
+                              for level in manifest["levels"])
+    assert "#door" in fine_text and "#window" in fine_text
+    assert "#door" not in coarse_text and "#window" not in coarse_text
+
+
+def test_empty_scene_writes_manifest_only(tmp_path):
+    converter = TextToCADConverter()
+    path = write_tiles(converter.items, str(tmp_path))
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert [level["tiles"] for level in manifest["levels"]] == [[]]
@@ -0,0 +1,52 @@
+import pytest
+
+from cad_tokenizer import DIM, DIRECTION, NUMBER, WORD, tokenize
+from test_teknikal import TextToCADConverter
+
+
+def first(text, kind):
+    return next(t for t in tokenize(text) if t.kind == kind)
+
+
+@pytest.mark.parametrize("unit", ["m", "meter", "meters", "metre", "metres"])
+def test_meter_spellings(unit):
+    t = first(f"ruangan 4x5 {unit}", DIM)
+    assert (t.value, t.value2, t.unit) == (400.0, 500.0, "m")
+
+
+@pytest.mark.parametrize("text, value, unit", [
+    ("tinggi 45 cm", 45.0, "cm"),
+    ("tinggi 450 mm", 45.0, "mm"),
+    ("tinggi 2 meters", 200.0, "m"),
+    ("tinggi 45", 45.0, None),
+])
+def test_number_units(text, value, unit):
+    t = first(text, NUMBER)
+    assert (t.value, t.unit) == (value, unit)
+
+
+def test_unit_needs_word_boundary():
+    # "40 meja" bukan 40 meter
+    t = first("40 meja", NUMBER)
+    assert (t.value, t.unit) == (40.0, None)
+
+
+def test_keywords_directions_and_filler():
+    tokens = list(tokenize("ruangan dengan 2 pintu di sisi barat, rakit kayu"))
+    assert [(t.kind, t.value) for t in tokens] == [
+        (WORD, "ruangan"), (NUMBER, 2.0), (WORD, "pintu"), (DIRECTION, "west")]
+
+
+def test_helpers():
+    tokens = tokenize("kursi dudukan 45x50 tinggi 80 dengan 3 kaki")
+    assert tokens.number_after("tinggi") == 80.0
+    assert tokens.number_before("kaki") == 3.0
+    dim = tokens.find_after("dudukan", (DIM,))
+    assert (dim.value, dim.value2) == (45.0, 50.0)
+
+
+def test_room_in_meters():
+    converter = TextToCADConverter()
+    converter.parse("ruangan 4x5 meters")
+    room = converter.items[0]
+    assert (room.props["width"], room.props["depth"]) == (400.0, 500.0)